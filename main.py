@@ -150,17 +150,57 @@ def cmd_run(args):
     keep_open = getattr(args, 'keep_open', False)
     until_test = getattr(args, 'until_test', None)
     debug_test = getattr(args, 'debug_test', None)
+    workers = getattr(args, 'workers', None)
+    engine = getattr(args, 'engine', None) or config.get("execution", {}).get("engine", "sync")
+    resume_run_id = getattr(args, 'resume', None)
+    from_test = getattr(args, 'from_test', None)
+    if getattr(args, 'profile', False):
+        config.setdefault("execution", {})["profile"] = True
+    if getattr(args, 'sleep_report', False):
+        config.setdefault("execution", {})["sleep_report"] = True
+    if getattr(args, 'video', None):
+        browser_config = config.setdefault("browser", {})
+        video_config = browser_config.get("video")
+        browser_config["video"] = {**(video_config if isinstance(video_config, dict) else {}), "mode": args.video}
+    interactive = bool(keep_open or until_test or debug_test)
+    resuming = bool(resume_run_id or from_test)
+    # Continuous mode keeps one in-process browser warm, so it always uses the sync engine
+    continuous = (
+        (getattr(args, 'continuous', False) or config.get("execution", {}).get("continuous", False))
+        and not interactive
+        and not resuming
+    )
+    # The async engine runs whole categories only; interactive, resumed and single-category runs stay sync
+    use_async = (
+        engine == "async"
+        and not args.category
+        and not interactive
+        and not continuous
+        and not resuming
+    )
     
     try:
         # Create runner
-        runner = TestRunner(
-            tests_root,
-            headless=headless,
-            keep_open=keep_open,
-            until_test=until_test,
-            debug_test=debug_test,
-            config=config,
-        )
+        if use_async:
+            from src.runner.async_runner import AsyncTestRunner
+            runner = AsyncTestRunner(
+                tests_root,
+                headless=headless,
+                config=config,
+                max_concurrency=workers,
+            )
+        else:
+            runner = TestRunner(
+                tests_root,
+                headless=headless,
+                keep_open=keep_open,
+                until_test=until_test,
+                debug_test=debug_test,
+                config=config,
+                workers=workers,
+                resume_run_id=resume_run_id,
+                from_test=from_test,
+            )
         
         # Attach CLI reporter for real-time output
         reporter = CLIReporter(runner.events)
@@ -171,6 +211,54 @@ def cmd_run(args):
         if selection and args.category:
             console.print("[red]Error: --selection and --category cannot be used together. Use --selection for multiple categories/subcategories, or --category for a single category.[/red]")
             sys.exit(1)
+        if resuming and not selection and not args.category:
+            # Continue the categories that have checkpoints in the run
+            run_id = resume_run_id or runner.checkpoints.latest_run_id()
+            selection = runner.checkpoints.run_categories(run_id) if run_id else []
+            if not selection:
+                console.print(f"[red]Error: no checkpoints found{' for run ' + run_id if run_id else ''} in {runner.checkpoints.checkpoint_dir}.[/red]")
+                sys.exit(1)
+        shard = getattr(args, 'shard', None)
+        if shard:
+            # This machine runs only its share of the categories (or selection paths)
+            if args.category or continuous:
+                console.print("[red]Error: --shard works with a full run or --selection, not with --category or --continuous.[/red]")
+                sys.exit(1)
+            from src.runner.sharding import build_shard_plan, parse_shard
+            try:
+                shard_index, shard_total = parse_shard(shard)
+            except ValueError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                sys.exit(1)
+            plans, durations = build_shard_plan(getattr(runner, "runner", runner), shard_total, selection=selection)
+            selection = plans[shard_index - 1]
+            for i, paths in enumerate(plans, start=1):
+                minutes = sum(durations[p] for p in paths) / 60000
+                marker = "[bold]>[/bold]" if i == shard_index else " "
+                console.print(f"{marker} Shard {i}/{shard_total} (~{minutes:.1f} min): {', '.join(paths) or '-'}")
+            if not selection:
+                console.print(f"[yellow]Shard {shard_index}/{shard_total} has no categories to run.[/yellow]")
+                return
+            runner.storage.run_metadata["shard"] = {
+                "index": shard_index,
+                "total": shard_total,
+                "categories": selection,
+                "estimated_ms": sum(durations[p] for p in selection),
+            }
+        if continuous:
+            # Daemon: monitor the selection / category (default: all categories) until stopped
+            from src.runner.daemon import ContinuousRunner
+            if args.category:
+                subcategory = getattr(args, 'subcategory', None)
+                selection = [f"{args.category}/{subcategory}" if subcategory else args.category]
+            daemon = ContinuousRunner.from_config(
+                runner,
+                config,
+                selection=selection,
+                on_iteration=reporter.print_summary,
+            )
+            daemon.run()
+            return
         if selection:
             # Run selected categories/subcategories
             result = runner.run_all(selection=selection)
@@ -195,6 +283,13 @@ def cmd_run(args):
                 category_results=[result],
             )
             reporter.print_summary(run_result)
+        report_path = runner.storage.profile_report_path
+        if report_path and report_path.exists():
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+            if config.get("execution", {}).get("profile"):
+                reporter.print_profile(report, report_path)
+            if config.get("execution", {}).get("sleep_report"):
+                reporter.print_sleep_report(report, report_path)
         
         # Exit with appropriate code
         if result.total_failed > 0 if hasattr(result, 'total_failed') else result.failed > 0:
@@ -207,6 +302,121 @@ def cmd_run(args):
         sys.exit(1)
 
 
+def cmd_merge_shards(args):
+    """Combine the runs_index files of shard runs into one run record."""
+    config = load_config()
+    tests_root = Path(__file__).parent / config.get("tests", {}).get("root_path", "tests")
+    index_dir = tests_root.parent / "runs_index"
+    
+    from src.runner.sharding import merge_shard_indexes
+    # Accept run ids as well as paths to runs_index files
+    index_files = [
+        Path(item) if item.endswith(".json") else index_dir / f"{item}.json"
+        for item in args.runs
+    ]
+    missing = [str(p) for p in index_files if not p.exists()]
+    if missing:
+        console.print(f"[red]Error: runs_index file(s) not found: {', '.join(missing)}[/red]")
+        sys.exit(1)
+    try:
+        merged_path = merge_shard_indexes(index_files, tests_root, run_id=args.run_id)
+    except (ValueError, OSError, json.JSONDecodeError) as e:
+        console.print(f"[red]Error merging shards: {e}[/red]")
+        sys.exit(1)
+    
+    merged = json.loads(merged_path.read_text(encoding="utf-8"))
+    # The merged run dirs and index file were written outside RunStorage
+    from src.runner.storage import RunStorage
+    RunStorage(tests_root).history.rebuild(tests_root, index_dir, run_ids=[merged["run_id"]])
+    summary = merged["summary"]
+    console.print(
+        f"[green]Merged {len(index_files)} shard run(s) into {merged['run_id']}[/green]: "
+        f"{summary['passed']} passed, {summary['failed']} failed, {summary['skipped']} skipped "
+        f"({merged['status']})"
+    )
+    console.print(f"[dim]{merged_path}[/dim]")
+    if summary["failed"] > 0:
+        sys.exit(1)
+
+
+def cmd_rebuild_index(args):
+    """Rebuild the run history index (runs_index/history.sqlite) from the JSON files in _runs/ and runs_index/."""
+    import time
+    from src.runner.storage import RunStorage
+
+    config = load_config()
+    tests_root = Path(__file__).parent / config.get("tests", {}).get("root_path", "tests")
+    storage = RunStorage(tests_root)
+    started = time.time()
+    counts = storage.history.rebuild(tests_root, storage.index_dir)
+    console.print(
+        f"[green]Indexed {counts['runs']} run(s), {counts['category_runs']} category run(s) and "
+        f"{counts['test_results']} test result(s)[/green] in {time.time() - started:.1f}s"
+    )
+    console.print(f"[dim]{storage.history.path}[/dim]")
+
+
+def cmd_data_pool(args):
+    """Show or refill the pool of pre-provisioned test data (clients, services, group events)."""
+    import time
+    from src.runner.data_pool import DataPool
+    from src.runner.session_cache import SessionCache
+
+    config = load_config()
+    pool = DataPool.from_config(config)
+    if not pool.enabled:
+        console.print("[yellow]data_pool.enabled is false in config.yaml; setups create their data inline.[/yellow]")
+
+    def print_counts():
+        table = Table(title="Data Pool")
+        table.add_column("Kind", style="bold")
+        table.add_column("Ready", justify="right", style="green")
+        table.add_column("Leased", justify="right", style="cyan")
+        table.add_column("Dirty", justify="right", style="yellow")
+        table.add_column("Target", justify="right")
+        for kind, counts in pool.counts().items():
+            table.add_row(
+                kind, str(counts.get("ready", 0)), str(counts.get("leased", 0)),
+                str(counts.get("dirty", 0)), str(pool.targets.get(kind, 0)),
+            )
+        console.print(table)
+
+    if args.action == "status":
+        print_counts()
+        return
+
+    # fill: needs a logged-in session (saved by any run whose setup logged in)
+    target = config.get("target") or {}
+    base_url = target.get("base_url")
+    username = (target.get("auth") or {}).get("username")
+    storage_state = SessionCache.from_config(config).load(base_url, username)
+    if not storage_state:
+        console.print("[red]Error: no cached login session for the target account. "
+                      "Run any category once (its setup logs in) and retry.[/red]")
+        sys.exit(1)
+
+    from playwright.sync_api import sync_playwright
+    from tests._functions._pool import fill_pool
+
+    with sync_playwright() as p:
+        request = p.request.new_context(base_url=base_url, storage_state=storage_state)
+        try:
+            while True:
+                stats = fill_pool(request, pool, base_url, log=console.print)
+                console.print(
+                    f"[green]Pool filled[/green]: {stats['created']} created, {stats['deleted']} deleted, "
+                    f"{stats['reclaimed']} expired lease(s) reclaimed, {stats['failed']} failed"
+                )
+                if not args.watch:
+                    break
+                time.sleep(args.watch)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            request.dispose()
+    print_counts()
+
+
 def cmd_explore(args):
     """Explore and generate test."""
     console.print(f"[bold blue]Exploring: {args.test_path}[/bold blue]")
@@ -583,6 +793,84 @@ def main():
         nargs="+",
         help="Run only the selected category/subcategory paths (e.g., 'clients scheduling/events'). Each path can be a category (e.g., 'clients') or a subcategory path (e.g., 'scheduling/events'). Mutually exclusive with --category."
     )
+    run_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=None,
+        help="Run up to N categories (or --selection paths) at the same time, each in its own process and browser (default: execution.parallel_tests from config.yaml)"
+    )
+    run_parser.add_argument(
+        "--continuous",
+        action="store_true",
+        help="Keep running: re-run categories every execution.delay_between_runs seconds "
+             "(or execution.category_intervals) with a warm browser and session, until Ctrl+C"
+    )
+    run_parser.add_argument(
+        "--engine",
+        choices=["sync", "async"],
+        default=None,
+        help="Execution engine for run-all/--selection: 'async' runs categories concurrently in one asyncio event loop; "
+             "--workers then sets the concurrency (default: execution.engine from config.yaml)"
+    )
+    run_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue a run from its latest checkpoint (written after each passing test): restores context, "
+             "cookies and URL, skips tests that already passed. Without --category/--selection, resumes every "
+             "category checkpointed in that run."
+    )
+    run_parser.add_argument(
+        "--from-test",
+        dest="from_test",
+        default=None,
+        help="Start at this test from the checkpoint taken just before it (in --resume RUN_ID, or the latest run "
+             "with checkpoints), without replaying setup or earlier tests. E.g. 'Events/Schedule Event'."
+    )
+    run_parser.add_argument(
+        "--shard",
+        default=None,
+        help="Run only shard i of N (e.g. '2/4'): categories (or --selection paths) are split across N machines, "
+             "balanced by their durations in earlier runs. Combine the results with merge_shards."
+    )
+    run_parser.add_argument(
+        "--video",
+        default=None,
+        choices=["off", "on", "retain-on-failure", "first-retry-only"],
+        help="Which category videos to record and keep: off, on (all), retain-on-failure (categories with a failure), "
+             "first-retry-only (categories where a test was retried) (default: browser.video.mode from config.yaml)"
+    )
+    run_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time every Playwright call (goto, click, fill, wait_for, ...) per test and source line: "
+             "adds metrics to result.json and writes the slowest calls to runs_index/profiles/<run_id>.json "
+             "(default: execution.profile from config.yaml)"
+    )
+    run_parser.add_argument(
+        "--sleep-report",
+        dest="sleep_report",
+        action="store_true",
+        help="Report how much of the run is spent in fixed page.wait_for_timeout() sleeps, per source line "
+             "(default: execution.sleep_report from config.yaml)"
+    )
+    
+    # Merge shards command - combine shard runs into one run record
+    merge_shards_parser = subparsers.add_parser("merge_shards", help="Combine the runs_index files of 'run --shard' runs into one run")
+    merge_shards_parser.add_argument(
+        "runs",
+        nargs="+",
+        help="Shard run ids or paths to their runs_index/<run_id>.json files (copied from the shard machines)"
+    )
+    merge_shards_parser.add_argument(
+        "--run-id",
+        dest="run_id",
+        default=None,
+        help="Run id of the merged run (default: start time of the earliest shard)"
+    )
+    
+    # Rebuild index command - backfill the SQLite run history index from the JSON run files
+    subparsers.add_parser("rebuild_index", help="Rebuild the run history index (runs_index/history.sqlite) from _runs/ and runs_index/")
     
     # Explore command - explore and generate tests
     explore_parser = subparsers.add_parser("explore", help="Explore and generate test from steps.md")
@@ -638,6 +926,11 @@ def main():
     create_user_parser.add_argument("--address", default=None, help="Business address in Welcome dialog (default: 123 Test Street)")
     create_user_parser.add_argument("--base-url", dest="base_url", default=None, help="Base URL (default: from config; login URL = base_url + '/login')")
 
+    # Data pool command - pre-provisioned clients/services leased to category setups
+    data_pool_parser = subparsers.add_parser("data_pool", help="Show or refill the pool of pre-provisioned test data")
+    data_pool_parser.add_argument("action", choices=["status", "fill"], help="status: pool counts; fill: recycle dirty entities and top up to the targets")
+    data_pool_parser.add_argument("--watch", type=int, default=0, metavar="SECONDS", help="With fill: keep refilling every SECONDS (background provisioner)")
+
     # Stress test command - run categories multiple times
     groom_parser = subparsers.add_parser("groom_heal_requests", help="Groom heal requests: update statuses and clean up old ones")
     
@@ -681,6 +974,9 @@ def main():
         "create_user": cmd_create_user,
         "stress_test": cmd_stress_test,
         "groom_heal_requests": cmd_groom_heal_requests,
+        "merge_shards": cmd_merge_shards,
+        "rebuild_index": cmd_rebuild_index,
+        "data_pool": cmd_data_pool,
     }
     
     if args.command in commands:
@@ -83,6 +83,8 @@ class TestDiscovery:
         # execution_order must be a list (avoid string or other type from YAML)
         raw_order = yaml_data.get("execution_order")
         execution_order = raw_order if isinstance(raw_order, list) and len(raw_order) > 0 else None
+        raw_allowlist = yaml_data.get("resource_allowlist")
+        resource_allowlist = [str(a) for a in raw_allowlist] if isinstance(raw_allowlist, list) else None
 
         # Create category
         category = Category(
@@ -94,6 +96,7 @@ class TestDiscovery:
             teardown=teardown,
             execution_order=execution_order,
             run_after=yaml_data.get("run_after"),  # Deprecated; used only when execution_order is not set
+            resource_allowlist=resource_allowlist,
         )
         
         # Build test metadata lookup from YAML
@@ -26,6 +26,7 @@ from src.discovery import TestDiscovery
 from src.runner import TestRunner
 from src.runner.runner import build_execution_plan
 from src.runner.events import RunnerEvent
+from src.runner.screenshots import MEDIA_TYPES, ensure_thumbnail, find_screenshot
 from src.runner.storage import RunStorage
 
 
@@ -60,6 +61,8 @@ def create_app(tests_root: Path, snapshots_dir: Path, heal_requests_dir: Path) -
     app.state.project_root = tests_root.parent
     app.state.snapshots_dir = snapshots_dir
     app.state.heal_requests_dir = heal_requests_dir
+    # Kept for the app's lifetime so its in-memory history caches (last results) persist
+    app.state.history_storage = RunStorage(tests_root)
     
     # Mount static files
     static_dir = Path(__file__).parent / "static"
@@ -360,11 +363,13 @@ def create_app(tests_root: Path, snapshots_dir: Path, heal_requests_dir: Path) -
                     continue
                 
                 for test_dir in tests_dir.iterdir():
-                    screenshot = test_dir / "screenshot.png"
-                    if screenshot.exists():
+                    screenshot = find_screenshot(test_dir)
+                    if screenshot is not None:
+                        url = f"/api/runs/{category_dir.name}/{run_dir.name}/tests/{test_dir.name}/screenshot"
                         screenshots.append({
                             "filename": screenshot.name,
-                            "url": f"/api/runs/{category_dir.name}/{run_dir.name}/tests/{test_dir.name}/screenshot",
+                            "url": url,
+                            "thumbnail_url": f"{url}/thumbnail",
                             "category": category_dir.name,
                             "run_id": run_dir.name,
                             "test_name": test_dir.name,
@@ -420,47 +425,9 @@ def create_app(tests_root: Path, snapshots_dir: Path, heal_requests_dir: Path) -
         """
         Get the last run result (passed/failed/skipped) for each test.
         Keys are path identifiers matching the tree: category_id/test_id or category_id/subcat_id/test_id or category_id/_setup.
+        Served from the history index's latest_results table, cached in memory between runs.
         """
-        storage = RunStorage(app.state.tests_root)
-        raw = storage.get_all_last_results()
-        discovery = TestDiscovery(app.state.tests_root)
-        categories = discovery.scan()
-        # Build (category_path, test_name) -> path_key so we can map storage entries to frontend keys
-        name_to_key: Dict[tuple, str] = {}
-        for cat in categories:
-            cat_id = cat.path.name if cat.path else cat.name.lower().replace(" ", "_")
-            try:
-                cat_path_str = str(cat.path.relative_to(app.state.tests_root)).replace("\\", "/")
-            except (ValueError, AttributeError):
-                cat_path_str = cat_id
-            if cat.setup is not None:
-                name_to_key[(cat_path_str, "_setup")] = f"{cat_id}/_setup"
-            if cat.teardown is not None:
-                name_to_key[(cat_path_str, "_teardown")] = f"{cat_id}/_teardown"
-            for test in cat.tests or []:
-                test_name = getattr(test, "name", None) or (test.path.name if test.path else "")
-                name_to_key[(cat_path_str, test_name)] = f"{cat_id}/{test.path.name}" if test.path else f"{cat_id}/{getattr(test, 'id', test_name)}"
-            for subcat in cat.subcategories or []:
-                subcat_id = subcat.path.name if subcat.path else subcat.name.lower().replace(" ", "_")
-                subcat_path_str = f"{cat_path_str}/{subcat_id}"
-                if subcat.setup is not None:
-                    name_to_key[(subcat_path_str, "_setup")] = f"{cat_id}/{subcat_id}/_setup"
-                    name_to_key[(subcat_path_str, f"{subcat.name}/_setup")] = f"{cat_id}/{subcat_id}/_setup"
-                if subcat.teardown is not None:
-                    name_to_key[(subcat_path_str, "_teardown")] = f"{cat_id}/{subcat_id}/_teardown"
-                    name_to_key[(subcat_path_str, f"{subcat.name}/_teardown")] = f"{cat_id}/{subcat_id}/_teardown"
-                for test in subcat.tests or []:
-                    test_name = getattr(test, "name", None) or (test.path.name if test.path else "")
-                    path_key = f"{cat_id}/{subcat_id}/{test.path.name}" if test.path else f"{cat_id}/{subcat_id}/{getattr(test, 'id', test_name)}"
-                    name_to_key[(subcat_path_str, test_name)] = path_key
-                    name_to_key[(subcat_path_str, f"{subcat.name}/{test_name}")] = path_key
-        result_map: Dict[str, str] = {}
-        for item in raw:
-            key = (item["category_path"], item["test_name"])
-            path_key = name_to_key.get(key)
-            if path_key and path_key not in result_map:
-                result_map[path_key] = item["status"]
-        return {"last_results": result_map}
+        return {"last_results": app.state.history_storage.get_latest_results()}
     
     @app.get("/api/active-run")
     async def get_active_run():
@@ -582,15 +549,43 @@ def create_app(tests_root: Path, snapshots_dir: Path, heal_requests_dir: Path) -
     @app.get("/api/runs/{category}/{run_id}/tests/{test_name}/screenshot")
     async def get_test_screenshot(category: str, run_id: str, test_name: str):
         """Get the screenshot for a specific test in a run."""
-        screenshot_path = app.state.tests_root / category / "_runs" / run_id / "tests" / test_name / "screenshot.png"
+        screenshot_path = find_screenshot(app.state.tests_root / category / "_runs" / run_id / "tests" / test_name)
         
-        if not screenshot_path.exists():
+        if screenshot_path is None:
             raise HTTPException(status_code=404, detail=f"Screenshot not found: {category}/{run_id}/{test_name}")
         
         return FileResponse(
             screenshot_path,
-            media_type="image/png",
-            filename=f"{test_name}_screenshot.png"
+            media_type=MEDIA_TYPES[screenshot_path.suffix],
+            filename=f"{test_name}_{screenshot_path.name}"
+        )
+    
+    @app.get("/api/runs/{category}/{run_id}/tests/{test_name}/screenshot/thumbnail")
+    def get_test_screenshot_thumbnail(category: str, run_id: str, test_name: str):
+        """Get a small JPEG of a test's screenshot (built on first request for older runs)."""
+        test_dir = app.state.tests_root / category / "_runs" / run_id / "tests" / test_name
+        try:
+            thumbnail_path = ensure_thumbnail(test_dir)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Could not build thumbnail: {e}")
+        
+        if thumbnail_path is None:
+            raise HTTPException(status_code=404, detail=f"Screenshot not found: {category}/{run_id}/{test_name}")
+        
+        return FileResponse(thumbnail_path, media_type="image/jpeg")
+    
+    @app.get("/api/runs/{category}/{run_id}/tests/{test_name}/trace")
+    async def get_test_trace(category: str, run_id: str, test_name: str):
+        """Get the Playwright trace of a failed test in a run (open with playwright show-trace)."""
+        trace_path = app.state.tests_root / category / "_runs" / run_id / "tests" / test_name / "trace.zip"
+        
+        if not trace_path.exists():
+            raise HTTPException(status_code=404, detail=f"Trace not found: {category}/{run_id}/{test_name}")
+        
+        return FileResponse(
+            trace_path,
+            media_type="application/zip",
+            filename=f"{test_name}_trace.zip"
         )
     
     @app.get("/api/runs/{category}/{run_id}/tests/{test_name}/heal_request")
@@ -730,7 +730,7 @@ function renderScreenshots(screenshots) {
         html += `
             <div class="artifact-item" onclick="showScreenshot('${screenshot.url}')">
                 <div class="artifact-thumb">
-                    <img src="${screenshot.url}" alt="${screenshot.filename}" loading="lazy">
+                    <img src="${screenshot.thumbnail_url || screenshot.url}" alt="${screenshot.filename}" loading="lazy">
                 </div>
                 <div class="artifact-info">
                     <div class="artifact-name">${screenshot.filename}</div>
@@ -1112,7 +1112,17 @@ function renderRunDetails(details, category, runId) {
                 const screenshotUrl = `/api/runs/${encodeURIComponent(category)}/${encodeURIComponent(runId)}/tests/${encodeURIComponent(testName)}/screenshot`;
                 html += `
                     <div class="test-result-artifacts">
-                        <img src="${screenshotUrl}" alt="Screenshot" class="test-result-screenshot" onclick="showScreenshot('${screenshotUrl}')">
+                        <img src="${screenshotUrl}/thumbnail" alt="Screenshot" class="test-result-screenshot" loading="lazy" onclick="showScreenshot('${screenshotUrl}')">
+                    </div>
+                `;
+            }
+            
+            // Add trace download if available (open with: playwright show-trace <file>)
+            if (artifacts.trace) {
+                const traceUrl = `/api/runs/${encodeURIComponent(category)}/${encodeURIComponent(runId)}/tests/${encodeURIComponent(testName)}/trace`;
+                html += `
+                    <div class="test-result-artifacts">
+                        <a class="btn btn-secondary" href="${traceUrl}" download title="Open with: playwright show-trace">Download Trace</a>
                     </div>
                 `;
             }
@@ -158,6 +158,10 @@ class Category:
     # Deprecated: subcategory-only ordering. Use execution_order in parent instead.
     run_after: Optional[str] = None
     
+    # Resource groups (analytics, chat, tracking, fonts, images) or URL regexes the runner
+    # must not block for this category (resource_allowlist in _category.yaml)
+    resource_allowlist: Optional[list[str]] = None
+    
     @property
     def full_path(self) -> str:
         """Return full category path as string."""
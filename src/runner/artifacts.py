@@ -0,0 +1,156 @@
+"""
+Background writer for run artifacts.
+
+Saving a failed test used to happen on the runner thread between two tests: the screenshot
+was written to .temp_screenshots/ and copied into the run dir, result.json was written up to
+three times, the heal request was written and then copied, and the end of a category polled
+up to 3 s for the video before moving it. RunStorage now hands that I/O to an
+ArtifactWriter: the runner passes bytes and final paths, each artifact is written once to
+its final location on a small thread pool, and storage.finalize_run flushes the writer
+before the runs_index entry is written.
+
+The pending queue is bounded: when max_pending writes are outstanding, the next submit
+blocks until one finishes, so a slow disk slows the run down instead of buffering
+screenshots in memory without limit.
+"""
+
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Optional, Set
+
+
+class ArtifactWriter:
+    """
+    Thread pool that writes artifacts off the runner thread.
+
+    Usage:
+        writer = ArtifactWriter()
+        writer.write_bytes(test_dir / "screenshot.png", png_bytes)
+        writer.move(temp_trace, test_dir / "trace.zip")
+        ...
+        writer.flush()   # before reading the artifacts back (finalize_run)
+    """
+
+    DEFAULT_WORKERS = 2
+    DEFAULT_MAX_PENDING = 32
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            max_workers: Writer threads
+            max_pending: Outstanding writes before submit blocks
+            enabled: When False, every write runs inline on the caller's thread
+        """
+        self.max_workers = max(1, max_workers)
+        self.enabled = enabled
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._errors = 0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="artifacts")
+            return self._pool
+
+    def _run(self, description: str, fn: Callable[..., Any], *args: Any) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            print(f"  [Artifacts] Could not {description}: {type(e).__name__}: {e}")
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def submit(self, description: str, fn: Callable[..., Any], *args: Any) -> None:
+        """
+        Run fn(*args) on a writer thread (blocks while max_pending writes are outstanding).
+
+        Args:
+            description: What fn does, for the error message (e.g. "write result.json")
+            fn: The I/O to run; exceptions are printed and counted, not raised
+        """
+        if not self.enabled:
+            self._run(description, fn, *args)
+            return
+        self._slots.acquire()
+        try:
+            future = self._executor().submit(self._run, description, fn, *args)
+        except RuntimeError:
+            # Interpreter shutting down: no new threads, write inline
+            self._slots.release()
+            self._run(description, fn, *args)
+            return
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Write data to path (parent dirs are created)."""
+        self.submit(f"write {path.name}", write_file, Path(path), data)
+
+    def write_text(self, path: Path, text: str) -> None:
+        """Write UTF-8 text to path (parent dirs are created)."""
+        self.submit(f"write {path.name}", write_file, Path(path), text.encode("utf-8"))
+
+    def move(self, source: Path, dest: Path) -> None:
+        """Move source to dest (parent dirs are created)."""
+        self.submit(f"move {Path(source).name}", move_file, Path(source), Path(dest))
+
+    def copy(self, source: Path, dest: Path) -> None:
+        """Copy source to dest (parent dirs are created)."""
+        self.submit(f"copy {Path(source).name}", copy_file, Path(source), Path(dest))
+
+    def remove(self, path: Path) -> None:
+        """Delete a file if it exists."""
+        self.submit(f"delete {Path(path).name}", lambda p: p.unlink(missing_ok=True), Path(path))
+
+    def flush(self) -> int:
+        """
+        Wait for every submitted write to finish.
+
+        Returns:
+            Number of writes that failed since the last flush
+        """
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            wait(pending)
+        with self._lock:
+            errors, self._errors = self._errors, 0
+        return errors
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write data to path, creating parent dirs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def move_file(source: Path, dest: Path) -> None:
+    """Move source to dest, creating parent dirs."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(source), str(dest))
+
+
+def copy_file(source: Path, dest: Path) -> None:
+    """Copy source to dest, creating parent dirs."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, dest)
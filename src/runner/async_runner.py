@@ -0,0 +1,824 @@
+"""
+Asyncio execution engine for the test runner.
+
+The sync TestRunner drives one page per Python thread, so running many categories at once
+needs one process per category (see parallel.py). AsyncTestRunner runs run_all units as
+coroutines in one event loop on a single async Playwright browser, with a fresh
+BrowserContext per unit, so dozens of sessions can share one host.
+
+Test modules opt in by declaring their functions with `async def` (they receive an async
+Page). Units that contain any sync test (the existing fn_* / test_* modules) keep working
+unchanged: they run in a worker thread with their own sync TestRunner and driver, joined
+to the same run_id, and their events are forwarded to this runner's EventEmitter.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from src.models import Category, Test
+
+from .browser import LAUNCH_OPTIONS, STEALTH_INIT_SCRIPT, default_context_options
+from .context import ContextManager
+from .dependency_graph import group_independent_tests
+from .events import RunnerEvent
+from .failure_propagation import FailurePropagation
+from .executor import TestExecutor
+from .models import CategoryResult, RunResult, TestResult
+from .routing import ResourceBlocker, category_allowlist
+from .runner import TestRunner, build_execution_plan
+from .tracing import TraceRecorder
+
+
+class AsyncBrowserManager:
+    """
+    Async counterpart of BrowserManager: one driver and one Browser shared by all units
+    running in the event loop, relaunched if it disconnects.
+    """
+
+    def __init__(self, headless: bool = False):
+        """
+        Initialize the manager (nothing is launched until the first context is requested).
+
+        Args:
+            headless: Whether to run the browser in headless mode
+        """
+        self.headless = headless
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> Browser:
+        """Start the driver and browser if needed and return the browser."""
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    print("  [Browser] Browser disconnected - relaunching")
+                    await self._close_browser()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless, **LAUNCH_OPTIONS)
+            return self._browser
+
+    async def new_context(self, video_dir: Optional[Path] = None, **options: Any) -> BrowserContext:
+        """Create a fresh, isolated BrowserContext on the shared browser."""
+        context_options = default_context_options(video_dir, **options)
+        try:
+            browser_context = await (await self.start()).new_context(**context_options)
+        except Exception as e:
+            print(f"  [Browser] new_context failed ({type(e).__name__}: {e}) - relaunching")
+            await self._close_browser()
+            browser_context = await (await self.start()).new_context(**context_options)
+        await browser_context.add_init_script(STEALTH_INIT_SCRIPT)
+        return browser_context
+
+    async def close(self) -> None:
+        """Close the browser and stop the driver."""
+        await self._close_browser()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def _close_browser(self) -> None:
+        """Close the browser, ignoring errors from an already-dead process."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+
+class AsyncTestExecutor(TestExecutor):
+    """TestExecutor that awaits `async def` test functions with an async Page."""
+
+    def is_async_test(self, test_path: Path, test_type: Literal["test", "setup", "teardown"]) -> bool:
+        """True if test_path/test.py defines its test function with `async def`."""
+        if not (test_path / "test.py").exists():
+            return True  # Missing files are skipped the same way by both engines
+        func, _ = self._resolve(test_path, test_type)
+        return func is not None and inspect.iscoroutinefunction(func)
+
+    async def execute_async(
+        self,
+        test_path: Path,
+        test_type: Literal["test", "setup", "teardown"],
+        page: Page,
+        context: Dict[str, Any],
+    ) -> TestResult:
+        """
+        Execute an async test file.
+
+        Args:
+            test_path: Path to the test folder (containing test.py)
+            test_type: Type of test (test, setup, teardown)
+            page: Async Playwright page object
+            context: Shared context dictionary
+
+        Returns:
+            TestResult with pass/fail status and details
+        """
+        func, early_result = self._resolve(test_path, test_type)
+        if early_result is not None:
+            return early_result
+
+        profile_token = self.profiler.begin() if self.profiler else None
+        start_time = time.time()
+        try:
+            await func(self._test_page(page), context)
+            duration_ms = int((time.time() - start_time) * 1000)
+            result = self._passed_result(test_path, test_type, duration_ms)
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+            screenshot = None
+            if not self._is_skip(e):
+                screenshot = await self._capture_screenshot_async(page)
+            result = self._exception_result(test_path, test_type, e, duration_ms, screenshot, context)
+        return self._with_metrics(result, profile_token)
+
+    async def _capture_screenshot_async(self, page: Page) -> Optional[bytes]:
+        """Capture a screenshot on test failure (async page); PNG bytes or None."""
+        try:
+            data = await page.screenshot()
+            print(f"  [Screenshot] Captured ({len(data)} bytes)")
+            return data
+        except Exception as e:
+            print(f"  [Screenshot] FAILED to capture: {type(e).__name__}: {e}")
+            return None
+
+
+@dataclass
+class _NativeUnit:
+    """State of one unit running natively in the event loop (one BrowserContext)."""
+    root: Category
+    page: Page
+    context: Dict[str, Any]
+    result: CategoryResult
+    propagation: FailurePropagation
+    blocker: Optional[ResourceBlocker] = None
+    traces: Optional[TraceRecorder] = None
+    saved_subcategory_paths: List[str] = field(default_factory=list)
+    session_saved: bool = False
+
+
+class AsyncTestRunner:
+    """
+    Runs run_all units concurrently in one asyncio event loop.
+
+    Usage:
+        runner = AsyncTestRunner(tests_root, headless=True, config=config)
+        reporter = CLIReporter(runner.events)
+        result = runner.run_all()
+
+    Storage, events, heal requests and the session cache are shared with an inner sync
+    TestRunner, so runs look exactly like sync runs in runs_index, the GUI and the CLI.
+    Interactive modes (--keep-open, --until-test, --debug-test) are sync-engine only.
+    """
+
+    DEFAULT_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        tests_root: Path,
+        headless: bool = False,
+        snapshots_dir: Optional[Path] = None,
+        record_video: bool = True,
+        config: Optional[dict] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize the async runner.
+
+        Args:
+            tests_root: Path to the tests/ directory
+            headless: Whether to run browser in headless mode
+            snapshots_dir: Directory for screenshots (default: snapshots/)
+            record_video: Whether to record video of test execution (default: True)
+            config: Full config dict (e.g. from config.yaml)
+            max_concurrency: Units running at the same time.
+                             Defaults to execution.async_concurrency from config.
+        """
+        self.runner = TestRunner(
+            tests_root,
+            headless=headless,
+            snapshots_dir=snapshots_dir,
+            record_video=record_video,
+            config=config,
+            workers=1,
+        )
+        self.tests_root = self.runner.tests_root
+        self.events = self.runner.events
+        self.storage = self.runner.storage
+        if max_concurrency is None:
+            max_concurrency = self.runner.execution_config.get("async_concurrency", self.DEFAULT_CONCURRENCY)
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.executor = AsyncTestExecutor(self.runner.executor.snapshots_dir)
+        self.executor.profiler = self.runner.executor.profiler
+        # Run consecutive tests with no recorded context dependency at the same time (separate pages);
+        # native units only (all tests `async def`), sync units run in a thread as before
+        self.concurrent_independent_tests = bool(
+            self.runner.execution_config.get("concurrent_independent_tests", False)
+        )
+        self.browsers: Optional[AsyncBrowserManager] = None
+
+    def run_all(self, selection: Optional[List[str]] = None) -> RunResult:
+        """
+        Run all categories (or the selected category paths) concurrently.
+
+        Args:
+            selection: Optional list of category paths to run. When None, runs all top-level categories.
+
+        Returns:
+            RunResult with results from all run categories (in unit order)
+        """
+        return asyncio.run(self.run_all_async(selection))
+
+    async def run_all_async(self, selection: Optional[List[str]] = None) -> RunResult:
+        """Coroutine version of run_all (for callers that already own an event loop)."""
+        result = RunResult(started_at=datetime.now())
+        run_config = self.runner.run_config
+        run_id = self.storage.start_run(config={"target": run_config} if run_config else None)
+        units, category_names, total_tests = self.runner._build_units(selection)
+        if self.concurrent_independent_tests and not any(chain and self._unit_is_async(chain) for _, chain, _ in units):
+            print("  [Async] execution.concurrent_independent_tests has no effect on this run: only units whose "
+                  "setups, tests and teardowns are all `async def` run natively and group tests; "
+                  "sync tests run one at a time in a worker thread")
+        workers = min(self.max_concurrency, max(1, len(units)))
+        start_order, makespan_ms = self.runner._schedule_units(units, workers)
+
+        self.events.emit(RunnerEvent.RUN_STARTED, {
+            "categories": category_names,
+            "total_categories": len(units),
+            "total_tests": total_tests,
+            "run_id": run_id,
+            "workers": workers,
+            "estimated_makespan_ms": makespan_ms,
+        })
+
+        self.browsers = AsyncBrowserManager(headless=self.runner.headless)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            # Coroutines take the semaphore in creation order: create them longest first
+            started = await asyncio.gather(*(
+                self._run_unit(
+                    units[index][0], units[index][1], index + 1, len(units), units[index][2], run_id, semaphore
+                )
+                for index in start_order
+            ))
+        finally:
+            await self.browsers.close()
+        category_results = [None] * len(units)
+        for index, category_result in zip(start_order, started):
+            category_results[index] = category_result
+        result.category_results.extend(category_results)
+        result.completed_at = datetime.now()
+
+        self.storage.finalize_run(result)
+        self.events.emit(RunnerEvent.RUN_COMPLETED, {
+            "result": result.to_dict(),
+            "run_id": run_id,
+        })
+        return result
+
+    async def _run_unit(
+        self,
+        path: str,
+        chain: Optional[List[Category]],
+        index: int,
+        total: int,
+        from_selection: bool,
+        run_id: str,
+        semaphore: asyncio.Semaphore,
+    ) -> CategoryResult:
+        """Run one unit natively (all tests async) or in a sync worker thread."""
+        if not chain:
+            return self.runner._run_unit(path, chain, index, total, from_selection)
+        async with semaphore:
+            try:
+                if self._unit_is_async(chain):
+                    category_result = await self._run_native(chain, index, total)
+                else:
+                    category_result = await asyncio.to_thread(
+                        self._run_unit_in_thread, path, chain, index, total, from_selection, run_id,
+                    )
+            except Exception as e:
+                from .parallel import _worker_failure
+                return _worker_failure(path, e)
+        if from_selection:
+            path_for_display = "/".join((c.path.name for c in chain if c.path))
+            if path_for_display:
+                category_result.category_name = path_for_display
+        return category_result
+
+    def _unit_is_async(self, chain: List[Category]) -> bool:
+        """True if every setup, test and teardown the unit would run is an `async def` function."""
+        items: List[Tuple[Path, str]] = []
+
+        def add_category(cat: Category, with_tests: bool) -> None:
+            if cat.setup and cat.setup.is_valid:
+                items.append((self.tests_root / cat.path / "_setup", "setup"))
+            if cat.teardown and cat.teardown.is_valid:
+                items.append((self.tests_root / cat.path / "_teardown", "teardown"))
+            if with_tests:
+                items.extend((t.path, "test") for t in cat.tests)
+
+        for cat in chain[:-1]:
+            add_category(cat, with_tests=False)
+        add_category(chain[-1], with_tests=True)
+        if len(chain) == 1:
+            for subcat in chain[0].subcategories or []:
+                add_category(subcat, with_tests=True)
+        return bool(items) and all(self.executor.is_async_test(p, t) for p, t in items)
+
+    def _run_unit_in_thread(
+        self,
+        path: str,
+        chain: List[Category],
+        index: int,
+        total: int,
+        from_selection: bool,
+        run_id: str,
+    ) -> CategoryResult:
+        """Compatibility path: run a unit of sync tests with its own sync driver in this thread."""
+        runner = TestRunner(
+            self.tests_root,
+            headless=self.runner.headless,
+            snapshots_dir=self.runner.snapshots_dir,
+            record_video=self.runner.record_video,
+            config=self.runner.config,
+            workers=1,
+        )
+        runner.storage.join_run(run_id, config={"target": runner.run_config} if runner.run_config else None)
+        for event in RunnerEvent:
+            runner.events.on(event, lambda data, event=event: self.events.emit(event, data))
+        try:
+            return runner._run_unit(path, chain, index, total, from_selection)
+        finally:
+            runner.browsers.close()
+            runner.storage.flush_artifacts()
+            self.storage.add_categories(runner.storage.current_categories)
+
+    async def _run_native(self, chain: List[Category], index: int, total: int) -> CategoryResult:
+        """Run a unit of async tests on a new BrowserContext of the shared async browser."""
+        root = chain[0]
+        result = CategoryResult(category_name=root.name, category_path=root.path)
+        self.events.emit(RunnerEvent.CATEGORY_STARTED, {
+            "category": root.name,
+            "tests": [t.name for t in root.tests],
+            "index": index,
+            "total": total,
+            "has_setup": root.setup is not None,
+            "has_teardown": root.teardown is not None,
+        })
+
+        context = ContextManager().create_tracked()
+        self.runner._apply_target_to_context(context)
+        self.runner.data_pool.seed(context)
+        context.seal_seeds()
+
+        self.events.emit(RunnerEvent.BROWSER_STARTING, {"category": root.name})
+        video_dir = None
+        if self.runner.record_video:
+            video_dir = Path.cwd() / ".temp_videos"
+            video_dir.mkdir(parents=True, exist_ok=True)
+        context_options = {}
+        session_state = self.runner.session_cache.load(*self.runner._session_account())
+        if session_state:
+            context_options["storage_state"] = session_state
+            print("  [Session] Reusing cached login session")
+        browser_context = await self.browsers.new_context(
+            video_dir=video_dir, video_size=self.runner.video.size, **context_options,
+        )
+        blocker = ResourceBlocker.from_config(self.runner.config, allowlist=category_allowlist(chain))
+        await blocker.install_async(browser_context)
+        traces = TraceRecorder.from_config(self.runner.config)
+        await traces.start_async(browser_context)
+        page = await browser_context.new_page()
+        self.events.emit(RunnerEvent.BROWSER_STARTED, {"category": root.name})
+
+        unit = _NativeUnit(
+            root=root,
+            page=page,
+            context=context,
+            result=result,
+            propagation=self.runner._new_failure_propagation(root),
+            blocker=blocker,
+            traces=traces,
+        )
+        video_path = None
+        try:
+            await self._run_chain(unit, chain)
+        finally:
+            self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": root.name})
+            await browser_context.close()  # Finalizes the video
+            if page.video:
+                try:
+                    video_path = Path(await page.video.path())
+                except Exception:
+                    video_path = None
+        if video_path and not self.runner.video.keep(result):
+            self.storage.artifacts.remove(video_path)
+            print(f"  [Video] Not kept ({self.runner.video.mode}: {self.runner.video.discard_reason()})")
+            video_path = None
+
+        # Storage moves the video and links it into the subcategory run dirs in the background
+        self.storage.save_category_result(
+            category=root.name,
+            result=result,
+            video_path=video_path,
+            video_links=unit.saved_subcategory_paths,
+        )
+
+        self.runner._save_dependency_graph(root, context)
+        self.runner._release_data_pool(context, result)
+
+        self.events.emit(RunnerEvent.CATEGORY_COMPLETED, {
+            "category": root.name,
+            "result": result.to_dict(),
+        })
+        return result
+
+    async def _run_chain(self, unit: _NativeUnit, chain: List[Category]) -> None:
+        """Setups along the chain, then the root plan (or the leaf in path mode), then teardowns."""
+        root, result = unit.root, unit.result
+        set_up: List[Category] = []
+        for depth, cat in enumerate(chain):
+            if not (cat.setup and cat.setup.is_valid):
+                set_up.append(cat)
+                continue
+            test_name = "_setup" if depth == 0 else f"{cat.name}/_setup"
+            category_name = root.name if depth == 0 else "/".join(c.path.name for c in chain[: depth + 1] if c.path)
+            setup_result = await self._run_test(
+                unit, self.tests_root / cat.path / "_setup", test_name, "setup", 0, len(cat.tests), category_name,
+            )
+            if depth == 0:
+                result.setup_result = setup_result
+            else:
+                result.test_results.append(setup_result)
+            if setup_result.status == "failed":
+                result.stopped_early = True
+                if len(chain) == 1:
+                    self.runner._skip_remaining_items(build_execution_plan(root), result, test_name)
+                else:
+                    leaf = chain[-1]
+                    for test in leaf.tests:
+                        result.test_results.append(TestResult(
+                            test_name=f"{leaf.name}/{test.name}",
+                            test_path=test.path,
+                            test_type="test",
+                            status="skipped",
+                            duration_ms=0,
+                            error=f"Skipped due to {test_name} failure",
+                        ))
+                await self._run_teardowns(unit, set_up, chain)
+                return
+            set_up.append(cat)
+
+        if len(chain) == 1:
+            plan = build_execution_plan(root)
+            if self.concurrent_independent_tests:
+                groups = group_independent_tests(plan, unit.propagation.graph)
+            else:
+                groups = [[item] for item in plan]
+            position = 0
+            for group in groups:
+                if isinstance(group[0], Test):
+                    failed_test_name = await self._run_test_group(unit, group, position, len(plan))
+                else:
+                    failed_test_name = await self._run_subcategory(unit, group[0], root)
+                position += len(group)
+                if failed_test_name:
+                    result.stopped_early = True
+                if unit.propagation.blocked_by:
+                    # Cannot tell what the failure affects: skip the rest of the plan
+                    self.runner._skip_remaining_items(plan[position:], result, unit.propagation.blocked_by)
+                    break
+            await self._run_teardowns(unit, [root], chain)
+        else:
+            if await self._run_subcategory(unit, chain[-1], chain[-2], skip_setup=True):
+                result.stopped_early = True
+            await self._run_teardowns(unit, chain[:-1], chain)
+
+    async def _run_test_group(self, unit: _NativeUnit, group: List[Test], position: int, total: int) -> Optional[str]:
+        """
+        Run a test, or tests with no context dependency between them at the same time.
+
+        Tests that need data of an earlier failed test are skipped. Of the others, the first
+        uses the unit's page; the rest get new pages in the same BrowserContext (same
+        session). Results are appended in plan order.
+
+        Returns:
+            Name of the first failed test (plan order), or None
+        """
+        propagation = unit.propagation
+        outcomes: Dict[int, TestResult] = {}
+        runnable: List[Tuple[int, Test]] = []
+        for offset, test in enumerate(group):
+            skip_reason = propagation.blocker(test.name, test.path)
+            if skip_reason:
+                outcomes[offset] = self.runner._skipped_result(test.name, test.path, skip_reason)
+                propagation.skipped(test.name, test.path)
+            else:
+                runnable.append((offset, test))
+
+        async def run_on_new_page(test: Test, index: int) -> TestResult:
+            page = await unit.page.context.new_page()
+            try:
+                return await self._run_test(
+                    unit, test.path, test.name, "test", index, total, unit.root.name, page=page,
+                )
+            finally:
+                await page.close()
+                if page.video:
+                    try:
+                        await page.video.delete()  # Only the unit's main page video is kept
+                    except Exception:
+                        pass
+
+        start_url = unit.page.url
+        if len(runnable) > 1:
+            print(f"    [Concurrent] {', '.join(test.name for _, test in runnable)}")
+        results = await asyncio.gather(*(
+            self._run_test(unit, test.path, test.name, "test", position + offset + 1, total, unit.root.name)
+            if i == 0 else run_on_new_page(test, position + offset + 1)
+            for i, (offset, test) in enumerate(runnable)
+        ))
+        outcomes.update((offset, test_result) for (offset, _), test_result in zip(runnable, results))
+        unit.result.test_results.extend(outcomes[offset] for offset in sorted(outcomes))
+
+        failed = [test for (_, test), test_result in zip(runnable, results) if test_result.status == "failed"]
+        for test in failed:
+            propagation.failed(test.name, test.path)
+        if results and results[0].status == "failed" and not propagation.blocked_by:
+            await self._recover_page_after_failure(unit.page, start_url)
+        return failed[0].name if failed else None
+
+    async def _run_subcategory(
+        self,
+        unit: _NativeUnit,
+        subcategory: Category,
+        parent_category: Category,
+        skip_setup: bool = False,
+    ) -> Optional[str]:
+        """
+        Run a subcategory inline (same page and context), like TestRunner._run_subcategory_inline.
+
+        Returns:
+            Name of the first failed setup/test, or None if the subcategory passed (or was skipped)
+        """
+        result, propagation = unit.result, unit.propagation
+        category_path = (
+            f"{parent_category.path.name}/{subcategory.path.name}"
+            if parent_category.path and subcategory.path
+            else f"{parent_category.name}/{subcategory.name}"
+        )
+        failed_test_name = None
+        setup_failed = False
+
+        if not skip_setup and subcategory.setup and subcategory.setup.is_valid:
+            setup_name, setup_path = f"{subcategory.name}/_setup", self.tests_root / subcategory.path / "_setup"
+            skip_reason = propagation.blocker(setup_name, setup_path)
+            if skip_reason:
+                print(f"\n    >>> Subcategory: {subcategory.name} skipped ({skip_reason})")
+                propagation.skipped(setup_name, setup_path)
+                self.runner._skip_subcategory(subcategory, result, skip_reason, propagation)
+                self.runner._save_subcategory_result(
+                    subcategory, parent_category, result, category_path, saved_paths=unit.saved_subcategory_paths,
+                )
+                return None
+            print(f"\n    >>> Subcategory: {subcategory.name}")
+            setup_result = await self._run_test(
+                unit, setup_path, setup_name, "setup", 0, len(subcategory.tests), category_path,
+            )
+            result.test_results.append(setup_result)
+            if setup_result.status == "failed":
+                failed_test_name = setup_name
+                setup_failed = True
+                # Setup is a barrier: it prepares browser state the tests need
+                self.runner._skip_subcategory(
+                    subcategory, result, f"Skipped due to {setup_name} failure", propagation,
+                )
+        else:
+            print(f"\n    >>> Subcategory: {subcategory.name}")
+
+        for index, test in enumerate([] if setup_failed else subcategory.tests):
+            test_full_name = f"{subcategory.name}/{test.name}"
+            skip_reason = propagation.blocker(test_full_name, test.path)
+            if skip_reason:
+                result.test_results.append(self.runner._skipped_result(test_full_name, test.path, skip_reason))
+                propagation.skipped(test_full_name, test.path)
+                continue
+            start_url = unit.page.url
+            test_result = await self._run_test(
+                unit, test.path, test_full_name, "test", index + 1, len(subcategory.tests), category_path,
+            )
+            result.test_results.append(test_result)
+            if test_result.status == "failed":
+                failed_test_name = failed_test_name or test_full_name
+                propagation.failed(test_full_name, test.path)
+                if not propagation.blocked_by:
+                    await self._recover_page_after_failure(unit.page, start_url)
+
+        # A failed setup skips the teardown too (same as the sync engine)
+        if subcategory.teardown and subcategory.teardown.is_valid and not setup_failed:
+            teardown_result = await self._run_test(
+                unit, self.tests_root / subcategory.path / "_teardown", f"{subcategory.name}/_teardown", "teardown",
+                0, 0, category_path,
+            )
+            result.test_results.append(teardown_result)
+
+        self.runner._save_subcategory_result(
+            subcategory, parent_category, result, category_path, saved_paths=unit.saved_subcategory_paths,
+        )
+        if not failed_test_name:
+            print(f"    <<< Subcategory: {subcategory.name} completed")
+        return failed_test_name
+
+    async def _run_teardowns(self, unit: _NativeUnit, categories: List[Category], chain: List[Category]) -> None:
+        """Run teardowns for the given categories in reverse order (leaf -> ... -> root)."""
+        root = chain[0]
+        for cat in reversed(categories):
+            if not (cat.teardown and cat.teardown.is_valid):
+                continue
+            is_root = cat is root
+            teardown_result = await self._run_test(
+                unit,
+                self.tests_root / cat.path / "_teardown",
+                "_teardown" if is_root else f"{cat.name}/_teardown",
+                "teardown",
+                0,
+                0,
+                root.name if is_root else (cat.path.name if cat.path else cat.name),
+            )
+            if is_root:
+                unit.result.teardown_result = teardown_result
+            else:
+                unit.result.test_results.append(teardown_result)
+
+    async def _run_test(
+        self,
+        unit: _NativeUnit,
+        test_path: Path,
+        test_name: str,
+        test_type: Literal["test", "setup", "teardown"],
+        index: int,
+        total: int,
+        category_name: str,
+        page: Optional[Page] = None,
+    ) -> TestResult:
+        """
+        Run one async test and handle events/storage/healing (see TestRunner._run_single_test).
+
+        page defaults to the unit's page (a concurrent group passes its own).
+        """
+        page = page or unit.page
+        self.events.emit(RunnerEvent.TEST_STARTED, {
+            "test": test_name,
+            "test_type": test_type,
+            "index": index,
+            "total": total,
+            "category": category_name,
+        })
+        context_before = self.runner._snapshot_context(unit.context) if self.runner._retries_for(test_type) else None
+        start_url = page.url
+        unit.context.begin(test_name)
+        if unit.blocker:
+            unit.blocker.begin(page)
+        # One chunk at a time per context: tests of a concurrent group are not traced separately
+        traced = unit.traces is not None and page is unit.page and not unit.traces.in_chunk
+        if traced:
+            await unit.traces.begin_async(test_name)
+        result = None
+        try:
+            result = await self.executor.execute_async(test_path, test_type, page, unit.context)
+            if result.status == "failed" and context_before is not None:
+                result = await self._retry_failed_test(
+                    unit, page, result, test_path, test_type, test_name, context_before, start_url,
+                )
+        finally:
+            unit.context.end()
+            blocked = unit.blocker.end(page) if unit.blocker else None
+            trace = await unit.traces.end_async(failed=result is None or result.status == "failed") if traced else None
+        if blocked:
+            result.metrics["blocked_requests"] = blocked
+        if trace:
+            result.trace = trace
+        result.test_name = test_name
+
+        if test_type == "setup" and result.status == "passed":
+            await self._save_session_if_logged_in(unit)
+
+        self.runner._record_test_result(result, test_type, category_name, unit.context)
+        return result
+
+    async def _retry_failed_test(
+        self,
+        unit: _NativeUnit,
+        page: Page,
+        result: TestResult,
+        test_path: Path,
+        test_type: Literal["test", "setup", "teardown"],
+        test_name: str,
+        context_before: Dict[str, Any],
+        start_url: str,
+    ) -> TestResult:
+        """
+        Async counterpart of TestRunner._retry_failed_test (same attempts and setup replay rules).
+
+        A test of a concurrent group is retried without the setup replay: the replayed
+        teardowns would delete the entities the other tests of the group are using.
+        """
+        retries = self.runner._retries_for(test_type)
+        attempts = [self.runner._attempt_entry(1, result, setup_replayed=False)]
+        for attempt in range(2, retries + 2):
+            self.events.emit(RunnerEvent.TEST_PROGRESS, {
+                "test": test_name,
+                "message": f"Retrying after failure (attempt {attempt}/{retries + 1})",
+            })
+            # Only this test's writes: other tests of a concurrent group may be using the context
+            written = set(unit.context.accesses.get(test_name, {}).get("writes", ()))
+            self.runner._restore_context(unit.context, context_before, keys=written)
+            replay_setup = attempt > 2 and page is unit.page
+            error = await self._reset_page_for_retry(page, start_url)
+            if error is None and replay_setup:
+                error = await self._replay_setup_chain(unit, page, test_path, test_name)
+            if error is not None:
+                attempts.append({
+                    "attempt": attempt,
+                    "status": "failed",
+                    "duration_ms": 0,
+                    "error": error,
+                    "error_type": "RetryError",
+                    "setup_replayed": replay_setup,
+                })
+                break
+            self.runner._discard_screenshot(result)
+            result = await self.executor.execute_async(test_path, test_type, page, unit.context)
+            attempts.append(self.runner._attempt_entry(attempt, result, setup_replayed=replay_setup))
+            if result.status != "failed":
+                break
+        result.attempts = attempts
+        return result
+
+    async def _recover_page_after_failure(self, page: Page, start_url: str) -> None:
+        """Async counterpart of TestRunner._recover_page_after_failure."""
+        error = await self._reset_page_for_retry(page, start_url)
+        if error:
+            print(f"  [Skip] {error}")
+
+    @staticmethod
+    async def _reset_page_for_retry(page: Page, start_url: str) -> Optional[str]:
+        """
+        Reload the page at start_url (returns an error message or None).
+
+        Unlike the sync engine, other pages are left open: they may be running concurrent tests.
+        """
+        try:
+            await page.goto("about:blank")
+            if start_url and start_url != "about:blank":
+                await page.goto(start_url, wait_until="domcontentloaded")
+        except Exception as e:
+            return f"Could not reset page for retry: {type(e).__name__}: {e}"
+        return None
+
+    async def _replay_setup_chain(
+        self, unit: _NativeUnit, page: Page, test_path: Path, test_name: str,
+    ) -> Optional[str]:
+        """
+        Async counterpart of TestRunner._replay_setup_chain: teardowns up, then setups down,
+        outside the test's context tracking (returns an error message or None).
+        """
+        unit.context.end()
+        try:
+            for step_path, test_type in self.runner._setup_replay_steps(test_path):
+                step_result = await self.executor.execute_async(step_path, test_type, page, unit.context)
+                if step_result.status == "failed":
+                    self.runner._discard_screenshot(step_result)
+                    return self.runner._replay_error(step_path, step_result)
+        finally:
+            unit.context.begin(test_name)
+        return None
+
+    async def _save_session_if_logged_in(self, unit: _NativeUnit) -> None:
+        """Save the unit's storage_state to the session cache (once per unit) after login."""
+        if unit.session_saved or not unit.context.get("logged_in_user"):
+            return
+        base_url, username = self.runner._session_account()
+        if unit.context.get("logged_in_user") != username or not self.runner.session_cache.enabled:
+            return
+        try:
+            state = await unit.page.context.storage_state()
+        except Exception as e:
+            print(f"  [Session] Could not read storage_state: {type(e).__name__}: {e}")
+            return
+        if self.runner.session_cache.save_state(state, base_url, username):
+            unit.session_saved = True
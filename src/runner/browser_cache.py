@@ -0,0 +1,195 @@
+"""
+Persistent browser profile that keeps the HTTP cache warm across categories and runs.
+
+Contexts created with browser.new_context() are incognito: each category downloads the
+vcita SPA shell (angular app, vue iframe bundle) again. With browser_cache.enabled, the
+sync runner opens every category with launch_persistent_context() on a profile directory
+under .browser_cache/ instead. Before each launch everything in the profile except the
+cache folders is deleted, so cookies, localStorage, IndexedDB and service workers start
+empty as before while cached scripts, styles and images are reused.
+
+Chrome locks a profile directory, so each runner process takes its own slot
+(.browser_cache/slot-N, claimed with a lock file); a new slot is seeded with a copy of the
+cache of an idle one. The async engine keeps incognito contexts (its units share one
+browser concurrently).
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Profile folders kept between launches (HTTP cache, compiled JS, shaders); everything else is reset
+CACHE_FOLDERS = [
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "GrShaderCache",
+    "ShaderCache",
+    "GraphiteDawnCache",
+]
+
+# Restores the localStorage of a storage_state once per tab (launch_persistent_context has no storage_state option)
+_LOCAL_STORAGE_SCRIPT = """
+(() => {
+    const origins = %s;
+    try {
+        const items = origins[location.origin];
+        if (!items || sessionStorage.getItem('__seeded_storage_state')) return;
+        for (const [name, value] of items) localStorage.setItem(name, value);
+        sessionStorage.setItem('__seeded_storage_state', '1');
+    } catch (e) {}
+})();
+"""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class CacheProfile:
+    """
+    Profile slots with a warm HTTP cache for launch_persistent_context().
+
+    Usage:
+        profile = CacheProfile.from_config(config)
+        if profile.enabled:
+            user_data_dir = profile.prepare()   # claims a slot, resets cookies/storage
+            ...launch_persistent_context(user_data_dir, ...)...
+            profile.release()
+    """
+
+    DEFAULT_DIR = ".browser_cache"
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = False):
+        """
+        Initialize the profile store.
+
+        Args:
+            cache_dir: Directory holding the profile slots (default: .browser_cache/)
+            enabled: When False, the runner keeps incognito contexts
+        """
+        self.cache_dir = Path(cache_dir or self.DEFAULT_DIR)
+        self.enabled = enabled
+        self.slot_dir: Optional[Path] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "CacheProfile":
+        """Build a profile store from the browser_cache section of config.yaml."""
+        section = (config or {}).get("browser_cache") or {}
+        return cls(
+            cache_dir=Path(section.get("dir") or cls.DEFAULT_DIR),
+            enabled=bool(section.get("enabled", False)),
+        )
+
+    def prepare(self) -> Path:
+        """
+        Claim a slot (once per process) and reset it for a new context.
+
+        Returns:
+            user_data_dir for launch_persistent_context()
+        """
+        if self.slot_dir is None:
+            self.slot_dir = self._claim_slot()
+            if not self._has_cache(self.slot_dir):
+                self._seed(self.slot_dir)
+        self._reset(self.slot_dir)
+        return self.slot_dir.resolve()
+
+    def release(self) -> None:
+        """Give the slot back (its cache stays for the next run)."""
+        if self.slot_dir is not None:
+            self._lock_path(self.slot_dir).unlink(missing_ok=True)
+            self.slot_dir = None
+
+    @staticmethod
+    def _lock_path(slot: Path) -> Path:
+        return slot.with_name(slot.name + ".lock")
+
+    def _claim_slot(self) -> Path:
+        """First slot whose lock is free or held by a dead process."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index = 0
+        while True:
+            slot = self.cache_dir / f"slot-{index}"
+            lock = self._lock_path(slot)
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    owner = int(lock.read_text(encoding="utf-8").strip() or 0)
+                except (OSError, ValueError):
+                    owner = 0
+                if owner and not _pid_alive(owner):
+                    lock.unlink(missing_ok=True)
+                    continue
+                index += 1
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(str(os.getpid()))
+            slot.mkdir(exist_ok=True)
+            return slot
+
+    @staticmethod
+    def _has_cache(slot: Path) -> bool:
+        return (slot / CACHE_FOLDERS[0]).is_dir()
+
+    def _seed(self, slot: Path) -> None:
+        """Copy the cache folders of an idle slot into a new one."""
+        for other in sorted(self.cache_dir.glob("slot-*")):
+            if other == slot or not other.is_dir() or self._lock_path(other).exists() or not self._has_cache(other):
+                continue
+            for folder in CACHE_FOLDERS:
+                source = other / folder
+                if source.is_dir():
+                    shutil.copytree(source, slot / folder, dirs_exist_ok=True)
+            return
+
+    @staticmethod
+    def _reset(slot: Path) -> None:
+        """Delete everything in the profile except the cache folders."""
+        keep = {Path(folder) for folder in CACHE_FOLDERS}
+        keep_parents = {parent for folder in keep for parent in folder.parents if parent != Path(".")}
+
+        def clean(directory: Path) -> None:
+            for entry in directory.iterdir():
+                relative = entry.relative_to(slot)
+                if relative in keep:
+                    continue
+                if relative in keep_parents and entry.is_dir():
+                    clean(entry)
+                elif entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink(missing_ok=True)
+
+        clean(slot)
+
+
+def apply_storage_state(browser_context, storage_state: Any) -> None:
+    """
+    Load a storage_state (dict or path) into a persistent context: cookies now, localStorage
+    through an init script on the first page load of each origin.
+    """
+    if isinstance(storage_state, (str, Path)):
+        storage_state = json.loads(Path(storage_state).read_text(encoding="utf-8"))
+    if not storage_state:
+        return
+    cookies = storage_state.get("cookies") or []
+    if cookies:
+        browser_context.add_cookies(cookies)
+    origins: Dict[str, List[List[str]]] = {
+        origin["origin"]: [[item["name"], item["value"]] for item in origin.get("localStorage") or []]
+        for origin in storage_state.get("origins") or []
+        if origin.get("localStorage")
+    }
+    if origins:
+        browser_context.add_init_script(_LOCAL_STORAGE_SCRIPT % json.dumps(origins))
@@ -0,0 +1,252 @@
+"""
+Checkpoints of a category run, and resuming from them.
+
+After every passing setup/test/teardown the runner writes a small checkpoint to
+.checkpoints/<run_id>/<category>/<NNN>.json: the context keys the tests saved, the
+BrowserContext storage_state (cookies + localStorage), the page URL and the results so far
+(the position in the execution plan). A resumed run also checkpoints the tests it skips,
+as "resumed", so resuming it in turn does not replay them.
+
+`main.py run --resume <run_id>` continues the run from its latest checkpoint, and
+`--from-test X` starts at test X from the checkpoint taken just before it. The new browser
+gets the saved storage_state and URL and the context is restored, so setups and earlier
+tests are not replayed: iterating on a late test no longer means recreating its services,
+clients and events every time.
+
+Checkpoints hold session cookies, so they live next to .sessions/ (not in tests/*/_runs/,
+which is committed) and only the latest runs are kept.
+"""
+
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+
+# Sequence status of a test a resumed run skipped because an earlier run had done it
+STATUS_RESUMED = "resumed"
+# Sequence statuses a resume treats as done
+DONE_STATUSES = ("passed", STATUS_RESUMED)
+
+@dataclass
+class ResumePoint:
+    """Where a category run continues: what to skip and the state to start from."""
+
+    run_id: str
+    category: str
+    checkpoint: Path
+    skip: Set[str]
+    context: Dict[str, Any] = field(default_factory=dict)
+    storage_state: Optional[Dict[str, Any]] = None
+    url: Optional[str] = None
+
+    def skips(self, test_name: str) -> bool:
+        """True if test_name already ran before the checkpoint."""
+        return test_name in self.skip
+
+
+class CheckpointStore:
+    """
+    Writes and reads the checkpoints of category runs.
+
+    Usage:
+        store = CheckpointStore.from_config(config)
+        store.save(run_id, "scheduling", test_name, sequence, context, storage_state, url)
+        point = store.resume_point("scheduling", run_id=None, from_test="Schedule Event")
+    """
+
+    DEFAULT_DIR = ".checkpoints"
+    DEFAULT_KEEP_RUNS = 5
+
+    def __init__(self, checkpoint_dir: Optional[Path] = None, enabled: bool = True, keep_runs: int = DEFAULT_KEEP_RUNS):
+        """
+        Initialize the store.
+
+        Args:
+            checkpoint_dir: Directory for checkpoints (default: .checkpoints/ in current directory)
+            enabled: When False, save() does nothing (resuming still reads existing checkpoints)
+            keep_runs: Number of runs whose checkpoints are kept
+        """
+        self.checkpoint_dir = Path(checkpoint_dir or self.DEFAULT_DIR)
+        self.enabled = enabled
+        self.keep_runs = max(1, keep_runs)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "CheckpointStore":
+        """Build a store from the checkpoints section of config.yaml."""
+        section = (config or {}).get("checkpoints") or {}
+        return cls(
+            checkpoint_dir=Path(section.get("dir") or cls.DEFAULT_DIR),
+            enabled=bool(section.get("enabled", True)),
+            keep_runs=int(section.get("keep_runs", cls.DEFAULT_KEEP_RUNS)),
+        )
+
+    @staticmethod
+    def _safe(category: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]", "__", category.strip("/").lower())
+
+    def category_dir(self, run_id: str, category: str) -> Path:
+        """Directory of a category's checkpoints in a run."""
+        return self.checkpoint_dir / run_id / self._safe(category)
+
+    def save(
+        self,
+        run_id: str,
+        category: str,
+        test_name: str,
+        sequence: List[Dict[str, str]],
+        context: Dict[str, Any],
+        storage_state: Optional[Dict[str, Any]],
+        url: Optional[str],
+    ) -> Optional[Path]:
+        """
+        Write a checkpoint after a passing test.
+
+        Args:
+            run_id: Current run id
+            category: Root category path (e.g. "scheduling")
+            test_name: Test that just passed (as named in results, e.g. "Events/Schedule Event")
+            sequence: Results so far in execution order: [{"name", "status"}, ...]
+            context: Context keys to restore (values that are not JSON are dropped)
+            storage_state: BrowserContext storage_state
+            url: Current page URL
+
+        Returns:
+            Path to the checkpoint file, or None if checkpoints are disabled
+        """
+        if not self.enabled:
+            return None
+        directory = self.category_dir(run_id, category)
+        directory.mkdir(parents=True, exist_ok=True)
+        data = {
+            "run_id": run_id,
+            "category": category,
+            "test": test_name,
+            "saved_at": datetime.now().isoformat(),
+            "url": url,
+            "sequence": sequence,
+            "context": self._json_values(context),
+            "storage_state": storage_state,
+        }
+        path = directory / f"{len(sequence):03d}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def _json_values(context: Dict[str, Any]) -> Dict[str, Any]:
+        """Context entries that survive a JSON round trip (drops callbacks and other objects)."""
+        values = {}
+        for key, value in context.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            values[key] = value
+        return values
+
+    def prune(self, current_run_id: Optional[str] = None) -> int:
+        """
+        Delete checkpoints of old runs, keeping the latest keep_runs (and the current run).
+
+        Returns:
+            Number of run directories deleted
+        """
+        if not self.checkpoint_dir.exists():
+            return 0
+        runs = sorted((d for d in self.checkpoint_dir.iterdir() if d.is_dir()), key=lambda d: d.name)
+        old = [d for d in runs[: max(0, len(runs) - self.keep_runs)] if d.name != current_run_id]
+        for run_dir in old:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        return len(old)
+
+    def latest_run_id(self, category: Optional[str] = None) -> Optional[str]:
+        """Latest run id with checkpoints (for category, when given)."""
+        if not self.checkpoint_dir.exists():
+            return None
+        runs = sorted((d.name for d in self.checkpoint_dir.iterdir() if d.is_dir()), reverse=True)
+        for run_id in runs:
+            if category is None or any(self.category_dir(run_id, category).glob("*.json")):
+                return run_id
+        return None
+
+    def run_categories(self, run_id: str) -> List[str]:
+        """Root category paths that have checkpoints in a run."""
+        run_dir = self.checkpoint_dir / run_id
+        if not run_dir.is_dir():
+            return []
+        categories = []
+        for directory in sorted(d for d in run_dir.iterdir() if d.is_dir()):
+            files = sorted(directory.glob("*.json"))
+            if files:
+                try:
+                    categories.append(json.loads(files[-1].read_text(encoding="utf-8"))["category"])
+                except (OSError, json.JSONDecodeError, KeyError):
+                    continue
+        return categories
+
+    def resume_point(
+        self,
+        category: str,
+        run_id: Optional[str] = None,
+        from_test: Optional[str] = None,
+    ) -> Optional[ResumePoint]:
+        """
+        Find where a category run continues.
+
+        Without from_test: the latest checkpoint; tests that passed before it (or that a
+        resumed run skipped as already done) are skipped and everything else (including
+        failed tests) runs. With from_test: the latest checkpoint
+        taken before from_test ran; everything before it is skipped.
+
+        Args:
+            category: Root category path
+            run_id: Run to resume (default: latest run with checkpoints for the category)
+            from_test: Test to start at (name, "Subcategory/Name" or a unique suffix)
+
+        Returns:
+            ResumePoint, or None if there is no usable checkpoint (the category runs from the start)
+        """
+        run_id = run_id or self.latest_run_id(category)
+        if not run_id:
+            return None
+        checkpoints = []
+        for path in sorted(self.category_dir(run_id, category).glob("*.json")):
+            try:
+                checkpoints.append((path, json.loads(path.read_text(encoding="utf-8"))))
+            except (OSError, json.JSONDecodeError):
+                continue
+        if from_test:
+            checkpoints = [
+                (path, data) for path, data in checkpoints
+                if not any(test_matches(entry["name"], from_test) for entry in data.get("sequence") or [])
+            ]
+        if not checkpoints:
+            return None
+        path, data = checkpoints[-1]
+        sequence = data.get("sequence") or []
+        if from_test:
+            skip = {entry["name"] for entry in sequence}
+        else:
+            skip = {entry["name"] for entry in sequence if entry.get("status") in DONE_STATUSES}
+        return ResumePoint(
+            run_id=run_id,
+            category=category,
+            checkpoint=path,
+            skip=skip,
+            context=data.get("context") or {},
+            storage_state=data.get("storage_state"),
+            url=data.get("url"),
+        )
+
+
+def test_matches(test_name: str, target: str) -> bool:
+    """True if a result name ("Events/Schedule Event") is the target test (full name, name or folder-style id)."""
+    name, want = test_name.strip().lower(), target.strip().lower()
+    normalized = want.replace("_", " ")
+    return name == want or name.endswith("/" + want) or name == normalized or name.endswith("/" + normalized)
@@ -62,7 +62,8 @@ class CLIReporter:
         self.console.print()
         self.console.print(Panel(
             f"[bold]vcita Test Runner[/bold]\n"
-            f"Categories: {data['total_categories']} | Tests: {data['total_tests']}",
+            f"Categories: {data['total_categories']} | Tests: {data['total_tests']}"
+            + self._format_makespan(data),
             border_style="blue",
         ))
         self.console.print()
@@ -72,6 +73,16 @@ class CLIReporter:
         self._passed_count = 0
         self._failed_count = 0
     
+    @staticmethod
+    def _format_makespan(data: dict) -> str:
+        """Estimated run time line for the run header (empty if unknown)."""
+        makespan_ms = data.get('estimated_makespan_ms')
+        if not makespan_ms:
+            return ""
+        minutes, seconds = divmod(int(makespan_ms / 1000), 60)
+        workers = data.get('workers') or 1
+        return f"\nEstimated time: ~{minutes}m {seconds:02d}s with {workers} worker{'s' if workers != 1 else ''}"
+    
     def _on_run_completed(self, data: dict) -> None:
         """Handle run completed event."""
         # Summary is printed by print_summary()
@@ -141,6 +152,9 @@ class CLIReporter:
         status = result['status']
         duration_ms = result['duration_ms']
         duration_str = f"{duration_ms/1000:.1f}s" if duration_ms >= 1000 else f"{duration_ms}ms"
+        attempts = result.get('attempts') or []
+        if len(attempts) > 1:
+            duration_str += f", attempt {len(attempts)}"
         
         if status == 'passed':
             self.console.print(f"        [green]{'>'} Passed[/green] ({duration_str})")
@@ -228,3 +242,78 @@ class CLIReporter:
             f"Duration: {total_duration}",
             border_style=summary_style,
         ))
+    
+    def print_profile(self, report: dict, report_path=None, limit: int = 15) -> None:
+        """
+        Print the slowest Playwright calls of a profiled run.
+        
+        Args:
+            report: Profile report (see profiler.build_profile_report)
+            report_path: Where the full report was saved
+            limit: Number of calls to show
+        """
+        self.console.print()
+        table = Table(title="Slowest Playwright Calls", border_style="blue")
+        table.add_column("Duration", justify="right")
+        table.add_column("Call", style="cyan")
+        table.add_column("Target")
+        table.add_column("Test")
+        table.add_column("Location", style="dim")
+        
+        for call in report.get("slowest_calls", [])[:limit]:
+            method = call["method"] + (f" [red]({call['error']})[/red]" if call.get("error") else "")
+            table.add_row(
+                f"{call['duration_ms']/1000:.2f}s",
+                method,
+                call.get("target") or "",
+                call.get("test") or "",
+                call.get("location") or "",
+            )
+        
+        self.console.print(table)
+        totals = ", ".join(
+            f"{method} {stats['total_ms']/1000:.1f}s ({stats['count']})"
+            for method, stats in list(report.get("by_method", {}).items())[:6]
+        )
+        if totals:
+            self.console.print(f"[dim]Time per call type: {totals}[/dim]")
+        if report_path:
+            self.console.print(f"[dim]Full report: {report_path}[/dim]")
+    
+    def print_sleep_report(self, report: dict, report_path=None, limit: int = 15) -> None:
+        """
+        Print the time a profiled run spent in unconditional sleeps (wait_for_timeout).
+        
+        Args:
+            report: Profile report (see profiler.build_profile_report)
+            report_path: Where the full report was saved
+            limit: Number of source lines to show
+        """
+        sleeps = report.get("sleeps") or {}
+        self.console.print()
+        if not sleeps.get("count"):
+            self.console.print("[green]No fixed sleeps (wait_for_timeout) in this run.[/green]")
+            return
+        table = Table(title="Fixed Sleeps (wait_for_timeout)", border_style="yellow")
+        table.add_column("Total", justify="right")
+        table.add_column("Calls", justify="right")
+        table.add_column("Location", style="cyan")
+        table.add_column("Tests", style="dim")
+        
+        for entry in sleeps.get("by_location", [])[:limit]:
+            tests = entry.get("tests") or []
+            table.add_row(
+                f"{entry['total_ms']/1000:.1f}s",
+                str(entry["count"]),
+                entry["location"],
+                ", ".join(tests[:3]) + (f" +{len(tests) - 3}" if len(tests) > 3 else ""),
+            )
+        
+        self.console.print(table)
+        self.console.print(
+            f"[yellow]{sleeps['total_ms']/1000:.1f}s in {sleeps['count']} fixed sleeps "
+            f"({sleeps.get('share', 0):.0%} of test time). Replace them with the condition waits "
+            f"in tests/_functions/_waits.py.[/yellow]"
+        )
+        if report_path:
+            self.console.print(f"[dim]Full report: {report_path}[/dim]")
@@ -5,13 +5,105 @@ The context is a shared dictionary that tests use to pass data between them.
 For example, create_matter saves the matter_id, and delete_matter reads it.
 """
 
+import contextvars
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 import copy
 
 
+class TrackedContext(dict):
+    """
+    Context dict that records which keys each test reads and writes.
+    
+    The runner calls begin(test_name) before a test and end() after it; accesses in between
+    are attributed to that test. Reads of a key the test wrote itself earlier are not
+    dependencies, so only "external" reads are kept. Keys present before the first test
+    (base_url, username, password, _meta) are seeded by the runner and never create
+    dependencies between tests.
+    
+    The current test is tracked per thread / asyncio task, so tests running concurrently
+    on the same context (async engine) are attributed correctly.
+    
+    Tests see a normal dict: copies (dict.copy, copy.copy, copy.deepcopy) are plain dicts.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seeded_keys: Set[str] = set(self.keys())
+        self.accesses: Dict[str, Dict[str, Set[str]]] = {}  # test name -> {"reads": set, "writes": set}, in run order
+        self._current_var: contextvars.ContextVar = contextvars.ContextVar(f"tracked_context_{id(self)}", default=None)
+    
+    @property
+    def _current(self) -> Optional[Dict[str, Set[str]]]:
+        return self._current_var.get()
+    
+    def seal_seeds(self) -> None:
+        """Mark every key present now as seeded by the runner (not a dependency)."""
+        self.seeded_keys = set(self.keys())
+    
+    def begin(self, test_name: str) -> None:
+        """Start attributing accesses to test_name (accumulates if the test runs again, e.g. on retry)."""
+        self._current_var.set(self.accesses.setdefault(test_name, {"reads": set(), "writes": set()}))
+    
+    def end(self) -> None:
+        """Stop attributing accesses."""
+        self._current_var.set(None)
+    
+    def _read(self, key: Any) -> None:
+        if self._current is not None and isinstance(key, str) and key not in self._current["writes"]:
+            self._current["reads"].add(key)
+    
+    def _write(self, key: Any) -> None:
+        if self._current is not None and isinstance(key, str):
+            self._current["writes"].add(key)
+    
+    def __getitem__(self, key):
+        self._read(key)
+        return super().__getitem__(key)
+    
+    def get(self, key, default=None):
+        self._read(key)
+        return super().get(key, default)
+    
+    def __contains__(self, key):
+        self._read(key)
+        return super().__contains__(key)
+    
+    def __setitem__(self, key, value):
+        self._write(key)
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        self._write(key)
+        super().__delitem__(key)
+    
+    def pop(self, key, *default):
+        self._write(key)
+        return super().pop(key, *default)
+    
+    def setdefault(self, key, default=None):
+        self._read(key)
+        if not super().__contains__(key):
+            self._write(key)
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        for key in dict(*args, **kwargs):
+            self._write(key)
+        super().update(*args, **kwargs)
+    
+    def __copy__(self):
+        return dict(self)
+    
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+    
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
 class ContextManager:
     """
     Manages the shared context dictionary for test runs.
@@ -54,6 +146,19 @@ class ContextManager:
         self._history = []
         return self._context
     
+    def create_tracked(self) -> TrackedContext:
+        """
+        Create a fresh context that records per-test key reads and writes (see TrackedContext).
+        
+        Call seal_seeds() on it after the runner has added base_url/credentials.
+        
+        Returns:
+            New TrackedContext with metadata
+        """
+        self.create_fresh()
+        self._context = TrackedContext(self._context)
+        return self._context
+    
     def get_context(self) -> Dict[str, Any]:
         """
         Get the current context dictionary.
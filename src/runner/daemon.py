@@ -0,0 +1,206 @@
+"""
+Continuous (daemon) mode for the test runner.
+
+`main.py run --continuous` (or execution.continuous: true) turns the runner into a synthetic
+monitor: categories are re-run on a schedule in one long-lived process, so the Playwright
+driver, the browser and the cached login session stay warm between iterations instead of
+paying a cold start and a UI login on every invocation.
+
+Each category has its own interval (execution.category_intervals, in seconds; default
+execution.delay_between_runs). Every iteration runs the categories that are due as one run
+(one runs_index entry). To keep the process bounded over weeks, test modules of deleted
+files and stray test_module_* entries are dropped from sys.modules after each iteration
+(test.py files are otherwise imported once, see executor.ModuleCache) and the browser and
+driver are restarted every execution.recycle_browser_every iterations.
+"""
+
+import gc
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .executor import MODULE_CACHE, TEST_MODULE_PREFIX
+from .models import RunResult
+from .runner import TestRunner
+
+
+class ContinuousRunner:
+    """
+    Re-runs categories at fixed intervals with a warm browser.
+
+    Usage:
+        runner = TestRunner(tests_root, headless=True, config=config)
+        daemon = ContinuousRunner.from_config(runner, config)
+        daemon.run()  # until Ctrl+C / SIGTERM
+    """
+
+    DEFAULT_INTERVAL_SECONDS = 60
+    DEFAULT_RECYCLE_EVERY = 50
+    # Categories due within this many seconds of each other run in the same iteration
+    BATCH_WINDOW_SECONDS = 1.0
+
+    def __init__(
+        self,
+        runner: TestRunner,
+        selection: Optional[List[str]] = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        category_intervals: Optional[Dict[str, float]] = None,
+        recycle_browser_every: int = DEFAULT_RECYCLE_EVERY,
+        max_iterations: Optional[int] = None,
+        on_iteration: Optional[Callable[[RunResult], None]] = None,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            runner: Runner to drive (its browser is kept open between iterations)
+            selection: Category paths to monitor (default: all top-level categories, rediscovered each iteration)
+            interval_seconds: Default time between two runs of the same category
+            category_intervals: Per-category interval overrides, keyed by category path (e.g. {"clients": 300})
+            recycle_browser_every: Restart browser and driver after this many iterations (0 = never)
+            max_iterations: Stop after this many iterations (None = run until stopped)
+            on_iteration: Called with the RunResult of every iteration (e.g. to print a summary)
+        """
+        self.runner = runner
+        self.selection = list(selection) if selection else None
+        self.interval_seconds = max(1.0, float(interval_seconds))
+        self.category_intervals = {k.strip("/").lower(): float(v) for k, v in (category_intervals or {}).items()}
+        self.recycle_browser_every = max(0, int(recycle_browser_every or 0))
+        self.max_iterations = max_iterations
+        self.on_iteration = on_iteration
+        self.iterations = 0
+        self._next_due: Dict[str, float] = {}
+        self._stop = threading.Event()
+
+        # Warm browser: one in-process browser reused by every iteration
+        self.runner.keep_browser = True
+        self.runner.workers = 1
+
+    @classmethod
+    def from_config(
+        cls,
+        runner: TestRunner,
+        config: Optional[dict],
+        selection: Optional[List[str]] = None,
+        **kwargs,
+    ) -> "ContinuousRunner":
+        """Build a daemon from the execution section of config.yaml."""
+        execution = (config or {}).get("execution") or {}
+        return cls(
+            runner,
+            selection=selection,
+            interval_seconds=execution.get("delay_between_runs", cls.DEFAULT_INTERVAL_SECONDS),
+            category_intervals=execution.get("category_intervals") or {},
+            recycle_browser_every=execution.get("recycle_browser_every", cls.DEFAULT_RECYCLE_EVERY),
+            **kwargs,
+        )
+
+    def run(self) -> int:
+        """
+        Run until stopped (Ctrl+C, SIGTERM, stop() or max_iterations).
+
+        Returns:
+            Number of iterations run
+        """
+        self._install_signal_handlers()
+        print(f"\n[Continuous] Monitoring started at {datetime.now():%Y-%m-%d %H:%M:%S} "
+              f"(default interval {self.interval_seconds:.0f}s, Ctrl+C to stop)")
+        try:
+            while not self._stop.is_set():
+                due = self.due_categories(time.monotonic())
+                if due:
+                    self._run_iteration(due)
+                    if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                        break
+                    continue
+                self._stop.wait(self._seconds_until_next())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.runner.keep_browser = False
+            self.runner.browsers.close()
+            print(f"\n[Continuous] Stopped after {self.iterations} iteration(s)")
+        return self.iterations
+
+    def stop(self) -> None:
+        """Ask the daemon to stop after the current iteration."""
+        self._stop.set()
+
+    def interval_for(self, path: str) -> float:
+        """Interval in seconds for a category path."""
+        return self.category_intervals.get(path.strip("/").lower(), self.interval_seconds)
+
+    def due_categories(self, now: float) -> List[str]:
+        """Category paths whose next run is due at monotonic time now (new categories are due at once)."""
+        paths = self._monitored_paths()
+        # Forget categories that were removed from the tests tree
+        for path in list(self._next_due):
+            if path not in paths:
+                del self._next_due[path]
+        return [p for p in paths if self._next_due.get(p, 0.0) <= now + self.BATCH_WINDOW_SECONDS]
+
+    def _monitored_paths(self) -> List[str]:
+        """Category paths to monitor (selection, or top-level categories discovered now)."""
+        if self.selection:
+            return list(self.selection)
+        return [c.path.as_posix() for c in self.runner.get_categories()]
+
+    def _seconds_until_next(self) -> float:
+        """Time to sleep before the next category is due (at most one default interval)."""
+        if not self._next_due:
+            return self.interval_seconds
+        return max(0.1, min(self._next_due.values()) - self.BATCH_WINDOW_SECONDS - time.monotonic())
+
+    def _run_iteration(self, due: List[str]) -> Optional[RunResult]:
+        """Run the due categories as one run, then schedule them and release memory."""
+        self.iterations += 1
+        started = time.monotonic()
+        print(f"\n[Continuous] Iteration {self.iterations}: {', '.join(due)}")
+        result = None
+        try:
+            result = self.runner.run_all(selection=due)
+        except Exception as e:
+            # A broken iteration must not end the monitor; start the next one from a fresh browser
+            print(f"[Continuous] Iteration {self.iterations} failed: {type(e).__name__}: {e}")
+            self.runner.browsers.close()
+        for path in due:
+            self._next_due[path] = started + self.interval_for(path)
+        if result is not None and self.on_iteration:
+            self.on_iteration(result)
+        self._release_memory()
+        return result
+
+    def _release_memory(self) -> None:
+        """Drop per-iteration state so a long-running daemon does not grow without bound."""
+        purge_test_modules()
+        if self.recycle_browser_every and self.iterations % self.recycle_browser_every == 0:
+            print(f"[Continuous] Restarting browser after {self.iterations} iterations")
+            self.runner.browsers.close()
+        gc.collect()
+
+    def _install_signal_handlers(self) -> None:
+        """Stop cleanly on SIGTERM (e.g. from systemd or docker stop); main thread only."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        except (ValueError, OSError):
+            pass
+
+
+def purge_test_modules() -> int:
+    """
+    Remove test modules that the module cache no longer owns from sys.modules.
+
+    Returns:
+        Number of modules removed
+    """
+    MODULE_CACHE.prune()
+    live = set(MODULE_CACHE.module_names())
+    names = [name for name in sys.modules if name.startswith(TEST_MODULE_PREFIX) and name not in live]
+    for name in names:
+        del sys.modules[name]
+    return len(names)
@@ -0,0 +1,270 @@
+"""
+Pool of pre-provisioned test data leased to categories.
+
+Setups like scheduling/events/_setup spend most of their time creating a client and a
+service through the UI. With data_pool enabled, a provisioner (python main.py data_pool fill,
+run once or with --watch next to the runs) keeps a number of ready clients, 1-on-1 services
+and group-event services in the test account, and setups lease one instead
+(tests/_functions/_pool.py).
+
+The pool state is a small SQLite database (.data_pool/pool.sqlite). Leases are taken in an
+IMMEDIATE transaction, so several runner processes or shards can lease at once without two
+of them getting the same entity.
+
+Lifecycle of an entity:
+- ready: created by the provisioner, free to lease
+- leased: held by one category run (owner = context["data_pool_owner"])
+- dirty: not reusable (kind not in data_pool.recycle, its category failed, or its lease
+  expired); the provisioner deletes it from the account
+The janitor (release_owner, called by the runner when a category ends) puts leased entities
+of recyclable kinds back to ready and marks the rest dirty.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Context key holding the lease owner of a category run (seeded by the runner)
+OWNER_KEY = "data_pool_owner"
+
+KIND_CLIENT = "client"
+KIND_SERVICE = "service"
+KIND_GROUP_EVENT = "group_event"
+KINDS = [KIND_CLIENT, KIND_SERVICE, KIND_GROUP_EVENT]
+
+STATE_READY = "ready"
+STATE_LEASED = "leased"
+STATE_DIRTY = "dirty"
+
+DEFAULT_TARGETS = {KIND_CLIENT: 5, KIND_SERVICE: 3, KIND_GROUP_EVENT: 3}
+# Group events collect scheduled instances and attendees, so they are not reused by default
+DEFAULT_RECYCLE = [KIND_CLIENT, KIND_SERVICE]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL DEFAULT '{}',
+    state TEXT NOT NULL,
+    owner TEXT,
+    leased_at REAL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entities_kind_state ON entities (kind, state, created_at);
+CREATE INDEX IF NOT EXISTS entities_owner ON entities (owner);
+"""
+
+
+class DataPool:
+    """
+    SQLite store of pooled entities and their leases.
+
+    Usage:
+        pool = DataPool.from_config(config)
+        if pool.enabled:
+            entity = pool.lease("client", owner)   # None when the pool is empty
+            ...
+            pool.release_owner(owner)              # janitor, at the end of the category
+    """
+
+    DEFAULT_DIR = ".data_pool"
+    DEFAULT_LEASE_MINUTES = 120
+
+    def __init__(
+        self,
+        pool_dir: Optional[Path] = None,
+        targets: Optional[Dict[str, int]] = None,
+        recycle: Optional[List[str]] = None,
+        lease_minutes: int = DEFAULT_LEASE_MINUTES,
+        enabled: bool = False,
+    ):
+        """
+        Initialize the pool store.
+
+        Args:
+            pool_dir: Directory of pool.sqlite (default: .data_pool/)
+            targets: Ready entities the provisioner keeps per kind
+            recycle: Kinds whose entities go back to ready after a lease
+            lease_minutes: Age after which a lease is considered abandoned (crashed worker)
+            enabled: When False, setups create their data inline as before
+        """
+        self.pool_dir = Path(pool_dir or self.DEFAULT_DIR)
+        self.path = self.pool_dir / "pool.sqlite"
+        self.targets = {**DEFAULT_TARGETS, **(targets or {})}
+        self.recycle = set(DEFAULT_RECYCLE if recycle is None else recycle)
+        self.lease_seconds = lease_minutes * 60
+        self.enabled = enabled
+        self._initialized = False
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "DataPool":
+        """Build a pool store from the data_pool section of config.yaml."""
+        section = (config or {}).get("data_pool") or {}
+        return cls(
+            pool_dir=Path(section.get("dir") or cls.DEFAULT_DIR),
+            targets={k: int(v) for k, v in (section.get("targets") or {}).items()},
+            recycle=section.get("recycle"),
+            lease_minutes=int(section.get("lease_minutes", cls.DEFAULT_LEASE_MINUTES)),
+            enabled=bool(section.get("enabled", False)),
+        )
+
+    @contextmanager
+    def _connect(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Connection in one transaction (IMMEDIATE takes the write lock up front)."""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _entity(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "kind": row["kind"],
+            "entity_id": row["entity_id"],
+            "name": row["name"],
+            "data": json.loads(row["data"] or "{}"),
+        }
+
+    @staticmethod
+    def new_owner() -> str:
+        """Lease owner id for one category run."""
+        return f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def seed(self, context: dict) -> None:
+        """Add a lease owner to a fresh category context (before seal_seeds)."""
+        if self.enabled:
+            context[OWNER_KEY] = self.new_owner()
+
+    def add(self, kind: str, entity_id: str, name: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Add a newly provisioned entity as ready."""
+        with self._connect(immediate=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entities (entity_id, kind, name, data, state, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (entity_id, kind, name, json.dumps(data or {}), STATE_READY, time.time()),
+            )
+
+    def lease(self, kind: str, owner: str) -> Optional[Dict[str, Any]]:
+        """
+        Lease the oldest ready entity of a kind.
+
+        Returns:
+            {"kind", "entity_id", "name", "data"}, or None if none is ready
+        """
+        with self._connect(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT * FROM entities WHERE kind = ? AND state = ? ORDER BY created_at LIMIT 1",
+                (kind, STATE_READY),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE entities SET state = ?, owner = ?, leased_at = ? WHERE entity_id = ?",
+                (STATE_LEASED, owner, time.time(), row["entity_id"]),
+            )
+        return self._entity(row)
+
+    def find_leased(self, owner: str, kind: str, entity_id: Optional[str] = None, name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Entity of a kind leased by owner, matched by id or name."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM entities WHERE owner = ? AND kind = ? AND state = ?",
+                (owner, kind, STATE_LEASED),
+            ).fetchall()
+        for row in rows:
+            if (entity_id and row["entity_id"] == str(entity_id)) or (name and row["name"] == name):
+                return self._entity(row)
+        return None
+
+    def release(self, entity_id: str, dirty: bool = False) -> None:
+        """Return one leased entity: ready if its kind is recycled and not dirty, else dirty."""
+        with self._connect(immediate=True) as conn:
+            row = conn.execute("SELECT kind FROM entities WHERE entity_id = ?", (entity_id,)).fetchone()
+            if row is None:
+                return
+            state = STATE_READY if row["kind"] in self.recycle and not dirty else STATE_DIRTY
+            conn.execute(
+                "UPDATE entities SET state = ?, owner = NULL, leased_at = NULL WHERE entity_id = ?",
+                (state, entity_id),
+            )
+
+    def release_owner(self, owner: Optional[str], dirty: bool = False) -> int:
+        """
+        Janitor: return everything still leased by owner.
+
+        Args:
+            owner: Lease owner of the finished category run
+            dirty: Mark all of them dirty (e.g. the category failed, their state is unknown)
+
+        Returns:
+            Number of entities released
+        """
+        if not owner:
+            return 0
+        with self._connect(immediate=True) as conn:
+            rows = conn.execute(
+                "SELECT entity_id, kind FROM entities WHERE owner = ? AND state = ?",
+                (owner, STATE_LEASED),
+            ).fetchall()
+            for row in rows:
+                state = STATE_READY if row["kind"] in self.recycle and not dirty else STATE_DIRTY
+                conn.execute(
+                    "UPDATE entities SET state = ?, owner = NULL, leased_at = NULL WHERE entity_id = ?",
+                    (state, row["entity_id"]),
+                )
+        return len(rows)
+
+    def reclaim_expired(self) -> int:
+        """Mark leases older than lease_minutes dirty (their worker crashed); returns how many."""
+        with self._connect(immediate=True) as conn:
+            cursor = conn.execute(
+                "UPDATE entities SET state = ?, owner = NULL, leased_at = NULL WHERE state = ? AND leased_at < ?",
+                (STATE_DIRTY, STATE_LEASED, time.time() - self.lease_seconds),
+            )
+            return cursor.rowcount
+
+    def dirty(self) -> List[Dict[str, Any]]:
+        """Entities the provisioner should delete from the account."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM entities WHERE state = ?", (STATE_DIRTY,)).fetchall()
+        return [self._entity(row) for row in rows]
+
+    def remove(self, entity_id: str) -> None:
+        """Forget an entity (deleted from the account)."""
+        with self._connect(immediate=True) as conn:
+            conn.execute("DELETE FROM entities WHERE entity_id = ?", (entity_id,))
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Entities per kind and state."""
+        counts = {kind: {STATE_READY: 0, STATE_LEASED: 0, STATE_DIRTY: 0} for kind in KINDS}
+        with self._connect() as conn:
+            for row in conn.execute("SELECT kind, state, COUNT(*) AS n FROM entities GROUP BY kind, state"):
+                counts.setdefault(row["kind"], {})[row["state"]] = row["n"]
+        return counts
+
+    def shortfall(self) -> Dict[str, int]:
+        """Entities to provision per kind to reach the targets."""
+        counts = self.counts()
+        return {
+            kind: max(0, target - counts.get(kind, {}).get(STATE_READY, 0))
+            for kind, target in self.targets.items()
+        }
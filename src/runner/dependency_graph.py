@@ -0,0 +1,206 @@
+"""
+Context dependency graph for a category.
+
+During a run the category's context is a TrackedContext, which records the keys each test
+reads and writes. After the category, the runner turns those records into a dependency
+graph and saves it to .context/dependencies/<category>.json:
+
+- read-after-write:  create_matter writes created_matter_id, edit_matter reads it
+- write-after-read / write-after-write: a later test overwrites or deletes a key an earlier
+  test used, so the two must keep their order
+
+Tests with no edge between them do not exchange data through the context. The async engine
+uses the graph (execution.concurrent_independent_tests) to run consecutive independent
+tests at the same time in separate pages - in units whose tests are all `async def` (sync
+tests run one at a time through the engine's thread compatibility path).
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from src.models import Test
+
+from .context import TrackedContext
+
+
+# Accesses of one test: {"reads": [...], "writes": [...]}
+TestAccess = Dict[str, List[str]]
+
+
+class DependencyGraph:
+    """
+    Per-category record of context accesses, with the dependency edges derived from it.
+
+    Usage:
+        graph = DependencyGraph.load(category_path)
+        graph.record(tracked_context)
+        graph.save()
+        graph.depends_on("delete_matter")   # {"create_matter"}
+    """
+
+    DEFAULT_DIR = Path(".context") / "dependencies"
+
+    def __init__(
+        self,
+        category: str,
+        tests: Optional[Dict[str, TestAccess]] = None,
+        order: Optional[List[str]] = None,
+        graph_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize the graph.
+
+        Args:
+            category: Category path (e.g. "clients" or "clients/notes")
+            tests: Accesses per test name, as stored in the JSON file
+            order: Test names in execution order (edges only point forward in this order)
+            graph_dir: Directory for graph files (default: .context/dependencies/)
+        """
+        self.category = category
+        self.tests: Dict[str, TestAccess] = tests or {}
+        self.order: List[str] = order or list(self.tests)
+        self.graph_dir = Path(graph_dir or self.DEFAULT_DIR)
+
+    @classmethod
+    def path_for(cls, category: str, graph_dir: Optional[Path] = None) -> Path:
+        """File the graph of a category is stored in."""
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "__", category.strip("/"))
+        return Path(graph_dir or cls.DEFAULT_DIR) / f"{safe}.json"
+
+    @classmethod
+    def load(cls, category: str, graph_dir: Optional[Path] = None) -> "DependencyGraph":
+        """Load the stored graph of a category (empty graph if none or unreadable)."""
+        path = cls.path_for(category, graph_dir)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(category, tests=data.get("tests") or {}, order=data.get("order"), graph_dir=graph_dir)
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return cls(category, graph_dir=graph_dir)
+
+    def record(self, context: TrackedContext) -> None:
+        """
+        Merge the accesses recorded in a tracked context into the graph.
+
+        Tests that did not run this time (e.g. skipped after a failure) keep their previous
+        record and position. Runner-seeded keys are dropped.
+
+        Args:
+            context: TrackedContext used for the category (accesses are in run order)
+        """
+        for test_name, access in context.accesses.items():
+            self.tests[test_name] = {
+                "reads": sorted(k for k in access["reads"] if k not in context.seeded_keys),
+                "writes": sorted(k for k in access["writes"] if k not in context.seeded_keys),
+            }
+        ran = list(context.accesses)
+        previous = [name for name in self.order if name in self.tests and name not in ran]
+        # Keep tests that did not run at their previous position relative to the ones that did
+        order: List[str] = []
+        for name in ran:
+            if name in self.order:
+                for earlier in self.order[: self.order.index(name)]:
+                    if earlier in previous and earlier not in order:
+                        order.append(earlier)
+            order.append(name)
+        self.order = order + [name for name in previous if name not in order]
+
+    def knows(self, test_name: str) -> bool:
+        """True if the test's accesses have been recorded at least once."""
+        return test_name in self.tests
+
+    def edges(self) -> List[Dict[str, str]]:
+        """
+        Dependency edges in execution order.
+
+        Returns:
+            List of {"from", "to", "key", "kind"} (kind: raw, war or waw)
+        """
+        edges = []
+        for j, later in enumerate(self.order):
+            later_access = self.tests.get(later, {})
+            later_reads = set(later_access.get("reads", []))
+            later_writes = set(later_access.get("writes", []))
+            for earlier in self.order[:j]:
+                earlier_access = self.tests.get(earlier, {})
+                earlier_reads = set(earlier_access.get("reads", []))
+                earlier_writes = set(earlier_access.get("writes", []))
+                for key in sorted(earlier_writes & later_reads):
+                    edges.append({"from": earlier, "to": later, "key": key, "kind": "raw"})
+                for key in sorted(earlier_reads & later_writes):
+                    edges.append({"from": earlier, "to": later, "key": key, "kind": "war"})
+                for key in sorted((earlier_writes & later_writes) - later_reads):
+                    edges.append({"from": earlier, "to": later, "key": key, "kind": "waw"})
+        return edges
+
+    def depends_on(self, test_name: str) -> Set[str]:
+        """Names of earlier tests that test_name must run after."""
+        return {e["from"] for e in self.edges() if e["to"] == test_name}
+
+    def independent(self, test_a: str, test_b: str) -> bool:
+        """True if both tests are recorded and no edge connects them in either direction."""
+        if not (self.knows(test_a) and self.knows(test_b)):
+            return False
+        return not any({e["from"], e["to"]} == {test_a, test_b} for e in self.edges())
+
+    def layers(self) -> List[List[str]]:
+        """
+        Group tests into layers: every test depends only on tests in earlier layers.
+
+        Tests in the same layer have no data dependency and can run at the same time.
+        """
+        depth: Dict[str, int] = {}
+        edges = self.edges()
+        for name in self.order:
+            parents = [e["from"] for e in edges if e["to"] == name]
+            depth[name] = 1 + max((depth[p] for p in parents), default=-1)
+        layers: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name in self.order:
+            layers[depth[name]].append(name)
+        return layers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (what save() writes)."""
+        return {
+            "category": self.category,
+            "updated_at": datetime.now().isoformat(),
+            "order": self.order,
+            "tests": self.tests,
+            "edges": self.edges(),
+            "layers": self.layers(),
+        }
+
+    def save(self) -> Path:
+        """Write the graph to .context/dependencies/<category>.json."""
+        path = self.path_for(self.category, self.graph_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def group_independent_tests(plan: List[Any], graph: DependencyGraph) -> List[List[Any]]:
+    """
+    Split an execution plan into groups that may run concurrently.
+
+    Consecutive tests join the same group while none of them depends on another (per the
+    graph). Subcategories and tests the graph has not seen yet always run alone, so the
+    plan order is kept wherever independence is not proven.
+
+    Returns:
+        List of groups (lists of plan items) in execution order
+    """
+    groups: List[List[Any]] = []
+    for item in plan:
+        current = groups[-1] if groups else None
+        if (
+            current is not None
+            and isinstance(item, Test)
+            and all(isinstance(other, Test) for other in current)
+            and all(graph.independent(other.name, item.name) for other in current)
+        ):
+            current.append(item)
+        else:
+            groups.append([item])
+    return groups
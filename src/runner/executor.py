@@ -5,17 +5,149 @@ Handles the actual execution of individual test.py files,
 including dynamic import, function discovery, and error handling.
 """
 
+import hashlib
 import importlib.util
+import re
 import sys
+import threading
 import time
 import traceback
-from datetime import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, Any, Optional, Tuple, Literal
+from types import CodeType, ModuleType
+from typing import Callable, Dict, Any, List, Optional, Tuple, Literal
 
 from playwright.sync_api import Page
 
 from .models import TestResult
+from .profiler import CallProfiler
+
+
+# Prefix of the sys.modules names given to imported test.py files
+TEST_MODULE_PREFIX = "test_module_"
+
+
+@dataclass
+class _CachedModule:
+    """One imported test.py file."""
+    mtime_ns: int
+    size: int
+    digest: str
+    module_name: str
+    code: CodeType
+    module: ModuleType
+    functions: Dict[str, Callable] = field(default_factory=dict)  # test_type -> resolved function
+
+
+class ModuleCache:
+    """
+    Process-wide cache of imported test.py modules, keyed by file path.
+    
+    A file is compiled and executed once and kept under a stable module name
+    (test_module_<folder>_<path hash>). Later loads reuse the module and the function
+    resolved for each test type. An entry is replaced when the file's mtime or size
+    changes and its SHA-256 differs (a touch without changes keeps the entry); the old
+    module is removed from sys.modules.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, _CachedModule] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, test_file: Path) -> _CachedModule:
+        """
+        Return the cached module for test_file, importing (or re-importing) it if needed.
+        
+        Raises:
+            Whatever compiling or executing the module raises (nothing is cached then)
+        """
+        key = str(test_file.resolve())
+        with self._lock:
+            stat = test_file.stat()
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self.hits += 1
+                return entry
+            source = test_file.read_bytes()
+            digest = hashlib.sha256(source).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self.hits += 1
+                return entry
+            self.misses += 1
+            if entry is not None:
+                self.evict(test_file)
+            entry = self._import(test_file, key, source, digest, stat.st_mtime_ns, stat.st_size)
+            self._entries[key] = entry
+            return entry
+    
+    def _import(self, test_file: Path, key: str, source: bytes, digest: str, mtime_ns: int, size: int) -> _CachedModule:
+        """Compile and execute test_file as a new module (registered in sys.modules)."""
+        folder = re.sub(r"\W", "_", test_file.parent.name)
+        module_name = f"{TEST_MODULE_PREFIX}{folder}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]}"
+        spec = importlib.util.spec_from_file_location(module_name, test_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load module spec for {test_file}")
+        module = importlib.util.module_from_spec(spec)
+        code = compile(source, str(test_file), "exec")
+        
+        # Add module to sys.modules before executing (for imports within the module)
+        sys.modules[module_name] = module
+        try:
+            exec(code, module.__dict__)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return _CachedModule(
+            mtime_ns=mtime_ns,
+            size=size,
+            digest=digest,
+            module_name=module_name,
+            code=code,
+            module=module,
+        )
+    
+    def evict(self, test_file: Path) -> None:
+        """Drop a file's entry and its sys.modules registration."""
+        with self._lock:
+            entry = self._entries.pop(str(test_file.resolve()), None)
+            if entry is not None:
+                sys.modules.pop(entry.module_name, None)
+    
+    def prune(self) -> int:
+        """
+        Drop entries whose file no longer exists.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            gone = [key for key in self._entries if not Path(key).exists()]
+            for key in gone:
+                sys.modules.pop(self._entries.pop(key).module_name, None)
+            return len(gone)
+    
+    def clear(self) -> None:
+        """Drop every entry (modules are re-imported on next use)."""
+        with self._lock:
+            for entry in self._entries.values():
+                sys.modules.pop(entry.module_name, None)
+            self._entries.clear()
+    
+    def module_names(self) -> List[str]:
+        """sys.modules names of the cached modules."""
+        with self._lock:
+            return [entry.module_name for entry in self._entries.values()]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every executor in the process (sys.modules is process-wide too)
+MODULE_CACHE = ModuleCache()
 
 
 class TestExecutor:
@@ -31,10 +163,12 @@ class TestExecutor:
         Initialize the executor.
         
         Args:
-            snapshots_dir: Directory to save screenshots on failure.
-                          Defaults to .temp_screenshots/ (moved to run storage after)
+            snapshots_dir: Kept for compatibility; failure screenshots are now captured
+                          in memory (TestResult.screenshot_data) and written by run storage
         """
         self.snapshots_dir = snapshots_dir or Path(".temp_screenshots")
+        # CallProfiler when profiling is on (see profiler.py)
+        self.profiler: Optional[CallProfiler] = None
     
     def execute(
         self,
@@ -55,11 +189,56 @@ class TestExecutor:
         Returns:
             TestResult with pass/fail status and details
         """
+        func, early_result = self._resolve(test_path, test_type)
+        if early_result is not None:
+            return early_result
+        
+        # Execute the test
+        profile_token = self.profiler.begin() if self.profiler else None
+        start_time = time.time()
+        
+        try:
+            func(self._test_page(page), context)
+            
+            duration_ms = int((time.time() - start_time) * 1000)
+            result = self._passed_result(test_path, test_type, duration_ms)
+        
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+            screenshot = None
+            if not self._is_skip(e):
+                # Capture screenshot on failure
+                screenshot = self._capture_screenshot(page)
+            result = self._exception_result(test_path, test_type, e, duration_ms, screenshot, context)
+        return self._with_metrics(result, profile_token)
+    
+    def _test_page(self, page: Page) -> Page:
+        """The page handed to the test: profiled when profiling is on."""
+        return self.profiler.wrap(page) if self.profiler else page
+    
+    def _with_metrics(self, result: TestResult, profile_token) -> TestResult:
+        """Attach the test's Playwright call profile to its result."""
+        if profile_token is not None:
+            result.metrics = self.profiler.end(profile_token)
+        return result
+    
+    def _resolve(
+        self,
+        test_path: Path,
+        test_type: Literal["test", "setup", "teardown"],
+    ) -> Tuple[Optional[Callable], Optional[TestResult]]:
+        """
+        Find the test function for a test folder.
+        
+        Returns:
+            Tuple of (function, None), or (None, TestResult) when the test cannot run
+            (missing test.py is skipped, import errors fail)
+        """
         test_file = test_path / "test.py"
         test_name = test_path.name
         
         if not test_file.exists():
-            return TestResult(
+            return None, TestResult(
                 test_name=test_name,
                 test_path=test_path,
                 test_type=test_type,
@@ -72,7 +251,7 @@ class TestExecutor:
         # Find the test function
         func, error = self._load_test_function(test_file, test_type)
         if error:
-            return TestResult(
+            return None, TestResult(
                 test_name=test_name,
                 test_path=test_path,
                 test_type=test_type,
@@ -81,50 +260,56 @@ class TestExecutor:
                 error=error,
                 error_type="ImportError",
             )
-        
-        # Execute the test
-        start_time = time.time()
-        screenshot_path = None
-        
-        try:
-            func(page, context)
-            
-            duration_ms = int((time.time() - start_time) * 1000)
-            return TestResult(
-                test_name=test_name,
-                test_path=test_path,
-                test_type=test_type,
-                status="passed",
-                duration_ms=duration_ms,
-            )
-        
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            # Treat [SKIP] message convention as skipped, not failed
-            if e.args and str(e.args[0]).strip().upper().startswith("[SKIP]"):
-                return TestResult(
-                    test_name=test_name,
-                    test_path=test_path,
-                    test_type=test_type,
-                    status="skipped",
-                    duration_ms=duration_ms,
-                    error=str(e).replace("[SKIP] ", "").strip(),
-                    error_type="Skipped",
-                )
-            # Capture screenshot on failure
-            screenshot_path = self._capture_screenshot(page, test_name)
-            error_msg = f"{type(e).__name__}: {str(e)}"
+        return func, None
+    
+    def _passed_result(self, test_path: Path, test_type: str, duration_ms: int) -> TestResult:
+        """TestResult for a test function that returned normally."""
+        return TestResult(
+            test_name=test_path.name,
+            test_path=test_path,
+            test_type=test_type,
+            status="passed",
+            duration_ms=duration_ms,
+        )
+    
+    @staticmethod
+    def _is_skip(error: Exception) -> bool:
+        """True if the exception follows the [SKIP] message convention."""
+        return bool(error.args) and str(error.args[0]).strip().upper().startswith("[SKIP]")
+    
+    def _exception_result(
+        self,
+        test_path: Path,
+        test_type: str,
+        error: Exception,
+        duration_ms: int,
+        screenshot: Optional[bytes],
+        context: Dict[str, Any],
+    ) -> TestResult:
+        """TestResult for a test function that raised (skipped or failed)."""
+        # Treat [SKIP] message convention as skipped, not failed
+        if self._is_skip(error):
             return TestResult(
-                test_name=test_name,
+                test_name=test_path.name,
                 test_path=test_path,
                 test_type=test_type,
-                status="failed",
+                status="skipped",
                 duration_ms=duration_ms,
-                error=error_msg,
-                error_type=type(e).__name__,
-                screenshot=screenshot_path,
-                context_snapshot=context.copy() if context else None,
+                error=str(error).replace("[SKIP] ", "").strip(),
+                error_type="Skipped",
             )
+        error_msg = f"{type(error).__name__}: {str(error)}"
+        return TestResult(
+            test_name=test_path.name,
+            test_path=test_path,
+            test_type=test_type,
+            status="failed",
+            duration_ms=duration_ms,
+            error=error_msg,
+            error_type=type(error).__name__,
+            screenshot_data=screenshot,
+            context_snapshot=context.copy() if context else None,
+        )
     
     def _load_test_function(
         self,
@@ -140,6 +325,9 @@ class TestExecutor:
         - teardown_*: For teardown functions
         - fn_*: For function tests (e.g., fn_login)
         
+        Modules come from MODULE_CACHE: each file is imported once and re-imported
+        only when its content changes; the resolved function is cached per test type.
+        
         Args:
             test_file: Path to test.py
             test_type: Type of test to look for
@@ -147,97 +335,83 @@ class TestExecutor:
         Returns:
             Tuple of (function, error_message)
         """
+        # Add parent directories to path for imports (once per process)
+        parent_paths = [
+            str(test_file.parent),
+            str(test_file.parent.parent),
+            str(test_file.parent.parent.parent),
+        ]
+        for p in parent_paths:
+            if p not in sys.path:
+                sys.path.insert(0, p)
+        
         try:
-            # Generate unique module name to avoid caching issues
-            import time as time_module
-            module_name = f"test_module_{test_file.parent.name}_{int(time_module.time() * 1000)}"
-            
-            # Load the module
-            spec = importlib.util.spec_from_file_location(
-                module_name,
-                test_file
-            )
-            if spec is None or spec.loader is None:
-                return None, f"Could not load module spec for {test_file}"
-            
-            module = importlib.util.module_from_spec(spec)
-            
-            # Add parent directories to path for imports
-            parent_paths = [
-                str(test_file.parent),
-                str(test_file.parent.parent),
-                str(test_file.parent.parent.parent),
-            ]
-            for p in parent_paths:
-                if p not in sys.path:
-                    sys.path.insert(0, p)
-            
-            # Add module to sys.modules before executing (for imports within the module)
-            sys.modules[module_name] = module
-            
-            spec.loader.exec_module(module)
-            
-            # Find the appropriate function
-            # Priority: exact match first, then fallback to fn_ for functions
-            prefixes = {
-                "test": ["test_"],
-                "setup": ["setup_"],
-                "teardown": ["teardown_"],
-            }
-            
-            search_prefixes = prefixes.get(test_type, ["test_"])
-            
-            # First pass: look for exact prefix match
-            for name in dir(module):
-                for prefix in search_prefixes:
-                    if name.startswith(prefix):
-                        func = getattr(module, name)
-                        if callable(func):
-                            return func, None
-            
-            # Second pass: for functions folder, look for fn_ prefix
-            # This is only used when running functions directly, not for setup/teardown
-            if test_type == "test":
-                for name in dir(module):
-                    if name.startswith("fn_"):
-                        func = getattr(module, name)
-                        if callable(func):
-                            return func, None
-            
-            # No function found
-            available = [n for n in dir(module) if not n.startswith("_")]
-            return None, f"No {test_type} function found in {test_file}. Available: {available[:10]}"
-            
+            entry = MODULE_CACHE.get(test_file)
         except Exception as e:
             return None, f"Error loading {test_file}: {type(e).__name__}: {str(e)}"
+        
+        func = entry.functions.get(test_type)
+        if func is not None:
+            return func, None
+        func, error = self._find_function(entry.module, test_file, test_type)
+        if func is not None:
+            entry.functions[test_type] = func
+        return func, error
+    
+    def _find_function(
+        self,
+        module: ModuleType,
+        test_file: Path,
+        test_type: Literal["test", "setup", "teardown"],
+    ) -> Tuple[Optional[Callable], Optional[str]]:
+        """Find the test function in an imported module (see _load_test_function for the rules)."""
+        # Find the appropriate function
+        # Priority: exact match first, then fallback to fn_ for functions
+        prefixes = {
+            "test": ["test_"],
+            "setup": ["setup_"],
+            "teardown": ["teardown_"],
+        }
+        
+        search_prefixes = prefixes.get(test_type, ["test_"])
+        
+        # First pass: look for exact prefix match
+        for name in dir(module):
+            for prefix in search_prefixes:
+                if name.startswith(prefix):
+                    func = getattr(module, name)
+                    if callable(func):
+                        return func, None
+        
+        # Second pass: for functions folder, look for fn_ prefix
+        # This is only used when running functions directly, not for setup/teardown
+        if test_type == "test":
+            for name in dir(module):
+                if name.startswith("fn_"):
+                    func = getattr(module, name)
+                    if callable(func):
+                        return func, None
+        
+        # No function found
+        available = [n for n in dir(module) if not n.startswith("_")]
+        return None, f"No {test_type} function found in {test_file}. Available: {available[:10]}"
     
-    def _capture_screenshot(self, page: Page, test_name: str) -> Optional[Path]:
+    def _capture_screenshot(self, page: Page) -> Optional[bytes]:
         """
         Capture a screenshot on test failure.
         
+        The PNG stays in memory; run storage writes it to the test's run dir in the background.
+        
         Args:
             page: Playwright page
-            test_name: Name of the test (for filename)
             
         Returns:
-            Path to screenshot file, or None if capture failed
+            PNG bytes, or None if capture failed
         """
         try:
-            # Use absolute path to ensure correct location
-            abs_snapshots_dir = Path.cwd() / self.snapshots_dir
-            abs_snapshots_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = abs_snapshots_dir / f"{test_name}_{timestamp}.png"
-            print(f"  [Screenshot] Capturing to: {screenshot_path}")
-            page.screenshot(path=str(screenshot_path))
-            # Verify the file was actually saved
-            if screenshot_path.exists():
-                print(f"  [Screenshot] Saved successfully ({screenshot_path.stat().st_size} bytes)")
-                # Return relative path for heal request
-                return self.snapshots_dir / f"{test_name}_{timestamp}.png"
-            else:
-                print(f"  [Screenshot] WARNING: File not found after save!")
-                return None
+            data = page.screenshot()
+            print(f"  [Screenshot] Captured ({len(data)} bytes)")
+            return data
         except Exception as e:
             print(f"  [Screenshot] FAILED to capture: {type(e).__name__}: {e}")
             return None
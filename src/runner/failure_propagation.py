@@ -0,0 +1,353 @@
+"""
+Dependency-aware skipping after a failure.
+
+Tests of a category exchange data through the shared context: create_matter saves
+created_matter_id, edit_matter and the notes subcategory read it. When a test fails, only
+the tests that need what it (or a test skipped because of it) should have saved are
+skipped; the runner keeps going with the rest instead of abandoning the category.
+
+What a test reads and saves is taken from three sources, merged:
+- the category's dependency graph (keys recorded in earlier runs, see dependency_graph.py)
+- the "Reads from context:" / "Saves to context:" sections of the test.py docstrings, and
+  the "(context: key)" notes of its "Prerequisites:" section
+- a static scan of test.py for context["key"], context.get("key"), "key" in context, ...
+
+A prerequisite like "Browser is on event detail page (from view_event or add_attendee test)"
+is a dependency on the page those tests leave: the test is skipped once all of them failed
+or were skipped.
+
+A test whose reads are unknown (none recorded, declared or found by the scan, unless its
+docstring says "Reads from context: None") is skipped conservatively, and so is everything
+after a failed test whose writes are unknown. Setups are barriers: a failed _setup still
+skips its whole category, since it prepares browser state (login, navigation) that is not in
+the context.
+
+execution.skip_on_failure: all restores the previous behavior (skip everything after the
+first failure).
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .dependency_graph import DependencyGraph
+
+
+SKIP_DEPENDENTS = "dependents"
+SKIP_ALL = "all"
+
+_SECTION_RE = re.compile(r"^\s*(Reads from context|Saves to context)\s*:\s*(.*)$", re.IGNORECASE)
+_HEADER_RE = re.compile(r"^\s*[A-Z][A-Za-z /()-]*:\s*$")
+_ITEM_RE = re.compile(r"^\s*[-*]\s*(?:context\[['\"])?`?([A-Za-z_][A-Za-z0-9_]*)")
+_NONE_WORDS = {"none", "nothing", "n/a", "-"}
+_PREREQUISITES_RE = re.compile(r"^\s*Prerequisites\s*:", re.IGNORECASE)
+_CONTEXT_NOTE_RE = re.compile(r"\(context:\s*([^)]*)\)", re.IGNORECASE)
+_FROM_TEST_RE = re.compile(r"\(from\s+([^)]*?)\s+tests?\)", re.IGNORECASE)
+
+
+@dataclass
+class ContextContract:
+    """Context keys a test reads and saves; *_known is False when a source could not tell."""
+
+    reads: Set[str] = field(default_factory=set)
+    writes: Set[str] = field(default_factory=set)
+    reads_known: bool = False
+    writes_known: bool = False
+    # Browser state prerequisites: each set names tests any one of which leaves the page needed
+    after: List[Set[str]] = field(default_factory=list)
+
+
+def test_key(name: str) -> str:
+    """Comparable test name: "Events/View Event", "view_event" and "View Event" match."""
+    return re.sub(r"[\s_-]+", "_", name.split("/")[-1].strip().lower())
+
+
+def _docstrings(source: str) -> Optional[List[str]]:
+    """Module and function docstrings of test.py source (None if it does not parse)."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    docstrings = [ast.get_docstring(tree)] + [
+        ast.get_docstring(node) for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    return [doc for doc in docstrings if doc]
+
+
+def parse_docstring_contract(source: str) -> Tuple[Optional[Set[str]], Optional[Set[str]]]:
+    """
+    Read the "Reads from context:" and "Saves to context:" sections of a test module's docstrings.
+
+    Returns:
+        Tuple of (reads, writes); None for a section no docstring declares
+    """
+    docstrings = _docstrings(source)
+    if docstrings is None:
+        return None, None
+    sections: Dict[str, Set[str]] = {}
+    for doc in docstrings:
+        current = None
+        for line in doc.splitlines():
+            match = _SECTION_RE.match(line)
+            if match:
+                current = "reads" if match.group(1).lower().startswith("reads") else "writes"
+                keys = sections.setdefault(current, set())
+                inline = match.group(2).strip().rstrip(".")
+                if inline and inline.lower() not in _NONE_WORDS:
+                    keys.update(k.strip(" `") for k in inline.split(",") if k.strip(" `"))
+                continue
+            if current is None:
+                continue
+            if not line.strip() or _HEADER_RE.match(line):
+                current = None
+                continue
+            item = _ITEM_RE.match(line)
+            if item and item.group(1).lower() not in _NONE_WORDS:
+                sections[current].add(item.group(1))
+    return sections.get("reads"), sections.get("writes")
+
+
+def parse_prerequisites(source: str) -> Tuple[Set[str], List[Set[str]]]:
+    """
+    Read the "Prerequisites:" section of a test module's docstrings.
+
+    "- A scheduled event exists (context: scheduled_event_id)" declares a context read;
+    "- Browser is on event detail page (from view_event or add_attendee test)" a page
+    dependency on any of those tests ("(from _setup)" is not one: setups are barriers).
+
+    Returns:
+        Tuple of (context reads, page dependencies as sets of test_key() names)
+    """
+    reads: Set[str] = set()
+    after: List[Set[str]] = []
+    for doc in _docstrings(source) or []:
+        in_section = False
+        for line in doc.splitlines():
+            if _PREREQUISITES_RE.match(line):
+                in_section = True
+                continue
+            if not in_section:
+                continue
+            if not line.strip() or _HEADER_RE.match(line):
+                in_section = False
+                continue
+            for note in _CONTEXT_NOTE_RE.findall(line):
+                reads.update(k.strip(" `") for k in note.split(",") if k.strip(" `"))
+            for names in _FROM_TEST_RE.findall(line):
+                tests = {test_key(n) for n in re.split(r",|\s+or\s+|\s+and\s+", names) if n.strip()}
+                if tests:
+                    after.append(tests)
+    return reads, after
+
+
+class _ContextScanner(ast.NodeVisitor):
+    """Collects constant context keys used by a module; complete=False when it meets something opaque."""
+
+    READ_METHODS = {"get", "__getitem__", "__contains__"}
+    WRITE_METHODS = {"__setitem__", "update"}
+    READ_WRITE_METHODS = {"pop", "setdefault"}
+
+    def __init__(self, name: str = "context"):
+        self.name = name
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+        self.complete = True
+        self._handled: Set[int] = set()
+
+    def _is_context(self, node: ast.AST) -> bool:
+        return isinstance(node, ast.Name) and node.id == self.name
+
+    @staticmethod
+    def _key(node: ast.AST) -> Optional[str]:
+        return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        if self._is_context(node.value):
+            self._handled.add(id(node.value))
+            key = self._key(node.slice)
+            if key is None:
+                self.complete = False
+            elif isinstance(node.ctx, ast.Load):
+                self.reads.add(key)
+            else:
+                self.writes.add(key)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Attribute) and self._is_context(func.value):
+            self._handled.add(id(func.value))
+            method = func.attr
+            if method == "update":
+                arg = node.args[0] if node.args else None
+                if isinstance(arg, ast.Dict) and all(self._key(k) for k in arg.keys):
+                    self.writes.update(self._key(k) for k in arg.keys)
+                elif arg is not None:
+                    self.complete = False
+                self.writes.update(kw.arg for kw in node.keywords if kw.arg)
+            elif method in self.READ_METHODS | self.READ_WRITE_METHODS | self.WRITE_METHODS:
+                key = self._key(node.args[0]) if node.args else None
+                if key is None:
+                    self.complete = False
+                else:
+                    if method in self.READ_METHODS | self.READ_WRITE_METHODS:
+                        self.reads.add(key)
+                    if method in self.WRITE_METHODS | self.READ_WRITE_METHODS:
+                        self.writes.add(key)
+            elif method not in ("items", "keys", "values", "copy"):
+                self.complete = False
+        self.generic_visit(node)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        # "key" in context / "key" not in context
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)) and self._is_context(right):
+                self._handled.add(id(right))
+                key = self._key(node.left)
+                if key is None:
+                    self.complete = False
+                else:
+                    self.reads.add(key)
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        # Any other use (passed to a helper, aliased, iterated) may touch keys we cannot see
+        if node.id == self.name and id(node) not in self._handled and isinstance(node.ctx, ast.Load):
+            self.complete = False
+
+
+def scan_context_usage(source: str) -> Tuple[Set[str], Set[str], bool]:
+    """
+    Statically scan test.py source for the context keys it reads and writes.
+
+    Returns:
+        Tuple of (reads, writes, complete); complete is False when the module passes the
+        context to helpers (fn_* functions) or uses non-constant keys
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set(), set(), False
+    scanner = _ContextScanner()
+    scanner.visit(tree)
+    return scanner.reads, scanner.writes, scanner.complete
+
+
+class FailurePropagation:
+    """
+    Decides which tests a failure affects while a category runs.
+
+    Usage:
+        propagation = FailurePropagation(DependencyGraph.load(category_path))
+        reason = propagation.blocker(test_name, test_path)   # None = run the test
+        if reason: ...skip...; propagation.skipped(test_name, test_path)
+        ...
+        if result.status == "failed": propagation.failed(test_name, test_path)
+    """
+
+    def __init__(self, graph: Optional[DependencyGraph] = None, mode: str = SKIP_DEPENDENTS):
+        """
+        Initialize for one category run.
+
+        Args:
+            graph: The category's recorded dependency graph (optional)
+            mode: "dependents" (skip only tests that need a failed test's data) or "all"
+        """
+        self.graph = graph
+        self.mode = mode if mode in (SKIP_DEPENDENTS, SKIP_ALL) else SKIP_DEPENDENTS
+        # Context keys that may be missing or stale -> test whose failure caused it
+        self.missing: Dict[str, str] = {}
+        # Set when everything after this test must be skipped
+        self.blocked_by: Optional[str] = None
+        # test_key() of failed and skipped tests -> test whose failure caused it
+        self.down: Dict[str, str] = {}
+        self.first_failure: Optional[str] = None
+        self._contracts: Dict[Tuple[str, str], ContextContract] = {}
+
+    @property
+    def active(self) -> bool:
+        """True once a test failed in this category."""
+        return self.first_failure is not None
+
+    def contract(self, test_name: str, test_path: Path) -> ContextContract:
+        """What a test reads from and saves to the context (cached)."""
+        cache_key = (test_name, str(test_path))
+        if cache_key in self._contracts:
+            return self._contracts[cache_key]
+        contract = ContextContract()
+        if self.graph is not None and self.graph.knows(test_name):
+            access = self.graph.tests[test_name]
+            contract.reads.update(access.get("reads", []))
+            contract.writes.update(access.get("writes", []))
+            contract.reads_known = contract.writes_known = True
+        try:
+            source = (Path(test_path) / "test.py").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            source = None
+        if source is not None:
+            declared_reads, declared_writes = parse_docstring_contract(source)
+            prerequisite_reads, contract.after = parse_prerequisites(source)
+            scanned_reads, scanned_writes, complete = scan_context_usage(source)
+            contract.reads |= (declared_reads or set()) | prerequisite_reads | scanned_reads
+            contract.writes |= (declared_writes or set()) | scanned_writes
+            contract.reads_known = contract.reads_known or declared_reads is not None or complete
+            contract.writes_known = contract.writes_known or declared_writes is not None or complete
+            if not contract.reads and declared_reads is None:
+                # Nothing recorded, declared or found: "reads nothing" is not known, only assumed
+                contract.reads_known = False
+        elif not contract.reads:
+            contract.reads_known = False
+        self._contracts[cache_key] = contract
+        return contract
+
+    def blocker(self, test_name: str, test_path: Path) -> Optional[str]:
+        """
+        Why a test must be skipped, or None if it can run.
+
+        Returns:
+            Skip reason, e.g. "Skipped due to Create Matter failure (needs created_matter_id)"
+        """
+        if not self.active:
+            return None
+        if self.blocked_by:
+            return f"Skipped due to {self.blocked_by} failure"
+        contract = self.contract(test_name, test_path)
+        for tests in contract.after:
+            if all(name in self.down for name in tests):
+                name = sorted(tests)[0]
+                return f"Skipped due to {self.down[name]} failure (needs the page left by {name})"
+        if not contract.reads_known:
+            return f"Skipped due to {self.first_failure} failure (context reads unknown)"
+        needed = sorted(contract.reads & set(self.missing))
+        if needed:
+            return f"Skipped due to {self.missing[needed[0]]} failure (needs {', '.join(needed)})"
+        return None
+
+    def failed(self, test_name: str, test_path: Path) -> None:
+        """Record a failed test: what it should have saved is now missing."""
+        if self.first_failure is None:
+            self.first_failure = test_name
+        self._mark_missing(test_name, test_path, test_name)
+
+    def skipped(self, test_name: str, test_path: Path, cause: Optional[str] = None) -> None:
+        """Record a test skipped because of a failure: what it would have saved is missing too."""
+        self._mark_missing(test_name, test_path, cause or self.first_failure or test_name)
+
+    def _mark_missing(self, test_name: str, test_path: Path, cause: str) -> None:
+        for name in (test_name, Path(test_path).name):
+            self.down.setdefault(test_key(name), cause)
+        contract = self.contract(test_name, test_path)
+        if self.mode == SKIP_ALL or not contract.writes_known:
+            self.blocked_by = self.blocked_by or cause
+            return
+        for key in contract.writes:
+            self.missing.setdefault(key, cause)
+
+
+def skip_mode_from_config(config: Optional[dict]) -> str:
+    """execution.skip_on_failure from config.yaml ("dependents" by default)."""
+    return str(((config or {}).get("execution") or {}).get("skip_on_failure", SKIP_DEPENDENTS)).lower()
+
@@ -7,7 +7,7 @@ needed for Cursor to fix the test.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import json
 
 from .models import TestResult
@@ -60,8 +60,30 @@ class HealRequestGenerator:
         Returns:
             Path to the generated heal request file
         """
-        self.heal_requests_dir.mkdir(parents=True, exist_ok=True)
+        file_path, content = self.build(result, category_name, context, additional_info, config)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
         
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        
+        return file_path
+    
+    def build(
+        self,
+        result: TestResult,
+        category_name: str,
+        context: Dict[str, Any],
+        additional_info: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Path, str]:
+        """
+        Build a heal request without writing it (the runner hands it to run storage's writer).
+        
+        Args: same as generate()
+            
+        Returns:
+            Tuple of (path in heal_requests_dir, markdown content)
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         # Keep filename flat: no slashes (subcategory/test_name could be "Events/Schedule Event")
         safe_name = result.test_name.replace("/", "-")
@@ -69,11 +91,7 @@ class HealRequestGenerator:
         file_path = self.heal_requests_dir / filename
         
         content = self._build_content(result, category_name, context, additional_info, config)
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        return file_path
+        return file_path, content
     
     def _build_content(
         self,
@@ -151,6 +169,18 @@ class HealRequestGenerator:
                 "",
             ])
         
+        # Trace reference (execution.trace_on_failure)
+        if result.trace:
+            lines.extend([
+                "## Trace",
+                "",
+                f"Playwright trace saved at: `{result.trace}`",
+                "",
+                "It has the DOM snapshot, screenshot, network and console output of every action in this test. "
+                f"Open it with `playwright show-trace \"{result.trace}\"` to see the page before and after the failing step.",
+                "",
+            ])
+        
         # Brief context summary (just keys, not full values)
         if context:
             # Filter out internal metadata
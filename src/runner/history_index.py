@@ -0,0 +1,610 @@
+"""
+SQLite index of the run history.
+
+The JSON files under tests/**/_runs/ and runs_index/ stay the archival format, but the GUI's
+history queries (RunStorage.list_all_runs, list_category_runs, list_test_runs,
+get_all_last_results, get_run_details) used to walk every _runs/ directory and parse every
+run.json and result.json on each request, so they got slower with every run kept.
+
+RunStorage now also records what it saves in runs_index/history.sqlite:
+- runs: one row per runs_index/<run_id>.json (finalize_run)
+- category_runs: one row per _runs/<run_id>/run.json (save_category_result), and
+  category_run_tests: its test_results entries (older runs have no per-test result.json)
+- test_results: one row per _runs/<run_id>/tests/<test>/result.json (save_test_result),
+  with its screenshot/trace/heal request paths
+- latest_results: the newest status of every test, keyed like the GUI tree
+  ("clients/notes/add_note", "clients/_setup"); each saved result upserts its row, so
+  /api/last-results reads one small table (cached in memory by latest_results()) instead
+  of the newest run of every category plus a test discovery scan
+
+and answers the queries from it. Rows are removed with the run dirs and index files
+cleanup deletes. rebuild() backfills the index from the JSON files; it runs automatically
+the first time a query finds the index empty, and `python main.py rebuild_index` runs it on
+demand (e.g. after copying run dirs in by hand).
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .screenshots import find_screenshot
+
+
+RUNS_DIR_NAME = "_runs"
+HISTORY_FILE_NAME = "history.sqlite"
+# Bumped when a table is added, so indexes built by an older version are rebuilt once
+SCHEMA_VERSION = "2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS category_runs (
+    run_id TEXT NOT NULL,
+    category_path TEXT NOT NULL COLLATE NOCASE,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, category_path)
+);
+CREATE INDEX IF NOT EXISTS category_runs_category ON category_runs (category_path, run_id);
+CREATE TABLE IF NOT EXISTS category_run_tests (
+    run_id TEXT NOT NULL,
+    category_path TEXT NOT NULL COLLATE NOCASE,
+    name_key TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS category_run_tests_name ON category_run_tests (name_key, run_id);
+CREATE INDEX IF NOT EXISTS category_run_tests_run ON category_run_tests (run_id, category_path);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id TEXT NOT NULL,
+    category_path TEXT NOT NULL COLLATE NOCASE,
+    test_dir TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    status TEXT,
+    data TEXT,
+    screenshot TEXT,
+    trace TEXT,
+    heal_request TEXT,
+    PRIMARY KEY (run_id, category_path, test_dir)
+);
+CREATE INDEX IF NOT EXISTS test_results_name ON test_results (name_key, run_id);
+CREATE INDEX IF NOT EXISTS test_results_category ON test_results (category_path, run_id);
+CREATE INDEX IF NOT EXISTS test_results_status ON test_results (status);
+CREATE TABLE IF NOT EXISTS latest_results (
+    path_key TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    category_path TEXT NOT NULL COLLATE NOCASE,
+    test_dir TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+"""
+
+_STATUSES = ("passed", "failed", "skipped")
+
+
+def name_key(test_name: str) -> str:
+    """Lookup key of a test name: "Create Service", "create_service" and "Services/Create Service" match."""
+    return test_name.split("/")[-1].replace(" ", "").replace("_", "").lower()
+
+
+def normalize_category(category: str) -> str:
+    """Category path as stored ("scheduling/appointments", forward slashes)."""
+    return category.replace("\\", "/").strip("/")
+
+
+def tree_key(test_path: Any, tests_root: Path) -> Optional[str]:
+    """
+    GUI tree key of a test folder: its path below tests_root ("clients/notes/add_note").
+
+    Paths recorded on another machine (absolute, Windows separators) are matched on the
+    tests_root folder name. Returns None when the path is not below tests_root.
+    """
+    if not test_path:
+        return None
+    try:
+        key = Path(test_path).relative_to(tests_root).as_posix()
+    except ValueError:
+        parts = [part for part in re.split(r"[\\/]", str(test_path)) if part]
+        lowered = [part.lower() for part in parts]
+        root_name = tests_root.name.lower()
+        if root_name not in lowered:
+            return None
+        start = len(lowered) - lowered[::-1].index(root_name)
+        key = "/".join(parts[start:])
+    return key if key and key != "." else None
+
+
+class HistoryIndex:
+    """
+    Run history tables in one SQLite file.
+
+    Usage:
+        history = HistoryIndex(index_dir / HISTORY_FILE_NAME)
+        history.record_test(run_id, "clients/notes", "Add Note", result_data)
+        ...
+        if not history.is_built():
+            history.rebuild(tests_root, index_dir)
+        runs = history.list_all_runs()
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the index (the file is created on first use).
+
+        Args:
+            path: SQLite file (runs_index/history.sqlite)
+        """
+        self.path = Path(path)
+        self._initialized = False
+        # latest_results() cache: a read connection kept open, and the data_version it saw
+        self._cache_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._latest: Optional[Dict[str, str]] = None
+        self._latest_version: Optional[int] = None
+
+    @contextmanager
+    def _connect(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Connection in one transaction (IMMEDIATE takes the write lock up front)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    # ---- Writes (called by RunStorage as it saves) ----
+
+    @staticmethod
+    def _upsert_test(
+        conn: sqlite3.Connection,
+        run_id: str,
+        category: str,
+        test_dir: str,
+        data: Dict[str, Any],
+        artifacts: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        artifacts = artifacts if artifacts is not None else data
+        conn.execute(
+            "INSERT INTO test_results (run_id, category_path, test_dir, name_key, status, data, screenshot, trace) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (run_id, category_path, test_dir) DO UPDATE SET "
+            "status = excluded.status, data = excluded.data, screenshot = excluded.screenshot, trace = excluded.trace",
+            (
+                run_id, normalize_category(category), test_dir, name_key(test_dir), data.get("status"),
+                json.dumps(data), artifacts.get("screenshot"), artifacts.get("trace"),
+            ),
+        )
+
+    @staticmethod
+    def _upsert_latest(
+        conn: sqlite3.Connection,
+        path_key: Optional[str],
+        run_id: str,
+        category: str,
+        test_dir: str,
+        status: Optional[str],
+        same_run: bool = True,
+    ) -> None:
+        """Upsert a latest_results row unless it holds a newer run (or the same run, if not same_run)."""
+        if not path_key or status not in _STATUSES:
+            return
+        conn.execute(
+            "INSERT INTO latest_results (path_key, run_id, category_path, test_dir, status) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (path_key) DO UPDATE SET run_id = excluded.run_id, category_path = excluded.category_path, "
+            "test_dir = excluded.test_dir, status = excluded.status "
+            f"WHERE excluded.run_id {'>=' if same_run else '>'} latest_results.run_id",
+            (path_key, run_id, normalize_category(category), test_dir, status),
+        )
+
+    @classmethod
+    def _upsert_latest_entries(
+        cls, conn: sqlite3.Connection, run_id: str, category: str, data: Dict[str, Any], tests_root: Path,
+    ) -> None:
+        """
+        latest_results rows of a run.json's test_results entries (tests skipped before they
+        ran have no result.json). A test's own result.json row of the same run is kept, as is
+        a subcategory's row when a parent category's run.json repeats its results.
+        """
+        for test in data.get("test_results") or []:
+            if isinstance(test, dict):
+                test_dir = Path(str(test.get("test_path") or "")).name or str(test.get("test_name") or "")
+                cls._upsert_latest(
+                    conn, tree_key(test.get("test_path"), tests_root), run_id, category, test_dir,
+                    test.get("status"), same_run=False,
+                )
+
+    @staticmethod
+    def _upsert_heal_request(conn: sqlite3.Connection, run_id: str, category: str, test_dir: str, path: str) -> None:
+        conn.execute(
+            "INSERT INTO test_results (run_id, category_path, test_dir, name_key, heal_request) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (run_id, category_path, test_dir) DO UPDATE SET heal_request = excluded.heal_request",
+            (run_id, normalize_category(category), test_dir, name_key(test_dir), path),
+        )
+
+    @staticmethod
+    def _upsert_category_run(conn: sqlite3.Connection, run_id: str, category: str, data: Dict[str, Any]) -> None:
+        category = normalize_category(category)
+        conn.execute(
+            "INSERT OR REPLACE INTO category_runs (run_id, category_path, status, data) VALUES (?, ?, ?, ?)",
+            (run_id, category, data.get("status"), json.dumps(data)),
+        )
+        conn.execute("DELETE FROM category_run_tests WHERE run_id = ? AND category_path = ?", (run_id, category))
+        conn.executemany(
+            "INSERT INTO category_run_tests (run_id, category_path, name_key, data) VALUES (?, ?, ?, ?)",
+            [
+                (run_id, category, name_key(test.get("test_name") or ""), json.dumps(test))
+                for test in data.get("test_results") or []
+                if isinstance(test, dict)
+            ],
+        )
+
+    @staticmethod
+    def _upsert_run(conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO runs (run_id, status, data) VALUES (?, ?, ?)",
+            (data["run_id"], data.get("status"), json.dumps(data)),
+        )
+
+    def record_test(
+        self,
+        run_id: str,
+        category: str,
+        test_dir: str,
+        data: Dict[str, Any],
+        path_key: Optional[str] = None,
+    ) -> None:
+        """
+        Add or update the result.json of a test (data as written, with screenshot/trace paths).
+
+        With path_key (tree_key() of its test_path), the test's latest_results row is
+        updated too, unless it already holds a newer run.
+        """
+        with self._connect(immediate=True) as conn:
+            self._upsert_test(conn, run_id, category, test_dir, data)
+            self._upsert_latest(conn, path_key, run_id, category, test_dir, data.get("status"))
+
+    def record_heal_request(self, run_id: str, category: str, test_dir: str, path: Path) -> None:
+        """Set the stored heal request of a test."""
+        with self._connect(immediate=True) as conn:
+            self._upsert_heal_request(conn, run_id, category, test_dir, str(path))
+
+    def record_category_run(
+        self, run_id: str, category: str, data: Dict[str, Any], tests_root: Optional[Path] = None,
+    ) -> None:
+        """
+        Add or replace the run.json of a category run.
+
+        With tests_root, its test_results entries also update latest_results (see record_test).
+        """
+        with self._connect(immediate=True) as conn:
+            self._upsert_category_run(conn, run_id, category, data)
+            if tests_root is not None:
+                self._upsert_latest_entries(conn, run_id, category, data, tests_root)
+
+    def record_run(self, data: Dict[str, Any]) -> None:
+        """Add or replace a runs_index entry."""
+        with self._connect(immediate=True) as conn:
+            self._upsert_run(conn, data)
+
+    def remove_category_runs(self, category: str, run_ids: Iterable[str]) -> None:
+        """
+        Forget category run dirs deleted by cleanup.
+
+        Cleanup keeps the newest runs, so latest_results rows normally point at runs that
+        remain; a row whose run is deleted is dropped (the test shows as not run).
+        """
+        category = normalize_category(category)
+        with self._connect(immediate=True) as conn:
+            for run_id in run_ids:
+                conn.execute("DELETE FROM category_runs WHERE run_id = ? AND category_path = ?", (run_id, category))
+                conn.execute("DELETE FROM category_run_tests WHERE run_id = ? AND category_path = ?", (run_id, category))
+                conn.execute("DELETE FROM test_results WHERE run_id = ? AND category_path = ?", (run_id, category))
+                conn.execute("DELETE FROM latest_results WHERE run_id = ? AND category_path = ?", (run_id, category))
+
+    def remove_runs(self, run_ids: Iterable[str]) -> None:
+        """Forget runs_index entries deleted by cleanup."""
+        with self._connect(immediate=True) as conn:
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", [(run_id,) for run_id in run_ids])
+
+    # ---- Backfill ----
+
+    def is_built(self) -> bool:
+        """True once rebuild() has backfilled the index with the current tables."""
+        with self._connect() as conn:
+            built = conn.execute("SELECT value FROM meta WHERE key = 'built_at'").fetchone()
+            version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return built is not None and version is not None and version["value"] == SCHEMA_VERSION
+
+    def rebuild(self, tests_root: Path, index_dir: Path, run_ids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Backfill the index from the JSON files.
+
+        Args:
+            tests_root: The tests/ directory (every _runs/ below it is read)
+            index_dir: The runs_index/ directory
+            run_ids: Only re-index these runs (default: replace the whole index)
+
+        Returns:
+            {"runs", "category_runs", "test_results"} rows written, and "latest_results" rows in the table
+        """
+        only = set(run_ids) if run_ids is not None else None
+        runs: List[Dict[str, Any]] = []
+        category_runs: List[tuple] = []
+        tests: List[tuple] = []
+        heal_requests: List[tuple] = []
+
+        if index_dir.exists():
+            for index_file in index_dir.glob("*.json"):
+                if only is not None and index_file.stem not in only:
+                    continue
+                data = _read_json(index_file)
+                if data and data.get("run_id"):
+                    runs.append(data)
+
+        for runs_dir, category in _runs_dirs(tests_root):
+            for run_dir in runs_dir.iterdir():
+                if not run_dir.is_dir() or (only is not None and run_dir.name not in only):
+                    continue
+                data = _read_json(run_dir / "run.json")
+                if data is not None:
+                    category_runs.append((run_dir.name, category, data))
+                tests_dir = run_dir / "tests"
+                if not tests_dir.is_dir():
+                    continue
+                for test_dir in tests_dir.iterdir():
+                    if not test_dir.is_dir():
+                        continue
+                    result = _read_json(test_dir / "result.json")
+                    if result is not None:
+                        # Index the files that are actually there (older runs kept temp paths)
+                        screenshot = find_screenshot(test_dir)
+                        trace = test_dir / "trace.zip"
+                        artifacts = {
+                            "screenshot": str(screenshot) if screenshot else None,
+                            "trace": str(trace) if trace.exists() else None,
+                        }
+                        tests.append((run_dir.name, category, test_dir.name, result, artifacts))
+                    heal_request = test_dir / "heal_request.md"
+                    if heal_request.exists():
+                        heal_requests.append((run_dir.name, category, test_dir.name, str(heal_request)))
+
+        with self._connect(immediate=True) as conn:
+            if only is None:
+                for table in ("runs", "category_runs", "category_run_tests", "test_results", "latest_results"):
+                    conn.execute(f"DELETE FROM {table}")
+            else:
+                for run_id in only:
+                    for table in ("runs", "category_runs", "category_run_tests", "test_results", "latest_results"):
+                        conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            for data in runs:
+                self._upsert_run(conn, data)
+            for run_id, category, data in category_runs:
+                self._upsert_category_run(conn, run_id, category, data)
+            for run_id, category, test_dir, data, artifacts in tests:
+                self._upsert_test(conn, run_id, category, test_dir, data, artifacts)
+            for run_id, category, test_dir, path in heal_requests:
+                self._upsert_heal_request(conn, run_id, category, test_dir, path)
+            # Newest status per tree key: result.json rows first, then run.json entries
+            for run_id, category, test_dir, data, _ in tests:
+                self._upsert_latest(
+                    conn, tree_key(data.get("test_path"), tests_root), run_id, category, test_dir, data.get("status"),
+                )
+            for run_id, category, data in category_runs:
+                self._upsert_latest_entries(conn, run_id, category, data, tests_root)
+            latest = conn.execute("SELECT COUNT(*) FROM latest_results").fetchone()[0]
+            if only is None:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [("built_at", str(time.time())), ("schema_version", SCHEMA_VERSION)],
+                )
+        return {
+            "runs": len(runs),
+            "category_runs": len(category_runs),
+            "test_results": len(tests),
+            "latest_results": latest,
+        }
+
+    # ---- Queries (same results as the RunStorage directory walks) ----
+
+    def list_all_runs(self) -> List[Dict]:
+        """runs_index entries, plus category runs of run_ids that have no entry; newest first."""
+        with self._connect() as conn:
+            index_rows = conn.execute("SELECT data FROM runs ORDER BY run_id DESC").fetchall()
+            category_rows = conn.execute(
+                "SELECT run_id, category_path, data FROM category_runs "
+                "WHERE run_id NOT IN (SELECT run_id FROM runs) ORDER BY run_id DESC"
+            ).fetchall()
+        runs = [json.loads(row["data"]) for row in index_rows]
+        for row in category_rows:
+            data = json.loads(row["data"])
+            data["run_id"] = row["run_id"]
+            data["category"] = row["category_path"].lower()
+            runs.append(data)
+        runs.sort(key=lambda r: r.get("run_id", ""), reverse=True)
+        return runs
+
+    def list_category_runs(self, category: str) -> List[Dict]:
+        """run.json of every run of one category, newest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT run_id, data FROM category_runs WHERE category_path = ? ORDER BY run_id DESC",
+                (normalize_category(category),),
+            ).fetchall()
+        runs = []
+        for row in rows:
+            data = json.loads(row["data"])
+            data["run_id"] = row["run_id"]
+            data["category"] = category.lower()
+            runs.append(data)
+        return runs
+
+    def get_all_last_results(self) -> List[Dict]:
+        """Status of every test in the newest run of each category path."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                WITH latest AS (
+                    SELECT category_path, MAX(run_id) AS run_id FROM (
+                        SELECT category_path, run_id FROM category_runs
+                        UNION ALL
+                        SELECT category_path, run_id FROM test_results
+                    ) GROUP BY category_path
+                )
+                SELECT t.category_path, t.test_dir, t.status
+                FROM test_results t JOIN latest l ON t.category_path = l.category_path AND t.run_id = l.run_id
+                WHERE t.status IN (?, ?, ?)
+                """,
+                _STATUSES,
+            ).fetchall()
+        return [
+            {"category_path": row["category_path"], "test_name": row["test_dir"], "status": row["status"]}
+            for row in rows
+        ]
+
+    def latest_results(self) -> Dict[str, str]:
+        """
+        Newest status of every test that has run, {tree key: "passed" | "failed" | "skipped"}.
+
+        Served from memory: the table is re-read only when PRAGMA data_version shows another
+        connection (a runner saving results, cleanup, rebuild_index) committed since.
+        """
+        with self._cache_lock:
+            if self._reader is None:
+                with self._connect():
+                    pass  # creates the file and schema
+                self._reader = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            version = self._reader.execute("PRAGMA data_version").fetchone()[0]
+            if self._latest is None or version != self._latest_version:
+                rows = self._reader.execute("SELECT path_key, status FROM latest_results").fetchall()
+                self._latest = {path_key: status for path_key, status in rows}
+                self._latest_version = version
+            return dict(self._latest)
+
+    def list_test_runs(self, category: str, test_name: str) -> List[Dict]:
+        """
+        Runs of a category (or its subcategories) that contain a test, newest first.
+
+        Each entry is the category run's run.json plus test_result: the test's result.json in
+        the category's own runs; in subcategory runs, its run.json entry (or result.json).
+        """
+        category = normalize_category(category).lower()
+        key = name_key(test_name)
+        with self._connect() as conn:
+            results = conn.execute(
+                "SELECT t.run_id, t.category_path, t.data, c.data AS run_data "
+                "FROM test_results t LEFT JOIN category_runs c "
+                "ON c.run_id = t.run_id AND c.category_path = t.category_path "
+                "WHERE t.name_key = ? AND t.data IS NOT NULL",
+                (key,),
+            ).fetchall()
+            entries = conn.execute(
+                "SELECT t.run_id, t.category_path, t.data, c.data AS run_data "
+                "FROM category_run_tests t JOIN category_runs c "
+                "ON c.run_id = t.run_id AND c.category_path = t.category_path "
+                "WHERE t.name_key = ?",
+                (key,),
+            ).fetchall()
+
+        # (run_id, category_path) -> (test_result, run_data); run.json entries win in subcategories
+        found: Dict[tuple, tuple] = {}
+        for row in results:
+            own = row["category_path"].lower() == category
+            if own and row["run_data"] is None:
+                continue
+            found[(row["run_id"], row["category_path"].lower())] = (row["data"], row["run_data"])
+        for row in entries:
+            if row["category_path"].lower() == category:
+                continue
+            found[(row["run_id"], row["category_path"].lower())] = (row["data"], row["run_data"])
+
+        runs: List[Dict] = []
+        seen = set()
+        # Newest first; in one run the category's own run dir wins over a subcategory's
+        for (run_id, path), (test_data, run_data) in sorted(
+            found.items(), key=lambda item: (item[0][0], item[0][1] == category), reverse=True,
+        ):
+            if run_id in seen or not (path == category or path.startswith(category + "/")):
+                continue
+            seen.add(run_id)
+            test_result = json.loads(test_data)
+            data = json.loads(run_data) if run_data else {"status": test_result.get("status", "unknown")}
+            data["test_result"] = test_result
+            data["test_name"] = test_name
+            data["run_id"] = run_id
+            data["category"] = category
+            runs.append(data)
+        return runs
+
+    def get_run_details(self, category: str, run_id: str) -> Optional[Dict]:
+        """
+        run.json of one category run with its tests' artifacts.
+
+        Returns:
+            Run data with test_artifacts ({test_dir: {"result", "screenshot", "trace", "heal_request"}}),
+            or None if the run is not indexed
+        """
+        category = normalize_category(category)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM category_runs WHERE run_id = ? AND category_path = ?", (run_id, category),
+            ).fetchone()
+            if row is None:
+                return None
+            test_rows = conn.execute(
+                "SELECT test_dir, data, screenshot, trace, heal_request FROM test_results "
+                "WHERE run_id = ? AND category_path = ?",
+                (run_id, category),
+            ).fetchall()
+        data = json.loads(row["data"])
+        data["test_artifacts"] = {}
+        for test in test_rows:
+            artifacts = {}
+            for key in ("screenshot", "heal_request", "trace"):
+                if test[key]:
+                    artifacts[key] = test[key]
+            if test["data"]:
+                artifacts["result"] = json.loads(test["data"])
+            if artifacts:
+                data["test_artifacts"][test["test_dir"]] = artifacts
+        return data
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _runs_dirs(tests_root: Path) -> Iterator[tuple]:
+    """(runs_dir, category_path) of every _runs/ under tests_root, skipping _-prefixed folders."""
+    for dirpath, dirnames, _ in os.walk(tests_root):
+        if RUNS_DIR_NAME in dirnames:
+            runs_dir = Path(dirpath) / RUNS_DIR_NAME
+            category = Path(dirpath).relative_to(tests_root).as_posix()
+            if category != ".":
+                yield runs_dir, category
+        dirnames[:] = [d for d in dirnames if not d.startswith("_")]
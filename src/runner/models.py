@@ -26,10 +26,14 @@ class TestResult:
     error_type: Optional[str] = None
     screenshot: Optional[Path] = None
     context_snapshot: Optional[dict] = None  # Context state at time of result
+    attempts: List[dict] = field(default_factory=list)  # One entry per attempt when the test was retried
+    metrics: dict = field(default_factory=dict)  # Playwright call profile when profiling is on (see profiler.py)
+    trace: Optional[Path] = None  # Playwright trace of a failed test (execution.trace_on_failure, see tracing.py)
+    screenshot_data: Optional[bytes] = field(default=None, repr=False)  # Failure screenshot until storage writes it (see artifacts.py)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization/events."""
-        return {
+        data = {
             "test_name": self.test_name,
             "test_path": str(self.test_path),
             "test_type": self.test_type,
@@ -39,6 +43,13 @@ class TestResult:
             "error_type": self.error_type,
             "screenshot": str(self.screenshot) if self.screenshot else None,
         }
+        if self.attempts:
+            data["attempts"] = self.attempts
+        if self.metrics:
+            data["metrics"] = self.metrics
+        if self.trace:
+            data["trace"] = str(self.trace)
+        return data
 
 
 @dataclass
@@ -0,0 +1,186 @@
+"""
+Parallel category execution for the test runner.
+
+Runs independent run_all units (top-level categories or --selection paths) in a pool of
+worker processes. Each worker has its own Playwright instance, context dict and
+RunStorage (joined to the parent's run_id), so categories never share browser state.
+Runner events are forwarded back to the parent's EventEmitter so the CLI reporter and
+GUI keep receiving real-time updates.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.models import Category
+
+from .events import RunnerEvent
+from .models import CategoryResult, TestResult
+
+if TYPE_CHECKING:
+    from .runner import TestRunner
+
+
+# (path, chain, from_selection) - same shape as TestRunner.run_all units
+RunUnit = Tuple[str, Optional[List[Category]], bool]
+
+
+def run_units_parallel(
+    runner: "TestRunner",
+    units: List[RunUnit],
+    run_id: str,
+    start_order: Optional[List[int]] = None,
+) -> List[CategoryResult]:
+    """
+    Run units in worker processes and return their results in unit order.
+
+    Args:
+        runner: Parent runner (provides config, events and storage)
+        units: Units to run (see TestRunner.run_all)
+        run_id: Run id started by the parent; workers store results under it
+        start_order: Unit indices in the order they are handed to workers (default: unit order)
+
+    Returns:
+        List of CategoryResult, one per unit, in the same order as units
+    """
+    workers = runner._effective_workers(len(units))
+    spec = _worker_spec(runner, run_id)
+    # spawn: a fresh interpreter per worker (Playwright's sync driver must not be forked)
+    mp_context = multiprocessing.get_context("spawn")
+    results: List[Optional[CategoryResult]] = [None] * len(units)
+
+    with mp_context.Manager() as manager:
+        event_queue = manager.Queue()
+        forwarder = threading.Thread(
+            target=_forward_events,
+            args=(event_queue, runner),
+            daemon=True,
+        )
+        forwarder.start()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+                futures = {}
+                for index in start_order or range(len(units)):
+                    path, chain, from_selection = units[index]
+                    if not chain:
+                        # Nothing to run: resolve the failure here without a worker
+                        results[index] = runner._run_unit(path, chain, index + 1, len(units), from_selection)
+                        continue
+                    future = pool.submit(
+                        _run_unit_worker,
+                        spec,
+                        path,
+                        from_selection,
+                        index + 1,
+                        len(units),
+                        event_queue,
+                    )
+                    futures[future] = (index, path)
+
+                for future in as_completed(futures):
+                    index, path = futures[future]
+                    try:
+                        category_result, categories = future.result()
+                    except Exception as e:
+                        category_result, categories = _worker_failure(path, e), []
+                    results[index] = category_result
+                    runner.storage.add_categories(categories)
+        finally:
+            event_queue.put(None)
+            forwarder.join(timeout=5)
+
+    return [r for r in results if r is not None]
+
+
+def _worker_spec(runner: "TestRunner", run_id: str) -> Dict[str, Any]:
+    """Picklable description of the parent runner, used to rebuild it in a worker."""
+    return {
+        "run_id": run_id,
+        "runner_kwargs": {
+            "tests_root": str(runner.tests_root),
+            "headless": runner.headless,
+            "snapshots_dir": str(runner.snapshots_dir),
+            "record_video": runner.record_video,
+            "config": runner.config,
+            "workers": 1,
+            "resume_run_id": runner.resume_run_id,
+            "from_test": runner.from_test,
+        },
+    }
+
+
+def _run_unit_worker(
+    spec: Dict[str, Any],
+    path: str,
+    from_selection: bool,
+    index: int,
+    total: int,
+    event_queue,
+) -> Tuple[CategoryResult, List[str]]:
+    """
+    Worker process entry point: run one unit with a fresh TestRunner.
+
+    Returns:
+        Tuple of (CategoryResult, category paths saved to storage)
+    """
+    from .runner import TestRunner
+
+    kwargs = dict(spec["runner_kwargs"])
+    kwargs["tests_root"] = Path(kwargs["tests_root"])
+    kwargs["snapshots_dir"] = Path(kwargs["snapshots_dir"])
+    runner = TestRunner(**kwargs)
+    runner.storage.join_run(
+        spec["run_id"],
+        config={"target": runner.run_config} if runner.run_config else None,
+    )
+
+    for event in RunnerEvent:
+        runner.events.on(event, _queue_listener(event_queue, event))
+
+    if from_selection:
+        chain = runner._resolve_category_path(path)
+    else:
+        category = runner.get_category(path)
+        chain = [category] if category else None
+
+    result = runner._run_unit(path, chain, index, total, from_selection)
+    # The parent reads these run dirs once the worker returns
+    runner.storage.flush_artifacts()
+    return result, runner.storage.current_categories
+
+
+def _queue_listener(event_queue, event: RunnerEvent):
+    """Build an event listener that forwards (event, data) to the parent process."""
+    def listener(data: Dict[str, Any]) -> None:
+        event_queue.put((event.value, data))
+    return listener
+
+
+def _forward_events(event_queue, runner: "TestRunner") -> None:
+    """Parent thread: re-emit worker events on the parent's EventEmitter until None is received."""
+    while True:
+        item = event_queue.get()
+        if item is None:
+            break
+        event_value, data = item
+        runner.events.emit(RunnerEvent(event_value), data)
+
+
+def _worker_failure(path: str, error: Exception) -> CategoryResult:
+    """CategoryResult for a worker that crashed before returning a result."""
+    return CategoryResult(
+        category_name=path,
+        category_path=Path(path),
+        stopped_early=True,
+        test_results=[TestResult(
+            test_name="_worker",
+            test_path=Path(path),
+            test_type="test",
+            status="failed",
+            duration_ms=0,
+            error=f"Worker process failed: {type(error).__name__}: {error}",
+            error_type=type(error).__name__,
+        )],
+    )
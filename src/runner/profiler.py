@@ -0,0 +1,282 @@
+"""
+Per-call profiling of the Playwright API used by tests.
+
+With profiling on (`main.py run --profile` or execution.profile: true), TestExecutor hands
+tests a profiled Page instead of the raw one. Every goto, click, fill, wait_for,
+wait_for_url, count, wait_for_timeout (and the other actions listed in PROFILED_METHODS) is
+timed and attributed to the running test and to the line of test code that made the call.
+Locators, FrameLocators and Frames the page returns are profiled the same way, so
+page.locator(...).first.click() is recorded as one click.
+
+The profiled objects are instances of subclasses of the real Playwright classes sharing the
+original object's state, so isinstance() checks - including Playwright's own expect() - keep
+working.
+
+Each TestResult gets a "metrics" entry (written to result.json), and RunStorage.finalize_run
+writes the run's slowest calls to runs_index/profiles/<run_id>.json. The report also adds up
+the unconditional sleeps (wait_for_timeout) per source line; `run --sleep-report` prints just
+that part, to find the fixed delays worth replacing with tests/_functions/_waits.py.
+"""
+
+import inspect
+import os
+import sys
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Calls that are timed (everything else is passed through, its result profiled if it is a Playwright object)
+PROFILED_METHODS = frozenset({
+    "goto", "reload", "go_back", "go_forward",
+    "click", "dblclick", "fill", "type", "press", "press_sequentially", "clear",
+    "check", "uncheck", "set_checked", "select_option", "hover", "focus", "set_input_files",
+    "wait_for", "wait_for_url", "wait_for_selector", "wait_for_load_state",
+    "wait_for_timeout", "wait_for_function",
+    "count", "text_content", "inner_text", "input_value", "is_visible", "is_enabled",
+    "is_checked", "all", "all_text_contents", "all_inner_texts", "evaluate", "screenshot",
+})
+# Playwright classes whose instances are profiled
+PROFILED_CLASSES = frozenset({"Page", "Frame", "Locator", "FrameLocator"})
+# Unconditional sleeps, reported separately (run --sleep-report)
+SLEEP_METHODS = frozenset({"wait_for_timeout"})
+# Calls kept per test in result.json, and in the run report
+SLOWEST_PER_TEST = 50
+TOP_CALLS = 50
+TOP_SLEEP_LOCATIONS = 30
+
+_PROFILER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _is_playwright_object(value: Any) -> bool:
+    cls = type(value)
+    return cls.__name__ in PROFILED_CLASSES and cls.__module__.startswith("playwright.")
+
+
+def _describe(target: Any) -> str:
+    """Short label of a call's target: the locator's selector, or the object kind."""
+    selector = getattr(getattr(target, "_impl_obj", None), "_selector", None)
+    return selector or type(target).__name__.replace("Profiled", "", 1).lower()
+
+
+def _caller_location() -> Optional[str]:
+    """file:line of the first frame outside this module and Playwright (the test code)."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if os.path.dirname(os.path.abspath(filename)) != _PROFILER_DIR and "playwright" not in filename:
+            try:
+                filename = Path(filename).resolve().relative_to(Path.cwd()).as_posix()
+            except ValueError:
+                pass
+            return f"{filename}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+class CallProfiler:
+    """
+    Times Playwright calls and aggregates them per test.
+
+    Usage:
+        profiler = CallProfiler()
+        page = profiler.wrap(page)
+        token = profiler.begin()
+        ...test runs...
+        metrics = profiler.end(token)   # -> TestResult.metrics
+    """
+
+    def __init__(self):
+        # Calls of the running test; a ContextVar so concurrent async tests keep their own
+        self._calls: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("profiled_calls", default=None)
+        self._classes: Dict[type, type] = {}
+
+    def begin(self):
+        """Start collecting the calls of the test about to run. Returns a token for end()."""
+        return self._calls.set([])
+
+    def end(self, token) -> Dict[str, Any]:
+        """Stop collecting and return the test's metrics (see summarize)."""
+        calls = self._calls.get() or []
+        self._calls.reset(token)
+        return summarize(calls)
+
+    def record(
+        self,
+        method: str,
+        target: Any,
+        duration_ms: float,
+        location: Optional[str],
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one call of the running test (ignored outside begin/end)."""
+        calls = self._calls.get()
+        if calls is None:
+            return
+        call = {
+            "method": method,
+            "target": _describe(target),
+            "duration_ms": round(duration_ms, 1),
+            "location": location,
+        }
+        if error:
+            call["error"] = error
+        calls.append(call)
+
+    def wrap(self, value: Any) -> Any:
+        """Return value profiled if it is a Page, Frame, Locator or FrameLocator, else value itself."""
+        if not _is_playwright_object(value) or getattr(type(value), "_profiler", None) is self:
+            return value
+        cls = type(value)
+        profiled_cls = self._classes.get(cls)
+        if profiled_cls is None:
+            profiled_cls = type(f"Profiled{cls.__name__}", (cls,), {
+                "_profiler": self,
+                "__getattribute__": _profiled_getattribute,
+            })
+            self._classes[cls] = profiled_cls
+        profiled = object.__new__(profiled_cls)
+        # Share the state of the original object: same impl object, same listeners
+        object.__setattr__(profiled, "__dict__", value.__dict__)
+        return profiled
+
+
+def _profiled_getattribute(self, name: str):
+    value = object.__getattribute__(self, name)
+    if name.startswith("_"):
+        return value
+    profiler: CallProfiler = type(self)._profiler
+    if not callable(value) or _is_playwright_object(value):
+        return profiler.wrap(value)
+    if name not in PROFILED_METHODS:
+        def passthrough(*args, **kwargs):
+            result = value(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return _wrap_awaited(profiler, result)
+            return _wrap_result(profiler, result)
+        return passthrough
+
+    def timed(*args, **kwargs):
+        location = _caller_location()
+        start = time.perf_counter()
+        try:
+            result = value(*args, **kwargs)
+        except Exception as e:
+            profiler.record(name, self, (time.perf_counter() - start) * 1000, location, type(e).__name__)
+            raise
+        if inspect.isawaitable(result):
+            return _timed_await(profiler, name, self, result, start, location)
+        profiler.record(name, self, (time.perf_counter() - start) * 1000, location)
+        return _wrap_result(profiler, result)
+    return timed
+
+
+def _wrap_result(profiler: CallProfiler, result: Any) -> Any:
+    """Profile a returned Playwright object, or each of a list of them (Locator.all())."""
+    if isinstance(result, list):
+        return [profiler.wrap(item) for item in result]
+    return profiler.wrap(result)
+
+
+async def _wrap_awaited(profiler: CallProfiler, awaitable):
+    return _wrap_result(profiler, await awaitable)
+
+
+async def _timed_await(profiler: CallProfiler, name: str, target: Any, awaitable, start: float, location):
+    try:
+        result = await awaitable
+    except Exception as e:
+        profiler.record(name, target, (time.perf_counter() - start) * 1000, location, type(e).__name__)
+        raise
+    profiler.record(name, target, (time.perf_counter() - start) * 1000, location)
+    return _wrap_result(profiler, result)
+
+
+def summarize(calls: List[Dict[str, Any]], slowest: int = SLOWEST_PER_TEST) -> Dict[str, Any]:
+    """
+    Aggregate the calls of one test.
+
+    Returns:
+        {"calls", "total_ms", "by_method": {method: {"count", "total_ms", "max_ms"}},
+         "slowest": [call, ...] (slowest first),
+         "sleeps": {location: {"count", "total_ms"}} (wait_for_timeout calls)}
+    """
+    by_method: Dict[str, Dict[str, Any]] = {}
+    sleeps: Dict[str, Dict[str, Any]] = {}
+    for call in calls:
+        stats = by_method.setdefault(call["method"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] = round(stats["total_ms"] + call["duration_ms"], 1)
+        stats["max_ms"] = max(stats["max_ms"], call["duration_ms"])
+        if call["method"] in SLEEP_METHODS:
+            sleep = sleeps.setdefault(call["location"] or "?", {"count": 0, "total_ms": 0.0})
+            sleep["count"] += 1
+            sleep["total_ms"] = round(sleep["total_ms"] + call["duration_ms"], 1)
+    metrics = {
+        "calls": len(calls),
+        "total_ms": round(sum(c["duration_ms"] for c in calls), 1),
+        "by_method": dict(sorted(by_method.items(), key=lambda item: -item[1]["total_ms"])),
+        "slowest": sorted(calls, key=lambda c: -c["duration_ms"])[:slowest],
+    }
+    if sleeps:
+        metrics["sleeps"] = sleeps
+    return metrics
+
+
+def build_profile_report(run_result, run_id: Optional[str] = None, limit: int = TOP_CALLS) -> Optional[Dict[str, Any]]:
+    """
+    Run-level report from the metrics of every result: the slowest calls, totals per method,
+    and the time spent in unconditional sleeps (wait_for_timeout) per source line.
+
+    Returns:
+        Report dict, or None if no result was profiled
+    """
+    calls: List[Dict[str, Any]] = []
+    by_method: Dict[str, Dict[str, Any]] = {}
+    sleeps: Dict[str, Dict[str, Any]] = {}
+    profiled = 0
+    profiled_ms = 0
+    for category_result in run_result.category_results:
+        results = [category_result.setup_result, *category_result.test_results, category_result.teardown_result]
+        for result in results:
+            metrics = getattr(result, "metrics", None) if result else None
+            if not metrics:
+                continue
+            profiled += 1
+            profiled_ms += result.duration_ms
+            for call in metrics.get("slowest", []):
+                calls.append({"test": result.test_name, "category": category_result.category_name, **call})
+            for method, stats in metrics.get("by_method", {}).items():
+                total = by_method.setdefault(method, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                total["count"] += stats["count"]
+                total["total_ms"] = round(total["total_ms"] + stats["total_ms"], 1)
+                total["max_ms"] = max(total["max_ms"], stats["max_ms"])
+            for location, stats in metrics.get("sleeps", {}).items():
+                total = sleeps.setdefault(location, {"location": location, "count": 0, "total_ms": 0.0, "tests": []})
+                total["count"] += stats["count"]
+                total["total_ms"] = round(total["total_ms"] + stats["total_ms"], 1)
+                if result.test_name not in total["tests"]:
+                    total["tests"].append(result.test_name)
+    if not profiled:
+        return None
+    sleep_ms = round(sum(s["total_ms"] for s in sleeps.values()), 1)
+    return {
+        "run_id": run_id,
+        "profiled_tests": profiled,
+        "profiled_ms": profiled_ms,
+        "by_method": dict(sorted(by_method.items(), key=lambda item: -item[1]["total_ms"])),
+        "slowest_calls": sorted(calls, key=lambda c: -c["duration_ms"])[:limit],
+        "sleeps": {
+            "total_ms": sleep_ms,
+            "count": sum(s["count"] for s in sleeps.values()),
+            "share": min(1.0, round(sleep_ms / profiled_ms, 3)) if profiled_ms else 0.0,
+            "by_location": sorted(sleeps.values(), key=lambda s: -s["total_ms"])[:TOP_SLEEP_LOCATIONS],
+        },
+    }
+
+
+def profiling_enabled(config: Optional[dict]) -> bool:
+    """execution.profile or execution.sleep_report from config.yaml (both off by default)."""
+    execution = (config or {}).get("execution") or {}
+    return bool(execution.get("profile", False) or execution.get("sleep_report", False))
@@ -0,0 +1,235 @@
+"""
+Resource blocking for category browser contexts.
+
+Dashboard and calendar pages pull in analytics, chat widgets, tracking pixels and web fonts
+that no test asserts on; they slow page loads and the domcontentloaded waits. With
+resource_blocking enabled in config.yaml (off by default, like the other opt-in speedups),
+every category's BrowserContext routes those requests: beacons and XHR/fetch calls are
+stubbed with empty responses, everything else (scripts, fonts, pixels, optional images) is
+aborted. Scripts are not faked as loaded: app code that calls a widget's globals once its
+script "loaded" would throw inside the product, failing tests for reasons production does
+not have; an aborted script takes the same path as an ad blocker.
+
+The hosts blocked by default are the RESOURCE_GROUPS entries below: analytics
+(Google Analytics/Tag Manager, Segment, Mixpanel, Amplitude, Hotjar, FullStory, Clarity,
+Heap, New Relic, Datadog RUM), chat (Intercom, Zendesk/Zopim, Drift, Crisp, Tawk.to,
+LiveChat), tracking (DoubleClick, Facebook, Bing, LinkedIn, Google Ads, Twitter, TikTok) and
+fonts (Google Fonts, Typekit). Turn it on once the suite has passed with it.
+
+The default groups only match third-party hosts. Groups that match by file type (font_files,
+images) also hit the app's own assets, which can change layout and click targets, so they
+are opt-in (block: [..., font_files] / block_images).
+
+Only URLs matching a blocked group are routed, so the rest of the traffic does not pay for
+a round trip through the route handler. A category can keep groups or URLs it needs with
+resource_allowlist in its _category.yaml (group names or URL regexes), e.g.:
+
+    resource_allowlist:
+      - chat
+      - "widget\\.example\\.com"
+
+Blocked requests are counted per test and saved in result.json (metrics.blocked_requests).
+Blocked requests never reach the network, so their size is unknown: counts are reported per
+group and resource type, not in bytes.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from src.models import Category
+
+
+# URL regexes (searched) of each group
+RESOURCE_GROUPS: Dict[str, List[str]] = {
+    "analytics": [
+        r"google-analytics\.com", r"googletagmanager\.com", r"analytics\.google\.com",
+        r"segment\.(io|com)", r"cdn\.segment", r"mixpanel\.com", r"amplitude\.com",
+        r"hotjar\.(com|io)", r"fullstory\.com", r"clarity\.ms", r"heap(analytics)?\.(io|com)",
+        r"nr-data\.net", r"js-agent\.newrelic\.com", r"browser-intake-datadoghq\.com",
+    ],
+    "chat": [
+        r"intercom(cdn)?\.(io|com)", r"widget\.intercom", r"zdassets\.com", r"zopim\.com",
+        r"drift\.com", r"driftt\.com", r"crisp\.chat", r"tawk\.to", r"livechatinc\.com",
+    ],
+    "tracking": [
+        r"doubleclick\.net", r"connect\.facebook\.net", r"facebook\.com/tr", r"bat\.bing\.com",
+        r"ads\.linkedin\.com", r"px\.ads\.linkedin", r"snap\.licdn\.com", r"adservice\.google",
+        r"googleadservices\.com", r"t\.co/i/adsct", r"analytics\.tiktok\.com",
+    ],
+    # Third-party web font hosts only; the app's own font files are in font_files (opt-in)
+    "fonts": [
+        r"fonts\.googleapis\.com", r"fonts\.gstatic\.com", r"use\.typekit\.net", r"p\.typekit\.net",
+    ],
+    "font_files": [
+        r"\.(woff2?|ttf|otf|eot)(\?|$)",
+    ],
+    "images": [
+        r"\.(png|jpe?g|gif|webp|avif|bmp)(\?|$)",
+    ],
+}
+DEFAULT_BLOCKED_GROUPS = ["analytics", "chat", "tracking", "fonts"]
+# Resource types stubbed with an empty success response instead of aborted
+_STUB_BODIES = {
+    "xhr": ("application/json", "{}"),
+    "fetch": ("application/json", "{}"),
+    "ping": ("text/plain", ""),
+}
+
+
+class ResourceBlocker:
+    """
+    Routes and counts the blocked requests of one BrowserContext.
+
+    Usage:
+        blocker = ResourceBlocker.from_config(config, allowlist=category_allowlist(chain))
+        blocker.install(browser_context)            # or await blocker.install_async(...)
+        blocker.begin(page); ...test...; counts = blocker.end(page)
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[str] = DEFAULT_BLOCKED_GROUPS,
+        extra_patterns: Optional[Iterable[str]] = None,
+        allowlist: Optional[Iterable[str]] = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the blocker.
+
+        Args:
+            groups: RESOURCE_GROUPS to block
+            extra_patterns: More URL regexes to block (group "custom")
+            allowlist: Group names or URL regexes that stay allowed (category resource_allowlist)
+            enabled: When False, install() does nothing
+        """
+        allow = [str(a) for a in allowlist or []]
+        allowed_groups = {a.lower() for a in allow if a.lower() in RESOURCE_GROUPS or a.lower() == "custom"}
+        self.groups: Dict[str, re.Pattern] = {}
+        for group in groups:
+            if group in RESOURCE_GROUPS and group not in allowed_groups:
+                self.groups[group] = _compile(RESOURCE_GROUPS[group])
+        extra = list(extra_patterns or [])
+        if extra and "custom" not in allowed_groups:
+            self.groups["custom"] = _compile(extra)
+        allowed_urls = [a for a in allow if a.lower() not in allowed_groups]
+        self.allowed = _compile(allowed_urls) if allowed_urls else None
+        self.enabled = enabled and bool(self.groups)
+        self._match_any = _compile(p.pattern for p in self.groups.values()) if self.groups else None
+        # page -> counts of the test running on it
+        self._counts: Dict[Any, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], allowlist: Optional[Iterable[str]] = None) -> "ResourceBlocker":
+        """Build a blocker from the resource_blocking section of config.yaml."""
+        section = (config or {}).get("resource_blocking") or {}
+        groups = list(section.get("block") or DEFAULT_BLOCKED_GROUPS)
+        if section.get("block_images") and "images" not in groups:
+            groups.append("images")
+        return cls(
+            groups=groups,
+            extra_patterns=section.get("extra_patterns"),
+            allowlist=allowlist,
+            enabled=bool(section.get("enabled", False)),
+        )
+
+    def group_for(self, url: str) -> Optional[str]:
+        """Blocked group of a URL, or None if the request goes through."""
+        if self.allowed is not None and self.allowed.search(url):
+            return None
+        for group, pattern in self.groups.items():
+            if pattern.search(url):
+                return group
+        return None
+
+    def install(self, browser_context) -> None:
+        """Route the blocked URLs of a sync BrowserContext."""
+        if self.enabled:
+            browser_context.route(self._match_any, self._handle)
+
+    async def install_async(self, browser_context) -> None:
+        """Route the blocked URLs of an async BrowserContext."""
+        if self.enabled:
+            await browser_context.route(self._match_any, self._handle_async)
+
+    def _decide(self, route) -> Optional[Dict[str, Any]]:
+        """Count a routed request; returns the stub response, {} to abort, or None to continue."""
+        request = route.request
+        group = self.group_for(request.url)
+        if group is None:
+            return None
+        self._count(request, group)
+        stub = _STUB_BODIES.get(request.resource_type)
+        if stub is None:
+            return {}
+        content_type, body = stub
+        return {"status": 200, "content_type": content_type, "body": body}
+
+    def _handle(self, route) -> None:
+        response = self._decide(route)
+        if response is None:
+            route.continue_()
+        elif response:
+            route.fulfill(**response)
+        else:
+            route.abort("blockedbyclient")
+
+    async def _handle_async(self, route) -> None:
+        response = self._decide(route)
+        if response is None:
+            await route.continue_()
+        elif response:
+            await route.fulfill(**response)
+        else:
+            await route.abort("blockedbyclient")
+
+    def _count(self, request, group: str) -> None:
+        try:
+            page = request.frame.page
+        except Exception:
+            # Service worker requests have no frame
+            return
+        counts = self._counts.get(page)
+        if counts is None:
+            return
+        counts["requests"] += 1
+        counts["by_group"][group] = counts["by_group"].get(group, 0) + 1
+        counts["by_type"][request.resource_type] = counts["by_type"].get(request.resource_type, 0) + 1
+
+    def begin(self, page) -> None:
+        """Start counting the blocked requests of the test running on page."""
+        self._counts[page] = {"requests": 0, "by_group": {}, "by_type": {}}
+
+    def end(self, page) -> Optional[Dict[str, Any]]:
+        """Stop counting on page; returns the counts, or None if nothing was blocked."""
+        counts = self._counts.pop(page, None)
+        return counts if counts and counts["requests"] else None
+
+
+def _compile(patterns: Iterable[str]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+def category_allowlist(categories: Sequence[Category]) -> List[str]:
+    """
+    resource_allowlist entries of the categories sharing a BrowserContext.
+
+    A context runs the categories of a chain and the whole subtree of its last category,
+    so the allowlists of all of them apply.
+    """
+    allowlist: List[str] = []
+
+    def add(category: Category) -> None:
+        for entry in category.resource_allowlist or []:
+            if entry not in allowlist:
+                allowlist.append(entry)
+
+    def subtree(category: Category) -> None:
+        add(category)
+        for subcategory in category.subcategories or []:
+            subtree(subcategory)
+
+    for category in categories[:-1]:
+        add(category)
+    if categories:
+        subtree(categories[-1])
+    return allowlist
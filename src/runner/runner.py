@@ -5,22 +5,35 @@ Coordinates test execution across categories, managing browser lifecycle,
 context, and emitting events for real-time updates.
 """
 
-import shutil
+import copy
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from playwright.sync_api import sync_playwright, Browser, Page
+from playwright.sync_api import Page
 
 from src.discovery import TestDiscovery
 from src.models import Category, Test
 
 from .models import TestResult, CategoryResult, RunResult
 from .events import EventEmitter, RunnerEvent
-from .context import ContextManager
+from .context import ContextManager, TrackedContext
+from .dependency_graph import DependencyGraph
+from .failure_propagation import FailurePropagation, skip_mode_from_config
+from .scheduler import DurationEstimator, schedule_units
 from .executor import TestExecutor
+from .profiler import CallProfiler, profiling_enabled
+from .routing import ResourceBlocker, category_allowlist
+from .screenshots import ScreenshotEncoder
 from .heal import HealRequestGenerator
 from .storage import RunStorage
+from .browser import BrowserManager
+from .browser_cache import CacheProfile
+from .checkpoint import STATUS_RESUMED, CheckpointStore, ResumePoint
+from .data_pool import OWNER_KEY, DataPool
+from .tracing import TraceRecorder
+from .video import VideoPolicy
+from .session_cache import SessionCache
 
 # For --debug-test: pause after each minor action (human-in-the-loop debugging)
 def _get_step_callback_for_debug():
@@ -109,7 +122,7 @@ class TestRunner:
     
     Features:
     - Runs tests sequentially within categories
-    - Manages browser lifecycle (new browser per category)
+    - Manages browser lifecycle (one browser per run, fresh context per category)
     - Passes shared context between tests
     - Emits events for real-time updates (GUI-ready)
     - Generates heal requests on failure
@@ -137,6 +150,9 @@ class TestRunner:
         until_test: Optional[str] = None,
         debug_test: Optional[str] = None,
         config: Optional[dict] = None,
+        workers: Optional[int] = None,
+        resume_run_id: Optional[str] = None,
+        from_test: Optional[str] = None,
     ):
         """
         Initialize the test runner.
@@ -145,28 +161,62 @@ class TestRunner:
             tests_root: Path to the tests/ directory
             headless: Whether to run browser in headless mode
             snapshots_dir: Directory for screenshots (default: snapshots/)
-            record_video: Whether to record video of test execution (default: True)
+            record_video: Whether to record video of test execution (default: True); False forces
+                          browser.video.mode off, otherwise the mode in config.yaml decides (video.py)
             keep_open: Whether to keep browser open on failure for debugging (default: False)
             until_test: Stop before this test; dump context to until_test_context.json and leave browser open (for manual or MCP debugging; MCP uses a new session)
             debug_test: Run category until this test, then run this test with step_callback=step_callback_with_enter (pause after each minor action for human debugging), then stop.
             config: Full config dict (e.g. from config.yaml); target subtree is stored in run logs and heal requests
+            workers: Number of categories to run at the same time in separate processes (run_all only).
+                     Defaults to execution.parallel_tests from config (1 = sequential).
+            resume_run_id: Continue this run from its checkpoints (.checkpoints/<run_id>/): tests that
+                           passed before the latest checkpoint are skipped, setups are not replayed
+            from_test: Start at this test, from the checkpoint taken just before it (latest run with
+                       checkpoints unless resume_run_id is set)
         """
         self.tests_root = Path(tests_root)
         self.headless = headless
         self.snapshots_dir = snapshots_dir or Path("snapshots")
-        self.record_video = record_video
         self.keep_open = keep_open
         self.until_test = until_test
         self.debug_test = debug_test
         self.run_config = (config or {}).get("target") if config else None
+        self.config = config or {}
+        # What to record (off / on / retain-on-failure / first-retry-only) and at which size
+        self.video = VideoPolicy.from_config(self.config, record_video=record_video)
+        self.record_video = self.video.records
+        self.execution_config = self.config.get("execution") or {}
+        if workers is None:
+            workers = self.execution_config.get("parallel_tests", 1)
+        self.workers = max(1, int(workers or 1))
+        self.retry_on_failure = max(0, int(self.execution_config.get("retry_on_failure", 0) or 0))
+        self.skip_mode = skip_mode_from_config(self.config)
+        self.resume_run_id = resume_run_id
+        self.from_test = from_test
         
         # Components
         self.events = EventEmitter()
         self.discovery = TestDiscovery(tests_root)
-        self.executor = TestExecutor(Path(".temp_screenshots"))  # Temp location, moved to run storage
+        self.executor = TestExecutor()  # Failure screenshots stay in memory until storage writes them
+        if profiling_enabled(self.config):
+            self.executor.profiler = CallProfiler()
+        # Per-test trace chunks, saved only for failing tests (execution.trace_on_failure)
+        self.traces = TraceRecorder.from_config(self.config)
         self.context_manager = ContextManager()
         self.heal_generator = HealRequestGenerator()
-        self.storage = RunStorage(self.tests_root)
+        self.storage = RunStorage(self.tests_root, screenshots=ScreenshotEncoder.from_config(self.config))
+        # One driver + browser per run, context per category (or a warm-cache persistent context, see browser_cache.py)
+        self.browsers = BrowserManager(headless=headless, cache_profile=CacheProfile.from_config(self.config))
+        self.keep_browser = False  # True = leave the browser running after a run (continuous mode)
+        self.session_cache = SessionCache.from_config(self.config)
+        self._session_saved = False
+        # Pre-provisioned clients/services leased to categories (see data_pool.py)
+        self.data_pool = DataPool.from_config(self.config)
+        self.checkpoints = CheckpointStore.from_config(self.config)
+        self._resume: Optional[ResumePoint] = None
+        # Blocks analytics/chat/tracking/fonts in the current category's BrowserContext
+        self._blocker: Optional[ResourceBlocker] = None
+        self._checkpoint_target: Optional[Tuple[str, CategoryResult]] = None  # (root category path, result)
     
     def get_categories(self) -> List[Category]:
         """
@@ -228,6 +278,10 @@ class TestRunner:
         """
         Run all categories, or only the selected category paths when selection is provided.
         
+        When more than one worker is configured (workers / execution.parallel_tests), independent
+        categories (or selection paths) run at the same time in separate processes; results are
+        merged into one RunResult and one runs_index entry.
+        
         Args:
             selection: Optional list of category paths to run (e.g. ["clients", "scheduling/events"]).
                        When None, runs all top-level categories.
@@ -235,85 +289,157 @@ class TestRunner:
         Returns:
             RunResult with results from all run categories
         """
-        categories = self.get_categories()
-        
         result = RunResult(started_at=datetime.now())
         
         # Start a new run in storage (pass config for run.json and runs_index)
         run_id = self.storage.start_run(config={"target": self.run_config} if self.run_config else None)
+        self.checkpoints.prune(current_run_id=run_id)
+        
+        units, category_names, total_tests = self._build_units(selection)
+        workers = self._effective_workers(len(units))
+        start_order, makespan_ms = self._schedule_units(units, workers)
+        
+        self.events.emit(RunnerEvent.RUN_STARTED, {
+            "categories": category_names,
+            "total_categories": len(units),
+            "total_tests": total_tests,
+            "run_id": run_id,
+            "workers": workers,
+            "estimated_makespan_ms": makespan_ms,
+        })
+        
+        try:
+            if workers > 1:
+                from .parallel import run_units_parallel
+                result.category_results.extend(run_units_parallel(self, units, run_id, start_order=start_order))
+            else:
+                for index, (path, chain, from_selection) in enumerate(units):
+                    result.category_results.append(
+                        self._run_unit(path, chain, index + 1, len(units), from_selection)
+                    )
+        finally:
+            if not self.keep_browser:
+                self.browsers.close()
+        
+        result.completed_at = datetime.now()
+        
+        # Finalize run in storage
+        self.storage.finalize_run(result)
+        
+        # Emit run completed
+        self.events.emit(RunnerEvent.RUN_COMPLETED, {
+            "result": result.to_dict(),
+            "run_id": run_id,
+        })
+        
+        return result
+    
+    def _build_units(
+        self,
+        selection: Optional[List[str]] = None,
+    ) -> Tuple[List[Tuple[str, Optional[List[Category]], bool]], List[str], int]:
+        """
+        Build the units of run_all.
         
+        Each unit is (path, chain, from_selection); chain is None when a selection path did not resolve.
+        
+        Returns:
+            Tuple of (units, category names for RUN_STARTED, total test count)
+        """
+        units: List[Tuple[str, Optional[List[Category]], bool]] = []
         if selection:
             # Run only selected category paths
             total_tests = 0
-            category_chains: List[Optional[List[Category]]] = []
             for path in selection:
                 chain = self._resolve_category_path(path)
-                category_chains.append(chain)
+                units.append((path, chain, True))
                 if chain:
                     total_tests += len(chain[-1].tests) if chain[-1].tests else 0
-            self.events.emit(RunnerEvent.RUN_STARTED, {
-                "categories": selection,
-                "total_categories": len(selection),
-                "total_tests": total_tests,
-                "run_id": run_id,
-            })
-            for index, path in enumerate(selection):
-                chain = category_chains[index]
-                if not chain:
-                    result.category_results.append(CategoryResult(
-                        category_name=path,
-                        category_path=Path(path),
-                        stopped_early=True,
-                        test_results=[TestResult(
-                            test_name="_path_resolve",
-                            test_path=Path(path),
-                            test_type="test",
-                            status="failed",
-                            duration_ms=0,
-                            error=f"Category path not found: {path}",
-                        )],
-                    ))
-                    continue
-                category = chain[0]
-                path_for_display = "/".join((c.path.name for c in chain if c.path))
-                category_result = self._run_category_internal(
-                    category,
-                    index + 1,
-                    len(selection),
-                    category_chain=chain,
-                )
-                if path_for_display and category_result:
-                    category_result.category_name = path_for_display
-                result.category_results.append(category_result)
+            category_names = list(selection)
         else:
             # Run all top-level categories (original behavior)
+            categories = self.get_categories()
             total_tests = sum(len(c.tests) for c in categories)
-            self.events.emit(RunnerEvent.RUN_STARTED, {
-                "categories": [c.name for c in categories],
-                "total_categories": len(categories),
-                "total_tests": total_tests,
-                "run_id": run_id,
-            })
-            for index, category in enumerate(categories):
-                category_result = self._run_category_internal(
-                    category,
-                    index + 1,
-                    len(categories),
-                )
-                result.category_results.append(category_result)
+            units = [(c.path.as_posix(), [c], False) for c in categories]
+            category_names = [c.name for c in categories]
+        return units, category_names, total_tests
+    
+    def _schedule_units(
+        self,
+        units: List[Tuple[str, Optional[List[Category]], bool]],
+        workers: int,
+    ) -> Tuple[List[int], int]:
+        """
+        Start order of run_all units and the expected makespan.
         
-        result.completed_at = datetime.now()
+        Units start longest first (by their durations in the run history), so the longest
+        chain does not start last and keep one worker busy while the others are idle.
         
-        # Finalize run in storage
-        self.storage.finalize_run(result)
+        Returns:
+            Tuple of (unit indices in start order, expected wall time in ms)
+        """
+        estimator = DurationEstimator.from_history(self.tests_root)
+        start_order, _, makespan_ms = schedule_units(units, estimator, workers)
+        return start_order, makespan_ms
+    
+    def _effective_workers(self, unit_count: int) -> int:
+        """
+        Number of worker processes to use for unit_count categories.
         
-        # Emit run completed
-        self.events.emit(RunnerEvent.RUN_COMPLETED, {
-            "result": result.to_dict(),
-            "run_id": run_id,
-        })
+        Interactive modes (--keep-open, --until-test, --debug-test) wait for input on the
+        terminal, so they always run sequentially in this process.
+        """
+        if self.keep_open or self.until_test or self.debug_test:
+            return 1
+        return max(1, min(self.workers, unit_count))
+    
+    def _run_unit(
+        self,
+        path: str,
+        chain: Optional[List[Category]],
+        index: int,
+        total: int,
+        from_selection: bool,
+    ) -> CategoryResult:
+        """
+        Run one unit of run_all: a top-level category, or a selection path (root setup chain + leaf).
         
-        return result
+        Args:
+            path: Category path (selection entry, or top-level category folder name)
+            chain: Resolved category chain [root, ..., leaf], or None if the path did not resolve
+            index: Index of this unit (1-based)
+            total: Total number of units in the run
+            from_selection: True when path came from --selection (result is named after the path)
+            
+        Returns:
+            CategoryResult for the unit
+        """
+        if not chain:
+            return CategoryResult(
+                category_name=path,
+                category_path=Path(path),
+                stopped_early=True,
+                test_results=[TestResult(
+                    test_name="_path_resolve",
+                    test_path=Path(path),
+                    test_type="test",
+                    status="failed",
+                    duration_ms=0,
+                    error=f"Category path not found: {path}",
+                )],
+            )
+        if not from_selection:
+            return self._run_category_internal(chain[0], index, total)
+        path_for_display = "/".join((c.path.name for c in chain if c.path))
+        category_result = self._run_category_internal(
+            chain[0],
+            index,
+            total,
+            category_chain=chain,
+        )
+        if path_for_display and category_result:
+            category_result.category_name = path_for_display
+        return category_result
     
     def run_category(
         self,
@@ -381,6 +507,7 @@ class TestRunner:
         
         # Start a new run in storage (pass config for run.json and runs_index)
         run_id = self.storage.start_run(config={"target": self.run_config} if self.run_config else None)
+        self.checkpoints.prune(current_run_id=run_id)
         
         # Emit run started (single category)
         self.events.emit(RunnerEvent.RUN_STARTED, {
@@ -390,13 +517,17 @@ class TestRunner:
             "run_id": run_id,
         })
 
-        result = self._run_category_internal(
-            category, 1, 1,
-            until_test=until_test_name,
-            debug_test=debug_test_name,
-            subcategory_name=subcategory_name,
-            category_chain=category_chain,
-        )
+        try:
+            result = self._run_category_internal(
+                category, 1, 1,
+                until_test=until_test_name,
+                debug_test=debug_test_name,
+                subcategory_name=subcategory_name,
+                category_chain=category_chain,
+            )
+        finally:
+            if not self.keep_browser:
+                self.browsers.close()
         if path_for_display and result:
             result.category_name = path_for_display
 
@@ -459,271 +590,234 @@ class TestRunner:
             "has_teardown": category.teardown is not None,
         })
         
-        # Create fresh context for this category
-        context = self.context_manager.create_fresh()
-        if self.run_config:
-            if self.run_config.get("base_url"):
-                context["base_url"] = self.run_config["base_url"]
-            auth = self.run_config.get("auth")
-            if isinstance(auth, dict):
-                if auth.get("username"):
-                    context["username"] = auth["username"]
-                if auth.get("password"):
-                    context["password"] = auth["password"]
+        # Create fresh context for this category (records per-test key reads/writes)
+        context = self.context_manager.create_tracked()
+        self._apply_target_to_context(context)
+        self.data_pool.seed(context)
+        context.seal_seeds()
+        # After a failure, skip only the tests that need what the failed test should have saved
+        propagation = self._new_failure_propagation(category)
+        # --resume / --from-test: continue from a checkpoint instead of replaying setup
+        self._resume = self._resume_point_for(category)
+        self._checkpoint_target = (category.path.as_posix(), result)
+        if self._resume:
+            dict.update(context, self._resume.context)
+            print(f"  [Resume] Continuing run {self._resume.run_id} from checkpoint {self._resume.checkpoint.name} "
+                  f"({len(self._resume.skip)} test(s) already done)")
         
         # Start browser for this category
         self.events.emit(RunnerEvent.BROWSER_STARTING, {"category": category.name})
         
-        with sync_playwright() as playwright:
-            # Launch new browser
-            # Use channel='chrome' to use the real installed Chrome browser
-            # This bypasses most Cloudflare detection since it's a real browser
-            browser = playwright.chromium.launch(
-                headless=self.headless,
-                channel='chrome',  # Use real Chrome instead of Chromium
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                ]
-            )
-                
-            # Create context with realistic settings
-            # Video recording is enabled by default for debugging
-            # Videos are recorded to a temp location and moved to run storage after completion
-            video_dir = None
-            if self.record_video:
-                video_dir = Path.cwd() / ".temp_videos"
-                video_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Custom user agent with bypass string to avoid captcha
-                # The bypass string is specific to vcita's captcha allowlist
-                bypass_string = "#vUC5wTG98Hq5=BW+D_1c29744b-38df-4f40-8830-a7558ccbfa6b"
-                custom_user_agent = f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 {bypass_string}"
-                
-                browser_context = browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    user_agent=custom_user_agent,
-                    record_video_dir=str(video_dir) if video_dir else None,
-                    record_video_size={'width': 1920, 'height': 1080},
-                )
-                
-                # Minimal stealth - just hide webdriver flag
-                browser_context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-                
-                page = browser_context.new_page()
-            
-            # Track video start time for timestamp logging
-            import time as time_module
-            video_start_time = time_module.time()
-            video_timestamps = []  # List of (test_name, start_offset, end_offset, status)
+        # Create an isolated context (own cookies, storage and video) on the run's shared browser
+        # Video recording is enabled by default for debugging
+        # Videos are recorded to a temp location and moved to run storage after completion
+        video_dir = None
+        if self.record_video:
+            video_dir = Path.cwd() / ".temp_videos"
+            video_dir.mkdir(parents=True, exist_ok=True)
+        # Reuse the cached login (cookies + storage) so setup's fn_login lands on the dashboard
+        context_options = {}
+        session_state = self.session_cache.load(*self._session_account())
+        if self._resume and self._resume.storage_state:
+            context_options["storage_state"] = self._resume.storage_state
+        elif session_state:
+            context_options["storage_state"] = session_state
+            print("  [Session] Reusing cached login session")
+        self._session_saved = False
+        browser_context = self.browsers.new_context(video_dir=video_dir, video_size=self.video.size, **context_options)
+        self._blocker = ResourceBlocker.from_config(self.config, allowlist=category_allowlist(category_chain or [category]))
+        self._blocker.install(browser_context)
+        self.traces.start(browser_context)
+        page = browser_context.new_page()
+        if self._resume and self._resume.url:
+            try:
+                page.goto(self._resume.url, wait_until="domcontentloaded")
+            except Exception as e:
+                print(f"  [Resume] Could not open {self._resume.url}: {type(e).__name__}: {e}")
+        
+        # Track video start time for timestamp logging
+        import time as time_module
+        video_start_time = time_module.time()
+        video_timestamps = []  # List of (test_name, start_offset, end_offset, status)
             
-            self.events.emit(RunnerEvent.BROWSER_STARTED, {"category": category.name})
+        self.events.emit(RunnerEvent.BROWSER_STARTED, {"category": category.name})
             
-            try:
-                # Run setup if exists
-                if category.setup and category.setup.is_valid:
-                    test_start_offset = time_module.time() - video_start_time
-                    setup_result = self._run_single_test(
-                        test_path=self.tests_root / category.path / "_setup",
-                        test_name="_setup",
-                        test_type="setup",
-                        page=page,
-                        context=context,
-                        index=0,
-                        total=len(category.tests),
-                        category_name=category.name,
-                    )
-                    test_end_offset = time_module.time() - video_start_time
-                    video_timestamps.append(("_setup", test_start_offset, test_end_offset, setup_result.status))
-                    result.setup_result = setup_result
+        try:
+            # Run setup if exists
+            if category.setup and category.setup.is_valid:
+                test_start_offset = time_module.time() - video_start_time
+                setup_result = self._run_single_test(
+                    test_path=self.tests_root / category.path / "_setup",
+                    test_name="_setup",
+                    test_type="setup",
+                    page=page,
+                    context=context,
+                    index=0,
+                    total=len(category.tests),
+                    category_name=category.name,
+                )
+                test_end_offset = time_module.time() - video_start_time
+                video_timestamps.append(("_setup", test_start_offset, test_end_offset, setup_result.status))
+                result.setup_result = setup_result
                     
-                    # If setup fails, skip all tests
-                    if setup_result.status == "failed":
-                        result.stopped_early = True
-                        # Skip all tests
-                        for test in category.tests:
-                            result.test_results.append(TestResult(
-                                test_name=test.name,
-                                test_path=test.path,
-                                test_type="test",
-                                status="skipped",
-                                duration_ms=0,
-                                error="Skipped due to setup failure",
-                            ))
-                        # Still run teardown
-                        self._run_teardown_if_exists(
-                            category, page, context, result
-                        )
-                        return result
-
-                # Path mode: xxx/yyy/zzz -> root setup done; run each intermediate setup, then leaf setup + tests
-                if category_chain and len(category_chain) >= 2:
-                    for i in range(1, len(category_chain)):
-                        parent_cat = category_chain[i - 1]
-                        subcat = category_chain[i]
-                        path_str = "/".join((c.path.name for c in category_chain[: i + 1] if c.path))
-                        if subcat.setup and subcat.setup.is_valid:
-                            test_start_offset = time_module.time() - video_start_time
-                            setup_result = self._run_single_test(
-                                test_path=self.tests_root / subcat.path / "_setup",
-                                test_name=f"{subcat.name}/_setup",
-                                test_type="setup",
-                                page=page,
-                                context=context,
-                                index=0,
-                                total=len(subcat.tests),
-                                category_name=path_str,
-                            )
-                            test_end_offset = time_module.time() - video_start_time
-                            video_timestamps.append((f"{subcat.name}/_setup", test_start_offset, test_end_offset, setup_result.status))
-                            result.test_results.append(setup_result)
-                            if setup_result.status == "failed":
-                                result.stopped_early = True
-                                for test in category_chain[-1].tests:
-                                    result.test_results.append(TestResult(
-                                        test_name=f"{category_chain[-1].name}/{test.name}",
-                                        test_path=test.path,
-                                        test_type="test",
-                                        status="skipped",
-                                        duration_ms=0,
-                                        error=f"Skipped due to {subcat.name}/_setup failure",
-                                    ))
-                                # Teardown in reverse order: categories that were set up (0..i-1)
-                                self._run_teardown_chain_reverse(
-                                    category_chain[:i], page, context, result,
-                                    video_timestamps, video_start_time, time_module,
-                                )
-                                return result
-                    # Run leaf subcategory (setup already ran above for leaf, so skip setup)
-                    leaf = category_chain[-1]
-                    parent_of_leaf = category_chain[-2]
-                    subcat_failed, _ = self._run_subcategory_inline(
-                        subcategory=leaf,
-                        page=page,
-                        context=context,
-                        result=result,
-                        video_timestamps=video_timestamps,
-                        video_start_time=video_start_time,
-                        time_module=time_module,
-                        parent_category=parent_of_leaf,
-                        until_test=until_test,
-                        debug_test=debug_test,
-                        skip_setup=True,
+                # If setup fails, skip all tests
+                if setup_result.status == "failed":
+                    result.stopped_early = True
+                    # Skip all tests
+                    for test in category.tests:
+                        result.test_results.append(TestResult(
+                            test_name=test.name,
+                            test_path=test.path,
+                            test_type="test",
+                            status="skipped",
+                            duration_ms=0,
+                            error="Skipped due to setup failure",
+                        ))
+                    # Still run teardown
+                    self._run_teardown_if_exists(
+                        category, page, context, result
                     )
-                    if subcat_failed:
-                        result.stopped_early = True
-                    if not getattr(result, "until_test_reached", False) and not getattr(result, "debug_test_reached", False):
-                        # Teardown for parent chain only (leaf teardown already ran in _run_subcategory_inline)
-                        parent_chain = category_chain[:-1]
-                        if parent_chain:
+                    return result
+
+            # Path mode: xxx/yyy/zzz -> root setup done; run each intermediate setup, then leaf setup + tests
+            if category_chain and len(category_chain) >= 2:
+                for i in range(1, len(category_chain)):
+                    parent_cat = category_chain[i - 1]
+                    subcat = category_chain[i]
+                    path_str = "/".join((c.path.name for c in category_chain[: i + 1] if c.path))
+                    if subcat.setup and subcat.setup.is_valid:
+                        test_start_offset = time_module.time() - video_start_time
+                        setup_result = self._run_single_test(
+                            test_path=self.tests_root / subcat.path / "_setup",
+                            test_name=f"{subcat.name}/_setup",
+                            test_type="setup",
+                            page=page,
+                            context=context,
+                            index=0,
+                            total=len(subcat.tests),
+                            category_name=path_str,
+                        )
+                        test_end_offset = time_module.time() - video_start_time
+                        video_timestamps.append((f"{subcat.name}/_setup", test_start_offset, test_end_offset, setup_result.status))
+                        result.test_results.append(setup_result)
+                        if setup_result.status == "failed":
+                            result.stopped_early = True
+                            for test in category_chain[-1].tests:
+                                result.test_results.append(TestResult(
+                                    test_name=f"{category_chain[-1].name}/{test.name}",
+                                    test_path=test.path,
+                                    test_type="test",
+                                    status="skipped",
+                                    duration_ms=0,
+                                    error=f"Skipped due to {subcat.name}/_setup failure",
+                                ))
+                            # Teardown in reverse order: categories that were set up (0..i-1)
                             self._run_teardown_chain_reverse(
-                                parent_chain, page, context, result,
+                                category_chain[:i], page, context, result,
                                 video_timestamps, video_start_time, time_module,
                             )
-                else:
-                    # Build execution plan: interleave tests and subcategories based on run_after
-                    execution_plan = build_execution_plan(category)
-                    # If only one subcategory requested, use only that subcategory (don't filter the
-                    # full plan: run_after can leave the requested subcategory out of the plan).
-                    if subcategory_name:
-                        want = subcategory_name.strip().lower()
-                        chosen = None
-                        for subcat in category.subcategories or []:
-                            if subcat.name and subcat.name.strip().lower() == want:
+                            return result
+                # Run leaf subcategory (setup already ran above for leaf, so skip setup)
+                leaf = category_chain[-1]
+                parent_of_leaf = category_chain[-2]
+                subcat_failed, _ = self._run_subcategory_inline(
+                    subcategory=leaf,
+                    page=page,
+                    context=context,
+                    result=result,
+                    video_timestamps=video_timestamps,
+                    video_start_time=video_start_time,
+                    time_module=time_module,
+                    parent_category=parent_of_leaf,
+                    until_test=until_test,
+                    debug_test=debug_test,
+                    skip_setup=True,
+                    propagation=propagation,
+                )
+                if subcat_failed:
+                    result.stopped_early = True
+                if not getattr(result, "until_test_reached", False) and not getattr(result, "debug_test_reached", False):
+                    # Teardown for parent chain only (leaf teardown already ran in _run_subcategory_inline)
+                    parent_chain = category_chain[:-1]
+                    if parent_chain:
+                        self._run_teardown_chain_reverse(
+                            parent_chain, page, context, result,
+                            video_timestamps, video_start_time, time_module,
+                        )
+            else:
+                # Build execution plan: interleave tests and subcategories based on run_after
+                execution_plan = build_execution_plan(category)
+                # If only one subcategory requested, use only that subcategory (don't filter the
+                # full plan: run_after can leave the requested subcategory out of the plan).
+                if subcategory_name:
+                    want = subcategory_name.strip().lower()
+                    chosen = None
+                    for subcat in category.subcategories or []:
+                        if subcat.name and subcat.name.strip().lower() == want:
+                            chosen = subcat
+                            break
+                        if subcat.path:
+                            path_str = subcat.path.as_posix().lower()
+                            if path_str.endswith("/" + want) or path_str == want or subcat.path.name.strip().lower() == want:
                                 chosen = subcat
                                 break
-                            if subcat.path:
-                                path_str = subcat.path.as_posix().lower()
-                                if path_str.endswith("/" + want) or path_str == want or subcat.path.name.strip().lower() == want:
-                                    chosen = subcat
-                                    break
-                        if chosen is not None:
-                            execution_plan = [chosen]
-                        else:
-                            result.stopped_early = True
-                            available = [s.name for s in (category.subcategories or [])]
-                            result.test_results.append(TestResult(
-                                test_name=f"_subcategory_{subcategory_name}",
-                                test_path=category.path,
-                                test_type="test",
-                                status="failed",
-                                duration_ms=0,
-                                error=f"Subcategory '{subcategory_name}' not found. Available: {available}",
-                            ))
-                            execution_plan = []
-                    total_items = len(execution_plan)
-
-                    # Run tests and subcategories in order
-                    for index, item in enumerate(execution_plan):
-                        if isinstance(item, Test):
-                            # Run a test
-                            test = item
+                    if chosen is not None:
+                        execution_plan = [chosen]
+                    else:
+                        result.stopped_early = True
+                        available = [s.name for s in (category.subcategories or [])]
+                        result.test_results.append(TestResult(
+                            test_name=f"_subcategory_{subcategory_name}",
+                            test_path=category.path,
+                            test_type="test",
+                            status="failed",
+                            duration_ms=0,
+                            error=f"Subcategory '{subcategory_name}' not found. Available: {available}",
+                        ))
+                        execution_plan = []
+                total_items = len(execution_plan)
 
-                            # Build test name variants for until_test / debug_test matching
-                            test_full_name = f"{category.name}/{test.name}" if hasattr(category, 'name') else test.name
-                            test_full_id = f"{category.name}/{test.id}" if hasattr(category, 'name') else test.id
-                            subcategory_prefix = ""
-                            if hasattr(category, 'subcategories') and category.subcategories:
-                                for subcat in category.subcategories:
-                                    if test in subcat.tests:
-                                        subcategory_prefix = f"{subcat.name}/"
-                                        break
-                            test_with_subcat = f"{subcategory_prefix}{test.name}"
-                            test_id_with_subcat = f"{subcategory_prefix}{test.id}"
+                # Run tests and subcategories in order
+                for index, item in enumerate(execution_plan):
+                    if isinstance(item, Test):
+                        # Run a test
+                        test = item
 
-                            def _test_matches_target(test, target: str) -> bool:
-                                if not target:
-                                    return False
-                                return (
-                                    test.name == target or test.id == target or
-                                    test_full_name == target or test_full_id == target or
-                                    test_with_subcat == target or test_id_with_subcat == target or
-                                    target in test.name or target in test.id or
-                                    target in test_full_name or target in test_full_id
-                                )
+                        # Build test name variants for until_test / debug_test matching
+                        test_full_name = f"{category.name}/{test.name}" if hasattr(category, 'name') else test.name
+                        test_full_id = f"{category.name}/{test.id}" if hasattr(category, 'name') else test.id
+                        subcategory_prefix = ""
+                        if hasattr(category, 'subcategories') and category.subcategories:
+                            for subcat in category.subcategories:
+                                if test in subcat.tests:
+                                    subcategory_prefix = f"{subcat.name}/"
+                                    break
+                        test_with_subcat = f"{subcategory_prefix}{test.name}"
+                        test_id_with_subcat = f"{subcategory_prefix}{test.id}"
 
-                            # Check if we should stop before this test (for MCP debugging)
-                            if until_test and _test_matches_target(test, until_test):
-                                result.stopped_early = True
-                                result.until_test_reached = True
-                                result.until_test_next_test = test_with_subcat or test_full_name or test.name
-                                self._skip_remaining_items(execution_plan[index:], result, test.name)
-                                break
+                        def _test_matches_target(test, target: str) -> bool:
+                            if not target:
+                                return False
+                            return (
+                                test.name == target or test.id == target or
+                                test_full_name == target or test_full_id == target or
+                                test_with_subcat == target or test_id_with_subcat == target or
+                                target in test.name or target in test.id or
+                                target in test_full_name or target in test_full_id
+                            )
 
-                            # If --debug-test: run this test with step_callback (pause after each minor action), then stop
-                            if debug_test and _test_matches_target(test, debug_test):
-                                context["step_callback"] = _get_step_callback_for_debug()
-                                print(f"\n  [--debug-test] Running test with pause after each action: {test_with_subcat or test.name}")
-                                test_start_offset = time_module.time() - video_start_time
-                                test_result = self._run_single_test(
-                                    test_path=test.path,
-                                    test_name=test.name,
-                                    test_type="test",
-                                    page=page,
-                                    context=context,
-                                    index=index + 1,
-                                    total=total_items,
-                                    category_name=category.name,
-                                )
-                                test_end_offset = time_module.time() - video_start_time
-                                video_timestamps.append((test.name, test_start_offset, test_end_offset, test_result.status))
-                                result.test_results.append(test_result)
-                                result.stopped_early = True
-                                result.debug_test_reached = True
-                                if test_result.status == "failed":
-                                    self.events.emit(RunnerEvent.TEST_FAILED, {
-                                        "test": test.name,
-                                        "error": test_result.error,
-                                        "error_type": getattr(test_result, 'error_type', None),
-                                    })
-                                self._skip_remaining_items(execution_plan[index + 1:], result, test.name)
-                                break
+                        # Check if we should stop before this test (for MCP debugging)
+                        if until_test and _test_matches_target(test, until_test):
+                            result.stopped_early = True
+                            result.until_test_reached = True
+                            result.until_test_next_test = test_with_subcat or test_full_name or test.name
+                            self._skip_remaining_items(execution_plan[index:], result, test.name)
+                            break
 
+                        # If --debug-test: run this test with step_callback (pause after each minor action), then stop
+                        if debug_test and _test_matches_target(test, debug_test):
+                            context["step_callback"] = _get_step_callback_for_debug()
+                            print(f"\n  [--debug-test] Running test with pause after each action: {test_with_subcat or test.name}")
                             test_start_offset = time_module.time() - video_start_time
                             test_result = self._run_single_test(
                                 test_path=test.path,
@@ -738,149 +832,182 @@ class TestRunner:
                             test_end_offset = time_module.time() - video_start_time
                             video_timestamps.append((test.name, test_start_offset, test_end_offset, test_result.status))
                             result.test_results.append(test_result)
-
+                            result.stopped_early = True
+                            result.debug_test_reached = True
                             if test_result.status == "failed":
-                                result.stopped_early = True
-                                self._skip_remaining_items(execution_plan[index + 1:], result, test.name)
+                                self.events.emit(RunnerEvent.TEST_FAILED, {
+                                    "test": test.name,
+                                    "error": test_result.error,
+                                    "error_type": getattr(test_result, 'error_type', None),
+                                })
+                            self._skip_remaining_items(execution_plan[index + 1:], result, test.name)
+                            break
+
+                        skip_reason = propagation.blocker(test.name, test.path)
+                        if skip_reason:
+                            result.test_results.append(self._skipped_result(test.name, test.path, skip_reason))
+                            propagation.skipped(test.name, test.path)
+                            continue
+
+                        start_url = page.url
+                        test_start_offset = time_module.time() - video_start_time
+                        test_result = self._run_single_test(
+                            test_path=test.path,
+                            test_name=test.name,
+                            test_type="test",
+                            page=page,
+                            context=context,
+                            index=index + 1,
+                            total=total_items,
+                            category_name=category.name,
+                        )
+                        test_end_offset = time_module.time() - video_start_time
+                        video_timestamps.append((test.name, test_start_offset, test_end_offset, test_result.status))
+                        result.test_results.append(test_result)
+
+                        if test_result.status == "failed":
+                            result.stopped_early = True
+                            propagation.failed(test.name, test.path)
+                            if propagation.blocked_by:
+                                self._skip_remaining_items(execution_plan[index + 1:], result, propagation.blocked_by)
                                 break
+                            self._recover_page_after_failure(page, start_url)
 
-                        elif isinstance(item, Category):
-                            subcategory = item
-                            subcat_failed, failed_test_name = self._run_subcategory_inline(
-                                subcategory=subcategory,
-                                page=page,
-                                context=context,
-                                result=result,
-                                video_timestamps=video_timestamps,
-                                video_start_time=video_start_time,
-                                time_module=time_module,
-                                parent_category=category,
-                                until_test=until_test,
-                                debug_test=debug_test,
-                            )
-                            if subcat_failed:
-                                result.stopped_early = True
-                                self._skip_remaining_items(execution_plan[index + 1:], result, failed_test_name)
+                    elif isinstance(item, Category):
+                        subcategory = item
+                        subcat_failed, failed_test_name = self._run_subcategory_inline(
+                            subcategory=subcategory,
+                            page=page,
+                            context=context,
+                            result=result,
+                            video_timestamps=video_timestamps,
+                            video_start_time=video_start_time,
+                            time_module=time_module,
+                            parent_category=category,
+                            until_test=until_test,
+                            debug_test=debug_test,
+                            propagation=propagation,
+                        )
+                        if subcat_failed:
+                            result.stopped_early = True
+                            # Interactive stops and unknown failures end the plan; otherwise skip per test
+                            if (
+                                getattr(result, "until_test_reached", False)
+                                or getattr(result, "debug_test_reached", False)
+                                or propagation.blocked_by
+                            ):
+                                self._skip_remaining_items(
+                                    execution_plan[index + 1:], result, propagation.blocked_by or failed_test_name,
+                                )
                                 break
 
-                    # Run teardown if exists (always, even on failure, unless until_test or debug_test was reached)
-                    if not getattr(result, 'until_test_reached', False) and not getattr(result, 'debug_test_reached', False):
-                        self._run_teardown_if_exists(category, page, context, result)
+                # Run teardown if exists (always, even on failure, unless until_test or debug_test was reached)
+                if not getattr(result, 'until_test_reached', False) and not getattr(result, 'debug_test_reached', False):
+                    self._run_teardown_if_exists(category, page, context, result)
                 
-            finally:
-                # Get video path before closing (if recording enabled)
-                video_path = None
-                if self.record_video and page.video:
-                    video_path = page.video.path()
+        finally:
+            # Get video path before closing (if recording enabled)
+            video_path = None
+            if self.record_video and page.video:
+                video_path = page.video.path()
                 
-                # If until_test was reached: dump context for MCP (new session), then keep browser open for manual debug.
-                if getattr(result, 'until_test_reached', False):
-                    import json as _json
-                    next_test = getattr(result, 'until_test_next_test', '')
-                    dump = {
-                        "next_test": next_test,
-                        "url": page.url,
-                        "title": page.title(),
-                        "context": {k: ("***" if k == "password" else v) for k, v in context.items()},
-                    }
-                    run_dir = self.storage.get_current_run_dir(category.name)
-                    run_dir.mkdir(parents=True, exist_ok=True)
-                    context_path = run_dir / "until_test_context.json"
-                    with open(context_path, "w", encoding="utf-8") as f:
-                        _json.dump(dump, f, indent=2)
-                    print("\n  [--until-test] Stopped before test:", next_test)
-                    print(f"  [--until-test] Context saved to: {context_path}")
-                    print(f"  [--until-test] Next test would start at URL: {dump['url']}")
-                    print(f"  [--until-test] Browser left open for manual debugging. (To debug with MCP, start a new MCP session and use this context/URL.)")
-                    try:
-                        import sys
-                        if sys.stdin.isatty():
-                            input("  [>] Press Enter to close browser and continue...")
-                        else:
-                            raise EOFError("Non-interactive")
-                    except (EOFError, KeyboardInterrupt):
-                        pass
-                    self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
-                    browser_context.close()
-                    browser.close()
-                # If debug_test was reached: keep browser open so user can inspect
-                elif getattr(result, 'debug_test_reached', False):
-                    print("\n  [--debug-test] Target test completed. Browser left open for inspection.")
-                    try:
-                        import sys
-                        if sys.stdin.isatty():
-                            input("  [>] Press Enter to close browser and continue...")
-                        else:
-                            raise EOFError("Non-interactive")
-                    except (EOFError, KeyboardInterrupt):
-                        pass
-                    self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
-                    browser_context.close()
-                    browser.close()
-                # If keep_open is enabled and there was a failure (but not until_test/debug_test), wait for user
-                elif self.keep_open and result.stopped_early:
-                    print("\n  [!] Browser kept open for debugging (--keep-open flag)")
-                    print(f"  [>] Current URL: {page.url}")
-                    print(f"  [>] Current Title: {page.title()}")
-                    try:
+            # If until_test was reached: dump context for MCP (new session), then keep browser open for manual debug.
+            if getattr(result, 'until_test_reached', False):
+                import json as _json
+                next_test = getattr(result, 'until_test_next_test', '')
+                dump = {
+                    "next_test": next_test,
+                    "url": page.url,
+                    "title": page.title(),
+                    "context": {k: ("***" if k == "password" else v) for k, v in context.items()},
+                }
+                run_dir = self.storage.get_current_run_dir(category.name)
+                run_dir.mkdir(parents=True, exist_ok=True)
+                context_path = run_dir / "until_test_context.json"
+                with open(context_path, "w", encoding="utf-8") as f:
+                    _json.dump(dump, f, indent=2)
+                print("\n  [--until-test] Stopped before test:", next_test)
+                print(f"  [--until-test] Context saved to: {context_path}")
+                print(f"  [--until-test] Next test would start at URL: {dump['url']}")
+                print(f"  [--until-test] Browser left open for manual debugging. (To debug with MCP, start a new MCP session and use this context/URL.)")
+                try:
+                    import sys
+                    if sys.stdin.isatty():
+                        input("  [>] Press Enter to close browser and continue...")
+                    else:
+                        raise EOFError("Non-interactive")
+                except (EOFError, KeyboardInterrupt):
+                    pass
+                self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
+                browser_context.close()
+            # If debug_test was reached: keep browser open so user can inspect
+            elif getattr(result, 'debug_test_reached', False):
+                print("\n  [--debug-test] Target test completed. Browser left open for inspection.")
+                try:
+                    import sys
+                    if sys.stdin.isatty():
                         input("  [>] Press Enter to close browser and continue...")
-                    except (EOFError, KeyboardInterrupt):
-                        print("\n  [>] Closing browser...")
-                    # Close browser after waiting
-                    self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
-                    browser_context.close()  # Close context first to finalize video
-                    browser.close()
+                    else:
+                        raise EOFError("Non-interactive")
+                except (EOFError, KeyboardInterrupt):
+                    pass
+                self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
+                browser_context.close()
+            # If keep_open is enabled and there was a failure (but not until_test/debug_test), wait for user
+            elif self.keep_open and result.stopped_early:
+                print("\n  [!] Browser kept open for debugging (--keep-open flag)")
+                print(f"  [>] Current URL: {page.url}")
+                print(f"  [>] Current Title: {page.title()}")
+                try:
+                    input("  [>] Press Enter to close browser and continue...")
+                except (EOFError, KeyboardInterrupt):
+                    print("\n  [>] Closing browser...")
+                # Close browser after waiting
+                self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
+                browser_context.close()  # Finalizes the video; the browser stays up for the next category
                 
-                else:
-                    # Close browser normally
-                    self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
-                    browser_context.close()  # Close context first to finalize video
-                    browser.close()
+            else:
+                # Close browser normally
+                self.events.emit(RunnerEvent.BROWSER_CLOSING, {"category": category.name})
+                browser_context.close()  # Finalizes the video; the browser stays up for the next category
                 
-                # Process video and save to storage
-                # Wait briefly for video file to appear (Playwright may finalize async on some systems)
-                final_video_path = None
-                if video_path:
-                    import time as _time
-                    for _ in range(30):  # up to ~3 seconds
-                        if Path(video_path).exists():
-                            break
-                        _time.sleep(0.1)
-                if video_path and Path(video_path).exists():
-                    # Temporarily rename video with category name for identification
-                    temp_video_path = Path(video_path).parent / f"{category.name}_{self.storage.current_run_id}.webm"
-                    Path(video_path).rename(temp_video_path)
-                    final_video_path = temp_video_path
+            # Decide on the video; storage moves (and links) it in the background
+            final_video_path = None
+            if video_path and not self.video.keep(result):
+                self.storage.artifacts.remove(Path(video_path))
+                print(f"  [Video] Not kept ({self.video.mode}: {self.video.discard_reason()})")
+            elif video_path:
+                final_video_path = Path(video_path)
                     
-                    # Print video timestamps for easy navigation
-                    if video_timestamps:
-                        print(f"  [Video] Timeline:")
-                        for test_name, start, end, status in video_timestamps:
-                            start_str = f"{int(start//60):02d}:{int(start%60):02d}"
-                            end_str = f"{int(end//60):02d}:{int(end%60):02d}"
-                            status_icon = ">" if status == "passed" else "X" if status == "failed" else "-"
-                            print(f"    [{status_icon}] {start_str} - {end_str} : {test_name}")
-        
-        # Save category result to storage (will move video to _runs folder)
+                # Print video timestamps for easy navigation
+                if video_timestamps:
+                    print(f"  [Video] Timeline:")
+                    for test_name, start, end, status in video_timestamps:
+                        start_str = f"{int(start//60):02d}:{int(start%60):02d}"
+                        end_str = f"{int(end//60):02d}:{int(end%60):02d}"
+                        status_icon = ">" if status == "passed" else "X" if status == "failed" else "-"
+                        print(f"    [{status_icon}] {start_str} - {end_str} : {test_name}")
+            
+            # Also when a _setup failure returned early: return the leases (dirty) and end the resume
+            self._release_data_pool(context, result)
+            resumed = self._resume is not None
+            self._resume = None
+            self._checkpoint_target = None
+        
+        # Save category result to storage (video goes to the _runs folder and each
+        # subcategory run dir, so it is visible there too)
         self.storage.save_category_result(
             category=category.name,
             result=result,
             video_path=final_video_path,
+            video_links=list(getattr(self, "_saved_subcategory_paths", None) or []),
         )
 
-        # Copy parent video into each subcategory run dir so video is visible there too
-        if final_video_path is not None and getattr(self, "_saved_subcategory_paths", None):
-            parent_video = self.storage.get_current_run_dir(category.name) / "video.webm"
-            if parent_video.exists():
-                for subcat_path in self._saved_subcategory_paths:
-                    subcat_run_dir = self.storage.get_current_run_dir(subcat_path)
-                    subcat_run_dir.mkdir(parents=True, exist_ok=True)
-                    dest_video = subcat_run_dir / "video.webm"
-                    if dest_video != parent_video:
-                        shutil.copy2(str(parent_video), str(dest_video))
-
-        # Save context for debugging
+        # Save context for debugging, and the key dependencies between the tests that ran
         self.context_manager.save_to_file(f"{category.name}_context.json")
+        # A resumed run skips tests, so its accesses would under-report reads
+        if not resumed:
+            self._save_dependency_graph(category, context)
         
         # Emit category completed
         self.events.emit(RunnerEvent.CATEGORY_COMPLETED, {
@@ -983,18 +1110,323 @@ class TestRunner:
             "category": category_name,
         })
         
+        if self._resume and self._resume.skips(test_name):
+            result = TestResult(
+                test_name=test_name,
+                test_path=test_path,
+                test_type=test_type,
+                status="skipped",
+                duration_ms=0,
+                error=f"Resumed: already ran in run {self._resume.run_id}",
+            )
+            # Checkpoint it too, so this run can be resumed even if nothing after it passes
+            self._save_checkpoint(test_name, page, context, status=STATUS_RESUMED)
+            self._record_test_result(result, test_type, category_name, context)
+            return result
+        
+        # Snapshot what a retry needs before the test mutates context or navigates away
+        context_before = self._snapshot_context(context) if self._retries_for(test_type) else None
+        start_url = page.url
+        
         # Execute the test
-        result = self.executor.execute(
-            test_path=test_path,
-            test_type=test_type,
-            page=page,
-            context=context,
-        )
+        tracked = isinstance(context, TrackedContext)
+        if tracked:
+            context.begin(test_name)
+        if self._blocker:
+            self._blocker.begin(page)
+        self.traces.begin(test_name)
+        result = None
+        try:
+            result = self.executor.execute(
+                test_path=test_path,
+                test_type=test_type,
+                page=page,
+                context=context,
+            )
+            if result.status == "failed" and context_before is not None:
+                result = self._retry_failed_test(
+                    result, test_path, test_type, test_name, page, context, context_before, start_url,
+                )
+        finally:
+            if tracked:
+                context.end()
+            blocked = self._blocker.end(page) if self._blocker else None
+            trace = self.traces.end(failed=result is None or result.status == "failed")
+        if blocked:
+            result.metrics["blocked_requests"] = blocked
+        if trace:
+            result.trace = trace
         
         # Update test_name to match the passed parameter (important for subcategory tests)
         # The executor uses test_path.name, but we want the full name with subcategory prefix
         result.test_name = test_name
         
+        # Cache the login once a setup has signed in, so later categories skip the login form
+        if test_type == "setup" and result.status == "passed":
+            self._save_session_if_logged_in(page, context)
+        if result.status == "passed":
+            self._save_checkpoint(test_name, page, context)
+        
+        self._record_test_result(result, test_type, category_name, context)
+        return result
+    
+    def _retries_for(self, test_type: str) -> int:
+        """
+        Number of retries for a failed test (execution.retry_on_failure).
+        
+        Only regular tests are retried; setup/teardown failures and interactive runs
+        (--keep-open, --debug-test) are reported on the first failure.
+        """
+        if test_type != "test" or self.keep_open or self.debug_test:
+            return 0
+        return self.retry_on_failure
+    
+    def _retry_failed_test(
+        self,
+        result: TestResult,
+        test_path: Path,
+        test_type: str,
+        test_name: str,
+        page: Page,
+        context: dict,
+        context_before: dict,
+        start_url: str,
+    ) -> TestResult:
+        """
+        Re-run a failed test up to execution.retry_on_failure times.
+        
+        Each retry restores the context saved before the first attempt and reloads the page at
+        the URL the test started from. The category's page is reused (it owns the video and the
+        following tests run on it); popups left by the failed attempt are closed. From the second
+        retry on, the _setup chain of the test's category path is replayed first (e.g.
+        clients/_setup, then clients/notes/_setup), which recovers a lost session without
+        rerunning the rest of the category; the chain's teardowns run before it, so the
+        entities of the first setups are deleted rather than orphaned.
+        
+        Returns:
+            Result of the last attempt, with every attempt recorded in result.attempts
+        """
+        retries = self._retries_for(test_type)
+        attempts = [self._attempt_entry(1, result, setup_replayed=False)]
+        for attempt in range(2, retries + 2):
+            self.events.emit(RunnerEvent.TEST_PROGRESS, {
+                "test": test_name,
+                "message": f"Retrying after failure (attempt {attempt}/{retries + 1})",
+            })
+            self._restore_context(context, context_before)
+            replay_setup = attempt > 2
+            error = self._reset_page_for_retry(page, start_url)
+            if error is None and replay_setup:
+                error = self._replay_setup_chain(test_path, test_name, page, context)
+                if error is None:
+                    # Later attempts restore the replayed setups' entities, not the deleted ones
+                    context_before = self._snapshot_context(context)
+            if error is not None:
+                # Could not prepare the retry: keep the last real failure
+                attempts.append({
+                    "attempt": attempt,
+                    "status": "failed",
+                    "duration_ms": 0,
+                    "error": error,
+                    "error_type": "RetryError",
+                    "setup_replayed": replay_setup,
+                })
+                break
+            self._discard_screenshot(result)
+            result = self.executor.execute(
+                test_path=test_path,
+                test_type=test_type,
+                page=page,
+                context=context,
+            )
+            attempts.append(self._attempt_entry(attempt, result, setup_replayed=replay_setup))
+            if result.status != "failed":
+                break
+        result.attempts = attempts
+        return result
+    
+    @staticmethod
+    def _attempt_entry(attempt: int, result: TestResult, setup_replayed: bool) -> dict:
+        """Summary of one attempt for TestResult.attempts / result.json."""
+        return {
+            "attempt": attempt,
+            "status": result.status,
+            "duration_ms": result.duration_ms,
+            "error": result.error,
+            "error_type": result.error_type,
+            "setup_replayed": setup_replayed,
+        }
+    
+    @staticmethod
+    def _snapshot_context(context: dict) -> dict:
+        """Deep copy of the context (shallow copy if some value cannot be deep-copied)."""
+        try:
+            return copy.deepcopy(context)
+        except Exception:
+            return dict(context)
+    
+    @staticmethod
+    def _restore_context(context: dict, snapshot: dict, keys: Optional[set] = None) -> None:
+        """
+        Restore context in place (tests and the runner hold references to the same dict).
+        
+        Args:
+            context: Context to restore
+            snapshot: Copy taken before the first attempt
+            keys: Restore only these keys (e.g. the keys a test wrote while other tests run
+                  concurrently on the same context); None restores everything
+        """
+        snapshot = copy.deepcopy(snapshot) if snapshot else {}
+        # dict methods directly: restoring is not an access by the test (see TrackedContext)
+        if keys is None:
+            dict.clear(context)
+            dict.update(context, snapshot)
+            return
+        for key in keys:
+            if key in snapshot:
+                dict.__setitem__(context, key, snapshot[key])
+            else:
+                dict.pop(context, key, None)
+    
+    @staticmethod
+    def _reset_page_for_retry(page: Page, start_url: str) -> Optional[str]:
+        """
+        Close extra pages and reload the page at start_url.
+        
+        Returns:
+            Error message, or None on success
+        """
+        try:
+            for other in page.context.pages:
+                if other != page:
+                    other.close()
+            page.goto("about:blank")
+            if start_url and start_url != "about:blank":
+                page.goto(start_url, wait_until="domcontentloaded")
+        except Exception as e:
+            return f"Could not reset page for retry: {type(e).__name__}: {e}"
+        return None
+    
+    def _setup_chain_for(self, test_path: Path) -> List[Category]:
+        """Category chain [root, ..., parent of test] for a test folder under tests_root."""
+        try:
+            relative = Path(test_path).resolve().relative_to(self.tests_root.resolve())
+        except ValueError:
+            return []
+        return self._resolve_category_path(relative.parent.as_posix()) or []
+    
+    def _replay_setup_chain(self, test_path: Path, test_name: str, page: Page, context: dict) -> Optional[str]:
+        """
+        Re-run the setup chain of a test: the _teardown of every category from the test's
+        category up to the root (deleting what the first setups created), then the _setup of
+        every category from the root down.
+        
+        Results are not saved again; the first run's results stay in the run. Context accesses
+        of the replay are not recorded as the test's (dependency graph).
+        
+        Returns:
+            Error message, or None on success
+        """
+        tracked = isinstance(context, TrackedContext)
+        if tracked:
+            context.end()
+        try:
+            for step_path, test_type in self._setup_replay_steps(test_path):
+                step_result = self.executor.execute(
+                    test_path=step_path,
+                    test_type=test_type,
+                    page=page,
+                    context=context,
+                )
+                if step_result.status == "failed":
+                    self._discard_screenshot(step_result)
+                    return self._replay_error(step_path, step_result)
+        finally:
+            if tracked:
+                context.begin(test_name)
+        return None
+    
+    def _setup_replay_steps(self, test_path: Path) -> List[Tuple[Path, str]]:
+        """(folder, test_type) of a setup replay: teardowns from the test's category up, then setups down."""
+        chain = self._setup_chain_for(test_path)
+        steps = [(cat, "_teardown", "teardown", cat.teardown) for cat in reversed(chain)]
+        steps += [(cat, "_setup", "setup", cat.setup) for cat in chain]
+        return [
+            (self.tests_root / cat.path / folder, test_type)
+            for cat, folder, test_type, item in steps
+            if item and item.is_valid
+        ]
+    
+    def _replay_error(self, step_path: Path, result: TestResult) -> str:
+        """RetryError message of a failed setup replay step."""
+        try:
+            where = Path(step_path).relative_to(self.tests_root).as_posix()
+        except ValueError:
+            where = Path(step_path).as_posix()
+        return f"Setup replay failed at {where}: {result.error}"
+    
+    @staticmethod
+    def _discard_screenshot(result: TestResult) -> None:
+        """Drop the in-memory screenshot of an attempt that is being superseded."""
+        result.screenshot_data = None
+    
+    def _release_data_pool(self, context: dict, result: CategoryResult) -> None:
+        """Janitor: return what the category leased from the data pool (dirty if it failed)."""
+        if not self.data_pool.enabled or not context.get(OWNER_KEY):
+            return
+        try:
+            setup_failed = result.setup_result is not None and result.setup_result.status == "failed"
+            released = self.data_pool.release_owner(
+                context[OWNER_KEY], dirty=setup_failed or result.status in ("failed", "partial"),
+            )
+            if released:
+                print(f"  [Pool] Returned {released} leased entit{'y' if released == 1 else 'ies'} to the data pool")
+        except Exception as e:
+            print(f"  [Pool] Could not release leases: {type(e).__name__}: {e}")
+    
+    @staticmethod
+    def _save_dependency_graph(category: Category, context: dict) -> None:
+        """Merge the context accesses of this category run into its dependency graph file."""
+        if not isinstance(context, TrackedContext) or not context.accesses:
+            return
+        try:
+            graph = DependencyGraph.load(category.path.as_posix())
+            graph.record(context)
+            graph.save()
+        except Exception as e:
+            print(f"  [Dependencies] Could not save dependency graph: {type(e).__name__}: {e}")
+    
+    def _apply_target_to_context(self, context: dict) -> None:
+        """Seed a fresh test context with base_url and credentials from the target config."""
+        if not self.run_config:
+            return
+        if self.run_config.get("base_url"):
+            context["base_url"] = self.run_config["base_url"]
+        auth = self.run_config.get("auth")
+        if isinstance(auth, dict):
+            if auth.get("username"):
+                context["username"] = auth["username"]
+            if auth.get("password"):
+                context["password"] = auth["password"]
+    
+    def _record_test_result(
+        self,
+        result: TestResult,
+        test_type: str,
+        category_name: str,
+        context: dict,
+    ) -> None:
+        """
+        Emit completion events, save the result to storage and create a heal request on failure.
+        
+        Args:
+            result: Result of the test (test_name already set to the display name)
+            test_type: Type (test, setup, teardown)
+            category_name: Name of the category (storage path, e.g. "clients/notes")
+            context: Shared context (included in the heal request)
+        """
+        test_name = result.test_name
+        
         # Emit test completed
         self.events.emit(RunnerEvent.TEST_COMPLETED, {
             "test": test_name,
@@ -1005,11 +1437,12 @@ class TestRunner:
         # Save test result to storage
         # Extract simple test name (handle subcategory paths like "services/create_service")
         simple_test_name = test_name.split("/")[-1] if "/" in test_name else test_name
+        # Written in the background; points result.screenshot/trace at the run dir
         self.storage.save_test_result(
             category=category_name,
             test_name=simple_test_name,
             result=result,
-            screenshot_path=result.screenshot,
+            trace_path=result.trace,
         )
         
         # If failed, generate heal request and emit event
@@ -1020,28 +1453,82 @@ class TestRunner:
                 "error_type": result.error_type,
             })
             
-            # Generate heal request
-            heal_path = self.heal_generator.generate(
+            # Generate heal request (.cursor/heal_requests/ copy written now, run storage copy by the writer)
+            heal_path, heal_content = self.heal_generator.build(
                 result=result,
                 category_name=category_name,
                 context=context,
                 config=self.run_config,
             )
-            
-            # Copy heal request to storage
-            if heal_path:
-                self.storage.save_heal_request(
-                    category=category_name,
-                    test_name=simple_test_name,
-                    heal_request_path=heal_path,
-                )
+            self.storage.save_heal_request(
+                category=category_name,
+                test_name=simple_test_name,
+                heal_request_path=heal_path,
+                content=heal_content,
+            )
             
             self.events.emit(RunnerEvent.HEAL_REQUEST_CREATED, {
                 "test": test_name,
                 "path": str(heal_path),
             })
-        
-        return result
+    
+    def _resume_point_for(self, category: Category) -> Optional[ResumePoint]:
+        """Checkpoint a category run continues from (--resume / --from-test), or None."""
+        if not (self.resume_run_id or self.from_test):
+            return None
+        point = self.checkpoints.resume_point(
+            category.path.as_posix(), run_id=self.resume_run_id, from_test=self.from_test,
+        )
+        if point is None:
+            print(f"  [Resume] No checkpoint for {category.name} - running it from the start")
+        return point
+    
+    def _save_checkpoint(self, test_name: str, page: Page, context: dict, status: str = "passed") -> None:
+        """Write a checkpoint after a passing test (context, storage_state, URL, position in the plan)."""
+        if not self.checkpoints.enabled or self._checkpoint_target is None or not self.storage.current_run_id:
+            return
+        category_path, result = self._checkpoint_target
+        done = ([result.setup_result] if result.setup_result else []) + result.test_results
+        # Tests this run skipped because a resumed run had done them stay done for the next --resume
+        sequence = [
+            {"name": r.test_name, "status": STATUS_RESUMED if self._was_resumed(r) else r.status} for r in done
+        ]
+        sequence.append({"name": test_name, "status": status})
+        # Seeded keys (target URL, credentials) come from config.yaml again on resume
+        seeded = getattr(context, "seeded_keys", set())
+        try:
+            self.checkpoints.save(
+                self.storage.current_run_id,
+                category_path,
+                test_name,
+                sequence,
+                {k: v for k, v in context.items() if k not in seeded},
+                page.context.storage_state(),
+                page.url,
+            )
+        except Exception as e:
+            print(f"  [Checkpoint] Could not save checkpoint: {type(e).__name__}: {e}")
+    
+    def _was_resumed(self, result: TestResult) -> bool:
+        """True if result is a test this run skipped because the resumed run had done it."""
+        return result.status == "skipped" and self._resume is not None and self._resume.skips(result.test_name)
+    
+    def _session_account(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return (base_url, username) of the configured target account."""
+        if not self.run_config:
+            return None, None
+        auth = self.run_config.get("auth") if isinstance(self.run_config.get("auth"), dict) else {}
+        return self.run_config.get("base_url"), auth.get("username")
+    
+    def _save_session_if_logged_in(self, page: Page, context: dict) -> None:
+        """Save the context's storage_state to the session cache (once per category) after login."""
+        if self._session_saved or not context.get("logged_in_user"):
+            return
+        base_url, username = self._session_account()
+        if context.get("logged_in_user") != username:
+            return  # e.g. create_user signed in as a different account
+        if self.session_cache.save(page.context, base_url, username):
+            self._session_saved = True
     
     def _build_execution_plan(self, category: Category) -> List:
         """Delegate to module-level build_execution_plan (same order as GUI)."""
@@ -1083,6 +1570,41 @@ class TestRunner:
                         error=f"Skipped due to {failed_test_name} failure",
                     ))
     
+    def _new_failure_propagation(self, category: Category) -> FailurePropagation:
+        """Failure propagation for a category run (uses the category's recorded dependency graph)."""
+        return FailurePropagation(DependencyGraph.load(category.path.as_posix()), mode=self.skip_mode)
+    
+    @staticmethod
+    def _skipped_result(test_name: str, test_path: Path, reason: str) -> TestResult:
+        """Result of a test skipped because a test it depends on failed."""
+        return TestResult(
+            test_name=test_name,
+            test_path=test_path,
+            test_type="test",
+            status="skipped",
+            duration_ms=0,
+            error=reason,
+        )
+    
+    def _recover_page_after_failure(self, page: Page, start_url: str) -> None:
+        """Put the page back where the failed test started, so the next test starts from a known state."""
+        error = self._reset_page_for_retry(page, start_url)
+        if error:
+            print(f"  [Skip] {error}")
+    
+    def _skip_subcategory(
+        self,
+        subcategory: Category,
+        result: CategoryResult,
+        reason: str,
+        propagation: FailurePropagation,
+    ) -> None:
+        """Skip every test of a subcategory; what they would have saved is missing for later tests."""
+        for test in subcategory.tests:
+            test_full_name = f"{subcategory.name}/{test.name}"
+            result.test_results.append(self._skipped_result(test_full_name, test.path, reason))
+            propagation.skipped(test_full_name, test.path)
+    
     def _run_subcategory_inline(
         self,
         subcategory: Category,
@@ -1096,6 +1618,7 @@ class TestRunner:
         until_test: Optional[str] = None,
         debug_test: Optional[str] = None,
         skip_setup: bool = False,
+        propagation: Optional[FailurePropagation] = None,
     ) -> tuple[bool, str]:
         """
         Run a subcategory inline within the parent category's browser session.
@@ -1112,15 +1635,31 @@ class TestRunner:
             until_test: If set, stop before this test and dump context.
             debug_test: If set, run until this test (inclusive) with context["step_callback"], then stop.
             skip_setup: If True, do not run subcategory setup (e.g. already run in path mode).
+            propagation: Failure propagation of the category run (tests that need a failed
+                         test's data are skipped, the others still run)
             
         Returns:
-            Tuple of (failed: bool, failed_test_name: str or None)
+            Tuple of (failed: bool, failed_test_name: str or None) - the first failed setup/test
         """
-        print(f"\n    >>> Subcategory: {subcategory.name}")
+        if propagation is None:
+            propagation = self._new_failure_propagation(parent_category)
         
         # Build category path: parent/subcategory (e.g., "scheduling/appointments")
         category_path = f"{parent_category.path.name}/{subcategory.path.name}" if parent_category.path and subcategory.path else f"{parent_category.name}/{subcategory.name}"
         
+        # A setup that needs data a failed test should have saved cannot run; neither can its tests
+        if not skip_setup and subcategory.setup and subcategory.setup.is_valid:
+            setup_name, setup_path = f"{subcategory.name}/_setup", self.tests_root / subcategory.path / "_setup"
+            skip_reason = propagation.blocker(setup_name, setup_path)
+            if skip_reason:
+                print(f"\n    >>> Subcategory: {subcategory.name} skipped ({skip_reason})")
+                propagation.skipped(setup_name, setup_path)
+                self._skip_subcategory(subcategory, result, skip_reason, propagation)
+                self._save_subcategory_result(subcategory, parent_category, result, category_path)
+                return False, None
+        
+        print(f"\n    >>> Subcategory: {subcategory.name}")
+        
         # Run subcategory setup if exists (unless skip_setup, e.g. path mode already ran it)
         if not skip_setup and subcategory.setup and subcategory.setup.is_valid:
             test_start_offset = time_module.time() - video_start_time
@@ -1141,21 +1680,16 @@ class TestRunner:
             result.test_results.append(setup_result)
             
             if setup_result.status == "failed":
-                # Skip all tests in subcategory
-                for test in subcategory.tests:
-                    result.test_results.append(TestResult(
-                        test_name=f"{subcategory.name}/{test.name}",
-                        test_path=test.path,
-                        test_type="test",
-                        status="skipped",
-                        duration_ms=0,
-                        error=f"Skipped due to {subcategory.name}/_setup failure",
-                    ))
+                # Skip all tests in subcategory (setup is a barrier: it prepares browser state)
+                self._skip_subcategory(
+                    subcategory, result, f"Skipped due to {subcategory.name}/_setup failure", propagation,
+                )
                 # Save subcategory result before returning
                 self._save_subcategory_result(subcategory, parent_category, result, category_path)
                 return True, f"{subcategory.name}/_setup"
         
         # Run subcategory tests
+        first_failed = None
         for index, test in enumerate(subcategory.tests):
             test_full_name = f"{subcategory.name}/{test.name}"
             test_full_id = f"{subcategory.name}/{test.id}"
@@ -1225,10 +1759,17 @@ class TestRunner:
                 self._save_subcategory_result(subcategory, parent_category, result, category_path)
                 return True, test_full_name
 
+            skip_reason = propagation.blocker(test_full_name, test.path)
+            if skip_reason:
+                result.test_results.append(self._skipped_result(test_full_name, test.path, skip_reason))
+                propagation.skipped(test_full_name, test.path)
+                continue
+
+            start_url = page.url
             test_start_offset = time_module.time() - video_start_time
             test_result = self._run_single_test(
                 test_path=test.path,
-                test_name=f"{subcategory.name}/{test.name}",
+                test_name=test_full_name,
                 test_type="test",
                 page=page,
                 context=context,
@@ -1237,33 +1778,31 @@ class TestRunner:
                 category_name=category_path,
             )
             test_end_offset = time_module.time() - video_start_time
-            video_timestamps.append((f"{subcategory.name}/{test.name}", test_start_offset, test_end_offset, test_result.status))
+            video_timestamps.append((test_full_name, test_start_offset, test_end_offset, test_result.status))
             result.test_results.append(test_result)
             
             if test_result.status == "failed":
-                # Skip remaining tests in subcategory
-                for remaining_test in subcategory.tests[index + 1:]:
-                    result.test_results.append(TestResult(
-                        test_name=f"{subcategory.name}/{remaining_test.name}",
-                        test_path=remaining_test.path,
-                        test_type="test",
-                        status="skipped",
-                        duration_ms=0,
-                        error=f"Skipped due to {subcategory.name}/{test.name} failure",
-                    ))
-                
-                # Run teardown even on failure
-                self._run_subcategory_teardown(subcategory, page, context, result, video_timestamps, video_start_time, time_module, parent_category)
-                # Save subcategory result before returning
-                self._save_subcategory_result(subcategory, parent_category, result, category_path)
-                return True, f"{subcategory.name}/{test.name}"
+                first_failed = first_failed or test_full_name
+                propagation.failed(test_full_name, test.path)
+                if propagation.blocked_by:
+                    # Cannot tell what the failure affects: skip the remaining tests in subcategory
+                    for remaining_test in subcategory.tests[index + 1:]:
+                        result.test_results.append(self._skipped_result(
+                            f"{subcategory.name}/{remaining_test.name}",
+                            remaining_test.path,
+                            f"Skipped due to {propagation.blocked_by} failure",
+                        ))
+                    break
+                self._recover_page_after_failure(page, start_url)
         
-        # Run subcategory teardown if exists
+        # Run subcategory teardown if exists (even on failure)
         self._run_subcategory_teardown(subcategory, page, context, result, video_timestamps, video_start_time, time_module, parent_category)
         
         # Extract subcategory results and save them separately
         self._save_subcategory_result(subcategory, parent_category, result, category_path)
         
+        if first_failed:
+            return True, first_failed
         print(f"    <<< Subcategory: {subcategory.name} completed")
         return False, None
     
@@ -1304,6 +1843,7 @@ class TestRunner:
         parent_category: Category,
         parent_result: CategoryResult,
         category_path: str,
+        saved_paths: Optional[List[str]] = None,
     ) -> None:
         """
         Extract subcategory results from parent CategoryResult and save them separately.
@@ -1316,6 +1856,7 @@ class TestRunner:
             parent_category: The parent category
             parent_result: The parent's CategoryResult containing all results
             category_path: The category path (e.g., "clients/notes")
+            saved_paths: List to record category_path in (default: this category's _saved_subcategory_paths)
         """
         # Extract all results that belong to this subcategory
         # Subcategory results have test_name starting with "{subcategory.name}/"
@@ -1357,4 +1898,4 @@ class TestRunner:
             result=subcategory_result,
             video_path=None,
         )
-        self._saved_subcategory_paths.append(category_path)
+        (saved_paths if saved_paths is not None else self._saved_subcategory_paths).append(category_path)
@@ -0,0 +1,203 @@
+"""
+Duration-based scheduling of run units.
+
+TestDiscovery.scan returns categories sorted by folder name, so with several workers the
+longest chain often starts last and the other workers sit idle while it finishes. The
+scheduler starts the longest units first (longest-processing-time-first), which keeps the
+end of the run short, and estimates the run's makespan before it starts.
+
+Expected durations come from the run history: the rolling median of the duration_ms the
+test recorded in its latest runs (tests/**/_runs/*/run.json). Tests that never ran fall back
+to estimated_duration from _category.yaml, then to the median of all known tests.
+"""
+
+import heapq
+import json
+import os
+import re
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models import Category, Test
+
+
+RUNS_DIR_NAME = "_runs"
+# History runs read per category folder (newest first)
+DEFAULT_HISTORY_RUNS = 10
+# Samples in the rolling median of one test
+DEFAULT_WINDOW = 5
+# Duration of a test that never ran when no test has a history or estimate to compare with
+DEFAULT_TEST_DURATION_MS = 30_000
+
+
+def test_key(category_path: str, folder: str) -> str:
+    """History key of a test folder: "<category path>/<folder>", lowercase, forward slashes."""
+    return f"{category_path.strip('/')}/{folder}".replace("\\", "/").lower()
+
+
+def _history_key(test_path: str, category_path: str) -> str:
+    """
+    History key for a test_path stored in a run.json of category_path.
+
+    test_path is absolute and may come from another OS (run.json files recorded on Windows
+    hold backslashes), so the key is rebuilt from the path segments: everything from the
+    category folder on, e.g. ".../tests/clients/notes/add_note" -> "clients/notes/add_note".
+    """
+    parts = [p for p in re.split(r"[\\/]", test_path) if p]
+    cat_parts = [p for p in category_path.lower().split("/") if p]
+    lowered = [p.lower() for p in parts]
+    for start in range(len(lowered) - len(cat_parts), -1, -1):
+        if lowered[start:start + len(cat_parts)] == cat_parts:
+            return "/".join(lowered[start:])
+    return test_key(category_path, parts[-1] if parts else "")
+
+
+def load_duration_history(tests_root: Path, max_runs: int = DEFAULT_HISTORY_RUNS) -> Dict[str, List[int]]:
+    """
+    Read per-test durations from the run history.
+
+    Scans tests/**/_runs/*/run.json (the newest max_runs runs of every category folder) and
+    collects duration_ms of setups, tests and teardowns that passed or failed. A parent
+    category's run.json repeats its subcategories' results, so samples are de-duplicated
+    per (run_id, test).
+
+    Returns:
+        Durations in ms per test key (see test_key), newest run first
+    """
+    tests_root = Path(tests_root)
+    samples: Dict[str, Dict[str, int]] = {}
+    for dirpath, dirnames, _ in os.walk(tests_root):
+        if RUNS_DIR_NAME not in dirnames:
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            continue
+        dirnames[:] = [d for d in dirnames if d != RUNS_DIR_NAME and not d.startswith(".")]
+        category_path = Path(dirpath).relative_to(tests_root).as_posix()
+        runs_dir = Path(dirpath) / RUNS_DIR_NAME
+        run_dirs = sorted((d for d in runs_dir.iterdir() if d.is_dir()), key=lambda d: d.name, reverse=True)
+        for run_dir in run_dirs[:max_runs]:
+            try:
+                data = json.loads((run_dir / "run.json").read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            results = list(data.get("test_results") or [])
+            results += [r for r in (data.get("setup_result"), data.get("teardown_result")) if r]
+            for result in results:
+                duration = result.get("duration_ms") or 0
+                if result.get("status") not in ("passed", "failed") or duration <= 0 or not result.get("test_path"):
+                    continue
+                key = _history_key(result["test_path"], category_path)
+                samples.setdefault(key, {})[run_dir.name] = int(duration)
+    return {
+        key: [runs[run_id] for run_id in sorted(runs, reverse=True)]
+        for key, runs in samples.items()
+    }
+
+
+class DurationEstimator:
+    """
+    Expected duration of tests and run units.
+
+    Usage:
+        estimator = DurationEstimator.from_history(tests_root)
+        estimator.unit_duration_ms([category])   # whole category chain, in ms
+    """
+
+    def __init__(self, history: Optional[Dict[str, List[int]]] = None, window: int = DEFAULT_WINDOW):
+        """
+        Initialize the estimator.
+
+        Args:
+            history: Durations in ms per test key, newest first (see load_duration_history)
+            window: Number of latest samples in the rolling median
+        """
+        self.window = max(1, window)
+        self.medians: Dict[str, float] = {
+            key: median(values[:self.window]) for key, values in (history or {}).items() if values
+        }
+        self.default_ms = median(self.medians.values()) if self.medians else DEFAULT_TEST_DURATION_MS
+
+    @classmethod
+    def from_history(cls, tests_root: Path, window: int = DEFAULT_WINDOW) -> "DurationEstimator":
+        """Build an estimator from the run history under tests_root."""
+        return cls(load_duration_history(tests_root), window=window)
+
+    def test_duration_ms(self, category_path: str, folder: str, test: Optional[Test] = None) -> float:
+        """
+        Expected duration of one test (or _setup/_teardown folder) in ms.
+
+        Args:
+            category_path: Category path of the test (e.g. "clients/notes")
+            folder: Test folder name
+            test: Discovered Test, for its estimated_duration (seconds) when there is no history
+        """
+        known = self.medians.get(test_key(category_path, folder))
+        if known is not None:
+            return known
+        if test is not None and test.estimated_duration:
+            return float(test.estimated_duration) * 1000
+        return self.default_ms
+
+    def unit_duration_ms(self, chain: Sequence[Category]) -> int:
+        """
+        Expected duration of a run unit in ms.
+
+        A unit runs the setups and teardowns of every category in the chain and the whole
+        subtree of its leaf (tests, subcategories).
+        """
+        total = 0.0
+
+        def subtree(category: Category) -> float:
+            path = category.path.as_posix()
+            duration = sum(self.test_duration_ms(path, t.id, t) for t in category.tests)
+            for hook in (category.setup, category.teardown):
+                if hook:
+                    duration += self.test_duration_ms(path, hook.path.name)
+            return duration + sum(subtree(s) for s in category.subcategories or [])
+
+        for ancestor in chain[:-1]:
+            for hook in (ancestor.setup, ancestor.teardown):
+                if hook:
+                    total += self.test_duration_ms(ancestor.path.as_posix(), hook.path.name)
+        if chain:
+            total += subtree(chain[-1])
+        return int(total)
+
+
+def longest_first(durations: Sequence[int]) -> List[int]:
+    """Indices of durations, longest first (ties keep their original order)."""
+    return sorted(range(len(durations)), key=lambda i: (-durations[i], i))
+
+
+def estimate_makespan(durations: Sequence[int], workers: int) -> int:
+    """
+    Expected wall time in ms of running durations longest first on workers parallel workers.
+
+    Each unit starts on the first worker that becomes free, as the process pool and the
+    async engine's semaphore hand them out.
+    """
+    free_at = [0] * max(1, min(workers, len(durations) or 1))
+    heapq.heapify(free_at)
+    for index in longest_first(durations):
+        heapq.heappush(free_at, heapq.heappop(free_at) + durations[index])
+    return max(free_at)
+
+
+def schedule_units(
+    units: Sequence[Tuple[str, Optional[List[Category]], bool]],
+    estimator: DurationEstimator,
+    workers: int,
+) -> Tuple[List[int], List[int], int]:
+    """
+    Order run_all units for workers parallel workers.
+
+    Args:
+        units: (path, chain, from_selection) units of TestRunner._build_units
+        estimator: Duration estimator
+        workers: Number of units running at the same time
+
+    Returns:
+        Tuple of (unit indices in start order, expected duration per unit in ms, makespan in ms)
+    """
+    durations = [estimator.unit_duration_ms(chain) if chain else 0 for _, chain, _ in units]
+    return longest_first(durations), durations, estimate_makespan(durations, workers)
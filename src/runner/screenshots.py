@@ -0,0 +1,177 @@
+"""
+Encoding of stored failure screenshots, and their thumbnails.
+
+Playwright captures PNG. Hundreds of full-size PNGs make _runs/ heavy and the GUI's
+screenshot list slow, so browser.screenshots in config.yaml picks how they are stored:
+
+- format: png (as captured), webp or jpeg
+- quality: 1-100 for webp/jpeg
+- thumbnail_width: width of the small JPEG the GUI list views show (0 = no thumbnails)
+
+Re-encoding and thumbnails run on the run storage's background writer (artifacts.py), not
+on the runner thread. Runs stored before this (screenshot.png, no thumbnail) are still
+found by find_screenshot(), and the GUI builds their thumbnail on first request.
+"""
+
+import io
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .artifacts import write_file
+
+
+SCREENSHOT_STEM = "screenshot"
+THUMBNAIL_FILE_NAME = "screenshot_thumb.jpg"
+
+FORMAT_PNG = "png"
+FORMAT_WEBP = "webp"
+FORMAT_JPEG = "jpeg"
+SCREENSHOT_FORMATS = [FORMAT_PNG, FORMAT_WEBP, FORMAT_JPEG]
+
+_EXTENSIONS = {FORMAT_PNG: ".png", FORMAT_WEBP: ".webp", FORMAT_JPEG: ".jpg"}
+# Pillow feature that encodes each format
+_PIL_FEATURES = {FORMAT_WEBP: "webp", FORMAT_JPEG: "jpg"}
+MEDIA_TYPES = {".png": "image/png", ".webp": "image/webp", ".jpg": "image/jpeg"}
+
+DEFAULT_QUALITY = 80
+DEFAULT_THUMBNAIL_WIDTH = 320
+
+
+class ScreenshotEncoder:
+    """
+    How failure screenshots are stored.
+
+    Usage:
+        encoder = ScreenshotEncoder.from_config(config)
+        path = test_dir / encoder.file_name              # screenshot.webp
+        writer.submit("write screenshot", encoder.save, png_bytes, path)
+    """
+
+    def __init__(
+        self,
+        format: str = FORMAT_PNG,
+        quality: int = DEFAULT_QUALITY,
+        thumbnail_width: int = 0,
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            format: One of SCREENSHOT_FORMATS
+            quality: 1-100, used by webp and jpeg
+            thumbnail_width: Thumbnail width in pixels (0 = no thumbnail)
+
+        Raises:
+            ValueError: If format is unknown
+
+        If Pillow is missing or cannot encode format, screenshots are stored as PNG.
+        """
+        format = FORMAT_JPEG if format == "jpg" else format
+        if format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"Unknown screenshot format {format!r}; expected one of: {', '.join(SCREENSHOT_FORMATS)}")
+        if format != FORMAT_PNG and not _can_encode(format):
+            print(f"  [Screenshot] Pillow cannot encode {format} here, storing screenshots as PNG")
+            format = FORMAT_PNG
+        self.format = format
+        self.quality = max(1, min(100, int(quality)))
+        self.thumbnail_width = max(0, int(thumbnail_width))
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ScreenshotEncoder":
+        """Build the encoder from the browser.screenshots section of config.yaml."""
+        section = ((config or {}).get("browser") or {}).get("screenshots") or {}
+        return cls(
+            format=str(section.get("format") or FORMAT_PNG).lower(),
+            quality=int(section.get("quality") or DEFAULT_QUALITY),
+            thumbnail_width=int(section.get("thumbnail_width", 0) or 0),
+        )
+
+    @property
+    def file_name(self) -> str:
+        """Name of the stored screenshot (screenshot.png / .webp / .jpg)."""
+        return SCREENSHOT_STEM + _EXTENSIONS[self.format]
+
+    def encode(self, png: bytes) -> bytes:
+        """Re-encode a captured PNG in the configured format (PNG is returned as is)."""
+        if self.format == FORMAT_PNG:
+            return png
+        from PIL import Image
+
+        with Image.open(io.BytesIO(png)) as image:
+            out = io.BytesIO()
+            if self.format == FORMAT_JPEG:
+                image.convert("RGB").save(out, "JPEG", quality=self.quality, optimize=True)
+            else:
+                image.save(out, "WEBP", quality=self.quality)
+            return out.getvalue()
+
+    def save(self, png: bytes, path: Path) -> Path:
+        """
+        Writer task: store a captured screenshot at path, plus its thumbnail.
+
+        If encoding fails the PNG is stored as screenshot.png next to path instead, so the
+        screenshot is never lost and its extension matches its content.
+
+        Returns:
+            Path of the stored screenshot
+        """
+        try:
+            data = self.encode(png)
+        except Exception as e:
+            print(f"  [Screenshot] Could not encode as {self.format}, storing PNG: {type(e).__name__}: {e}")
+            data, path = png, path.with_suffix(_EXTENSIONS[FORMAT_PNG])
+        write_file(path, data)
+        if self.thumbnail_width:
+            try:
+                write_file(path.parent / THUMBNAIL_FILE_NAME, make_thumbnail(png, self.thumbnail_width))
+            except Exception as e:
+                print(f"  [Screenshot] Could not write thumbnail: {type(e).__name__}: {e}")
+        return path
+
+
+def _can_encode(format: str) -> bool:
+    """True if Pillow is installed and can encode format."""
+    try:
+        from PIL import features
+    except ImportError:
+        return False
+    return bool(features.check(_PIL_FEATURES[format]))
+
+
+def make_thumbnail(image_bytes: bytes, width: int = DEFAULT_THUMBNAIL_WIDTH) -> bytes:
+    """JPEG thumbnail of an image, scaled down to width (aspect ratio kept)."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image = image.convert("RGB")
+        if image.width > width:
+            image.thumbnail((width, max(1, image.height * width // image.width)))
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=70, optimize=True)
+        return out.getvalue()
+
+
+def find_screenshot(test_dir: Path) -> Optional[Path]:
+    """The stored screenshot of a test run dir, whatever its format, or None."""
+    for extension in MEDIA_TYPES:
+        path = test_dir / (SCREENSHOT_STEM + extension)
+        if path.exists():
+            return path
+    return None
+
+
+def ensure_thumbnail(test_dir: Path, width: int = DEFAULT_THUMBNAIL_WIDTH) -> Optional[Path]:
+    """
+    Thumbnail of a test run dir's screenshot, built and cached on first use.
+
+    Returns:
+        Path to the thumbnail, or None if the test has no screenshot
+    """
+    thumbnail = test_dir / THUMBNAIL_FILE_NAME
+    if thumbnail.exists():
+        return thumbnail
+    screenshot = find_screenshot(test_dir)
+    if screenshot is None:
+        return None
+    write_file(thumbnail, make_thumbnail(screenshot.read_bytes(), width or DEFAULT_THUMBNAIL_WIDTH))
+    return thumbnail
@@ -0,0 +1,160 @@
+"""
+Authenticated session cache for the test runner.
+
+Logging in through the UI (fn_login) can wait minutes for Cloudflare or reCAPTCHA.
+After a category setup logs in, the runner saves the BrowserContext storage_state
+(cookies + localStorage) to .sessions/ with an expiry. New contexts for the same
+account are created with that state, so fn_login finds the dashboard right away
+instead of going through the login form again.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext
+
+
+class SessionCache:
+    """
+    Stores one Playwright storage_state per (base_url, username) on disk.
+
+    A cached session is used only while it is fresh: younger than ttl_minutes and
+    still holding at least one unexpired cookie for the target host. Anything
+    else is treated as stale and the category logs in through the UI as before.
+    """
+
+    DEFAULT_DIR = ".sessions"
+    DEFAULT_TTL_MINUTES = 60
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_minutes: int = DEFAULT_TTL_MINUTES,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the session cache.
+
+        Args:
+            cache_dir: Directory for session files. Defaults to .sessions/ in current directory.
+            ttl_minutes: How long a saved session may be reused
+            enabled: When False, load() never returns a session and save() does nothing
+        """
+        self.cache_dir = Path(cache_dir or self.DEFAULT_DIR)
+        self.ttl = timedelta(minutes=ttl_minutes)
+        self.enabled = enabled
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "SessionCache":
+        """Build a cache from the session_cache section of config.yaml."""
+        section = (config or {}).get("session_cache") or {}
+        return cls(
+            cache_dir=Path(section.get("dir") or cls.DEFAULT_DIR),
+            ttl_minutes=int(section.get("ttl_minutes", cls.DEFAULT_TTL_MINUTES)),
+            enabled=bool(section.get("enabled", True)),
+        )
+
+    def session_path(self, base_url: str, username: str) -> Path:
+        """Path of the session file for an account on a target."""
+        host = urlparse(base_url).netloc or base_url
+        safe = re.sub(r"[^A-Za-z0-9_.@+-]", "_", f"{host}_{username}")
+        return self.cache_dir / f"{safe}.json"
+
+    def load(self, base_url: Optional[str], username: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh storage_state for the account, or None.
+
+        Stale or unreadable session files are deleted.
+        """
+        if not self.enabled or not base_url or not username:
+            return None
+        path = self.session_path(base_url, username)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            expires_at = datetime.fromisoformat(data["expires_at"])
+            state = data["storage_state"]
+        except (json.JSONDecodeError, IOError, KeyError, ValueError):
+            self.invalidate(base_url, username)
+            return None
+
+        if datetime.now() >= expires_at or not self.has_live_cookies(state, base_url):
+            print("  [Session] Cached session is stale - logging in through the UI")
+            self.invalidate(base_url, username)
+            return None
+        return state
+
+    def save(self, browser_context: BrowserContext, base_url: Optional[str], username: Optional[str]) -> Optional[Path]:
+        """
+        Save the context's storage_state for the account.
+
+        Written atomically so parallel workers never read a half-written file.
+
+        Returns:
+            Path to the session file, or None if caching is disabled or saving failed
+        """
+        if not self.enabled or not base_url or not username:
+            return None
+        try:
+            state = browser_context.storage_state()
+        except Exception as e:
+            print(f"  [Session] Could not read storage_state: {type(e).__name__}: {e}")
+            return None
+        return self.save_state(state, base_url, username)
+
+    def save_state(self, state: Dict[str, Any], base_url: Optional[str], username: Optional[str]) -> Optional[Path]:
+        """
+        Save an already-read storage_state for the account (used by the async engine).
+
+        Returns:
+            Path to the session file, or None if caching is disabled
+        """
+        if not self.enabled or not base_url or not username:
+            return None
+        now = datetime.now()
+        data = {
+            "base_url": base_url,
+            "username": username,
+            "saved_at": now.isoformat(),
+            "expires_at": (now + self.ttl).isoformat(),
+            "storage_state": state,
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.session_path(base_url, username)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    def invalidate(self, base_url: str, username: str) -> None:
+        """Delete the cached session for an account (if any)."""
+        try:
+            self.session_path(base_url, username).unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def has_live_cookies(state: Dict[str, Any], base_url: str) -> bool:
+        """
+        Quick cookie check: True if the state holds an unexpired cookie for the target host.
+
+        Session cookies (expires == -1) count as live; they last as long as the cache entry.
+        """
+        host = urlparse(base_url).hostname or ""
+        # Cookies for www.vcita.com and app.vcita.com are usually set on the parent domain
+        parent = ".".join(host.split(".")[-2:])
+        now = datetime.now().timestamp()
+        for cookie in state.get("cookies") or []:
+            domain = (cookie.get("domain") or "").lstrip(".")
+            if not domain or not (host.endswith(domain) or domain.endswith(parent)):
+                continue
+            expires = cookie.get("expires", -1)
+            if expires is None or expires < 0 or expires > now:
+                return True
+        return False
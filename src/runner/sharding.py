@@ -0,0 +1,236 @@
+"""
+Split a run across machines (`main.py run --shard i/N`).
+
+The units of a run (category chains, or --selection paths) are divided between N shards.
+A unit is never split: its setup, tests, subcategories and teardown share one browser
+context and one category context, so the whole chain runs on one machine.
+
+Without --selection, a category that has subcategories but no tests of its own (e.g.
+scheduling) is split into its subcategory chains (scheduling/services,
+scheduling/appointments, ...): each runs like a --selection path, replaying the root
+_setup/_teardown on its shard. A category with tests of its own (e.g. clients, whose notes
+subcategory runs between its tests) stays one unit.
+
+Shards are balanced by time, not by test count: the duration of a unit is the sum of its
+tests' expected durations, from the duration_ms they recorded in earlier runs
+(tests/**/_runs/*/run.json, see scheduler.DurationEstimator). The split is
+deterministic - every machine computes the same plan from the same tree and history - so
+each shard can pick its own units without talking to the others.
+
+After the shards finished, `main.py merge_shards` combines their runs_index files into one
+run record.
+"""
+
+import json
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models import Category
+
+from .scheduler import DurationEstimator
+
+
+RUNS_DIR_NAME = "_runs"
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec like "2/4" into (index, total), index being 1-based.
+
+    Raises:
+        ValueError: If the spec is malformed or index is not within 1..total
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value or "")
+    if not match:
+        raise ValueError(f"Invalid shard '{value}' (expected i/N, e.g. 2/4)")
+    index, total = int(match.group(1)), int(match.group(2))
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}' (index must be between 1 and {max(total, 1)})")
+    return index, total
+
+
+def shard_units(categories: Sequence[Category]) -> Dict[str, List[Category]]:
+    """
+    Units of a full run for sharding: category chains per selection path.
+
+    A category with subcategories and no tests of its own is replaced by its subcategory
+    chains (recursively); any other category is one unit with its whole subtree.
+
+    Returns:
+        Category chain [root, ..., leaf] per selection path ("scheduling/events")
+    """
+    units: Dict[str, List[Category]] = {}
+
+    def visit(chain: List[Category]) -> None:
+        category = chain[-1]
+        if category.subcategories and not category.tests:
+            for subcategory in category.subcategories:
+                visit(chain + [subcategory])
+        else:
+            units["/".join(c.path.name for c in chain)] = chain
+
+    for category in categories:
+        visit([category])
+    return units
+
+
+def estimate_unit_durations(
+    units: Dict[str, Sequence[Category]],
+    estimator: DurationEstimator,
+) -> Dict[str, int]:
+    """
+    Expected duration in ms of every unit (see DurationEstimator.unit_duration_ms).
+
+    Args:
+        units: Category chain per unit path (see TestRunner._resolve_category_path)
+        estimator: Duration estimator built from the run history
+
+    Returns:
+        Duration in ms per unit path
+    """
+    return {path: estimator.unit_duration_ms(chain) for path, chain in units.items()}
+
+
+def plan_shards(durations: Dict[str, int], total: int) -> List[List[str]]:
+    """
+    Assign units to shards, longest first, each to the shard with the least work so far.
+
+    Ties are broken by unit path and shard number, so the plan only depends on its inputs.
+
+    Returns:
+        Unit paths per shard (index 0 = shard 1), each in path order
+    """
+    shards: List[List[str]] = [[] for _ in range(total)]
+    loads = [0] * total
+    for path in sorted(durations, key=lambda p: (-durations[p], p)):
+        target = min(range(total), key=lambda i: (loads[i], i))
+        shards[target].append(path)
+        loads[target] += durations[path]
+    return [sorted(paths) for paths in shards]
+
+
+def merge_shard_indexes(
+    index_files: Sequence[Path],
+    tests_root: Path,
+    run_id: Optional[str] = None,
+) -> Path:
+    """
+    Combine the runs_index files of shard runs into one run record.
+
+    Summaries are added up, categories and failed tests concatenated, and the run spans the
+    earliest start to the latest completion. Category run folders of the shards that exist
+    locally (tests/<category>/_runs/<shard run_id>) are copied under the merged run_id, so the
+    GUI can open the merged run like any other.
+
+    Args:
+        index_files: runs_index/<run_id>.json files of the shards
+        tests_root: Path to the tests/ directory (runs_index/ is next to it)
+        run_id: Run id of the merged record (default: start time of the earliest shard)
+
+    Returns:
+        Path to the merged runs_index file
+    """
+    shards = []
+    for path in index_files:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not data.get("run_id") or not data.get("started_at"):
+            raise ValueError(f"{path} is not a runs_index file")
+        shards.append(data)
+    if not shards:
+        raise ValueError("No shard index files given")
+    shards.sort(key=lambda d: ((d.get("shard") or {}).get("index", 0), d["started_at"]))
+
+    started_at = min(datetime.fromisoformat(d["started_at"]) for d in shards)
+    completed = [datetime.fromisoformat(d["completed_at"]) for d in shards if d.get("completed_at")]
+    completed_at = max(completed) if completed else None
+    run_id = run_id or started_at.strftime("%Y%m%d_%H%M%S")
+
+    summary = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+    categories: List[str] = []
+    failed_tests: List[dict] = []
+    for data in shards:
+        for key in summary:
+            summary[key] += (data.get("summary") or {}).get(key, 0)
+        categories += [c for c in data.get("categories") or [] if c not in categories]
+        failed_tests += data.get("failed_tests") or []
+
+    if summary["failed"] > 0:
+        status = "failed" if summary["passed"] == 0 else "partial"
+    else:
+        status = "passed"
+
+    merged = {
+        "run_id": run_id,
+        "started_at": started_at.isoformat(),
+        "completed_at": completed_at.isoformat() if completed_at else None,
+        "categories": categories,
+        "status": status,
+        "summary": summary,
+        "duration_ms": int((completed_at - started_at).total_seconds() * 1000) if completed_at else 0,
+        "failed_tests": failed_tests,
+        "merged_from": [d["run_id"] for d in shards],
+        "shards": [
+            {
+                "run_id": d["run_id"],
+                "shard": d.get("shard"),
+                "status": d.get("status"),
+                "duration_ms": d.get("duration_ms", 0),
+                "categories": d.get("categories") or [],
+            }
+            for d in shards
+        ],
+    }
+    configs = [d["config"] for d in shards if d.get("config")]
+    if configs:
+        merged["config"] = configs[0]
+
+    tests_root = Path(tests_root)
+    for data in shards:
+        if data["run_id"] == run_id:
+            continue
+        for category in data.get("categories") or []:
+            source = tests_root / category / RUNS_DIR_NAME / data["run_id"]
+            target = tests_root / category / RUNS_DIR_NAME / run_id
+            if source.is_dir() and not target.exists():
+                shutil.copytree(source, target)
+
+    index_dir = tests_root.parent / "runs_index"
+    index_dir.mkdir(parents=True, exist_ok=True)
+    index_path = index_dir / f"{run_id}.json"
+    index_path.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+    return index_path
+
+
+def build_shard_plan(
+    runner,
+    total: int,
+    selection: Optional[List[str]] = None,
+    estimator: Optional[DurationEstimator] = None,
+) -> Tuple[List[List[str]], Dict[str, int]]:
+    """
+    Plan the shards of a run.
+
+    Args:
+        runner: TestRunner whose categories are split
+        total: Number of shards
+        selection: Selection paths to split (default: every category, see shard_units)
+        estimator: Duration estimator (default: built from the run history in the tests tree)
+
+    Returns:
+        Tuple of (unit paths per shard, estimated duration in ms per unit path)
+    """
+    if selection:
+        units = {}
+        for path in selection:
+            chain = runner._resolve_category_path(path)
+            # Unresolved paths are kept so the shard that gets them reports them as errors
+            units[path] = chain or []
+    else:
+        units = shard_units(runner.get_categories())
+    if estimator is None:
+        estimator = DurationEstimator.from_history(runner.tests_root)
+    durations = estimate_unit_durations(units, estimator)
+    return plan_shards(durations, total), durations
@@ -5,19 +5,34 @@ Stores run data per-category in tests/{category}/_runs/ with:
 - run.json: Category run result + metadata
 - video.webm: Video recording
 - tests/{test_name}/result.json: Individual test results
-- tests/{test_name}/screenshot.png: Failure screenshots
+- tests/{test_name}/screenshot.{png,webp,jpg}: Failure screenshots (+ screenshot_thumb.jpg, see screenshots.py)
 - tests/{test_name}/heal_request.md: Heal request copies
 
-Also maintains a root index at runs_index/ for correlating multi-category runs.
+Also maintains a root index at runs_index/ for correlating multi-category runs, and
+runs_index/profiles/{run_id}.json with the slowest Playwright calls of profiled runs.
+
+Artifacts (result.json, screenshots, traces, heal requests, videos) are written by a
+background ArtifactWriter (artifacts.py); finalize_run flushes it first, and anything that
+reads a run dir before that should call flush_artifacts().
+
+Everything saved is also recorded in runs_index/history.sqlite (history_index.py), which
+answers the history queries below; the directory walks remain as a fallback.
 """
 
 import json
 import shutil
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .artifacts import ArtifactWriter, move_file, write_file
+from .history_index import HISTORY_FILE_NAME, HistoryIndex, tree_key
 from .models import CategoryResult, RunResult, TestResult
+from .profiler import build_profile_report
+from .screenshots import ScreenshotEncoder, find_screenshot
+from .video import link_or_copy
 
 
 class RunStorage:
@@ -25,14 +40,23 @@ class RunStorage:
     
     RUNS_DIR_NAME = "_runs"
     INDEX_DIR_NAME = "runs_index"
+    PROFILES_DIR_NAME = "profiles"
+    # How long a category's video may take to appear after its context closed
+    VIDEO_WAIT_SECONDS = 3.0
     
-    def __init__(self, tests_root: Path, max_runs_per_category: int = 100):
+    def __init__(
+        self,
+        tests_root: Path,
+        max_runs_per_category: int = 100,
+        screenshots: Optional[ScreenshotEncoder] = None,
+    ):
         """
         Initialize run storage.
         
         Args:
             tests_root: Path to the tests/ directory
             max_runs_per_category: Maximum runs to keep per category (oldest deleted)
+            screenshots: Format of stored screenshots (default: PNG as captured, no thumbnail)
         """
         self.tests_root = tests_root
         self.max_runs = max_runs_per_category
@@ -40,6 +64,14 @@ class RunStorage:
         self.current_run_id: Optional[str] = None
         self._current_categories: List[str] = []
         self._run_config: Optional[Dict] = None
+        # Extra top-level fields for the runs_index entry (e.g. {"shard": {...}} for run --shard)
+        self.run_metadata: Dict = {}
+        # Profile report written by the last finalize_run (None when the run was not profiled)
+        self.profile_report_path: Optional[Path] = None
+        self.artifacts = ArtifactWriter()
+        self.screenshots = screenshots or ScreenshotEncoder()
+        self.history = HistoryIndex(self.index_dir / HISTORY_FILE_NAME)
+        self._history_ready = False
 
     @staticmethod
     def _sanitize_config(config: Optional[Dict]) -> Optional[Dict]:
@@ -69,7 +101,38 @@ class RunStorage:
         self._current_categories = []
         self._run_config = self._sanitize_config(config)
         return self.current_run_id
-    
+
+    def join_run(self, run_id: str, config: Optional[Dict] = None) -> str:
+        """
+        Attach to an existing run_id instead of generating a new one.
+
+        Used by parallel worker processes so every category they run is stored under the
+        run_id of the parent run (which writes the merged runs_index entry).
+
+        Returns:
+            The joined run_id
+        """
+        self.current_run_id = run_id
+        self._current_categories = []
+        self._run_config = self._sanitize_config(config)
+        return self.current_run_id
+
+    @property
+    def current_categories(self) -> List[str]:
+        """Category paths saved in the current run (in save order)."""
+        return list(self._current_categories)
+
+    def add_categories(self, categories: List[str]) -> None:
+        """
+        Record categories saved by another process under the current run_id.
+
+        Args:
+            categories: Category paths (as passed to save_category_result)
+        """
+        for category in categories:
+            if category not in self._current_categories:
+                self._current_categories.append(category)
+
     def get_category_runs_dir(self, category: str) -> Path:
         """
         Get the _runs directory for a category.
@@ -106,37 +169,50 @@ class RunStorage:
         category: str,
         test_name: str,
         result: TestResult,
-        screenshot_path: Optional[Path] = None
+        screenshot_path: Optional[Path] = None,
+        trace_path: Optional[Path] = None,
     ) -> Path:
         """
         Save an individual test result.
         
+        The files are written in the background; result.screenshot and result.trace are
+        pointed at their final locations in the run dir before this returns.
+        
         Args:
             category: Category name
             test_name: Test name (e.g., 'create_matter')
-            result: TestResult to save
-            screenshot_path: Optional path to failure screenshot to copy
+            result: TestResult to save (result.screenshot_data is stored in the format of self.screenshots)
+            screenshot_path: Optional screenshot file to copy instead (older callers)
+            trace_path: Optional temp Playwright trace of a failed test to move (saved as trace.zip)
             
         Returns:
-            Path to the saved result.json
+            Path to the result.json being written
         """
         run_dir = self.get_current_run_dir(category)
         test_dir = run_dir / "tests" / test_name
-        test_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save result.json
         result_path = test_dir / "result.json"
+        
+        screenshot_data = result.screenshot_data
+        if screenshot_data is None and screenshot_path and Path(screenshot_path).exists():
+            screenshot_data = Path(screenshot_path).read_bytes()
+        screenshot = None
+        if screenshot_data is not None:
+            dest_screenshot = test_dir / self.screenshots.file_name
+            screenshot = (screenshot_data, dest_screenshot)
+            result.screenshot = dest_screenshot
+            result.screenshot_data = None
+        
+        if trace_path and trace_path.exists():
+            dest_trace = test_dir / "trace.zip"
+            self.artifacts.move(trace_path, dest_trace)
+            result.trace = dest_trace
+        
         result_data = result.to_dict()
         result_data["saved_at"] = datetime.now().isoformat()
-        result_path.write_text(json.dumps(result_data, indent=2), encoding="utf-8")
-        
-        # Copy screenshot if provided
-        if screenshot_path and screenshot_path.exists():
-            dest_screenshot = test_dir / "screenshot.png"
-            shutil.copy2(screenshot_path, dest_screenshot)
-            # Update result to point to new location
-            result_data["screenshot"] = str(dest_screenshot)
-            result_path.write_text(json.dumps(result_data, indent=2), encoding="utf-8")
+        self.artifacts.submit(
+            f"write {result_path.name}", self._write_test_result,
+            result_path, result_data, self.current_run_id, category, test_name, screenshot,
+        )
         
         return result_path
     
@@ -144,35 +220,45 @@ class RunStorage:
         self,
         category: str,
         test_name: str,
-        heal_request_path: Path
+        heal_request_path: Path,
+        content: Optional[str] = None,
     ) -> Optional[Path]:
         """
-        Copy a heal request to the run storage.
+        Store a heal request in the run storage.
         
         Args:
             category: Category name
             test_name: Test name
-            heal_request_path: Path to the heal request markdown file
+            heal_request_path: Path of the heal request in .cursor/heal_requests/
+            content: Markdown to write to both locations (from HealRequestGenerator.build);
+                     heal_request_path is written before this returns, so it can be announced
+                     right away; when None, the existing file at heal_request_path is copied
             
         Returns:
-            Path to the copied heal request, or None if source doesn't exist
+            Path to the stored heal request, or None if there is nothing to store
         """
-        if not heal_request_path.exists():
-            return None
-            
         run_dir = self.get_current_run_dir(category)
-        test_dir = run_dir / "tests" / test_name
-        test_dir.mkdir(parents=True, exist_ok=True)
+        dest_path = run_dir / "tests" / test_name / "heal_request.md"
         
-        dest_path = test_dir / "heal_request.md"
-        shutil.copy2(heal_request_path, dest_path)
+        if content is not None:
+            write_file(heal_request_path, content.encode("utf-8"))
+            self.artifacts.write_text(dest_path, content)
+        elif heal_request_path.exists():
+            self.artifacts.copy(heal_request_path, dest_path)
+        else:
+            return None
+        self.artifacts.submit(
+            "index heal request", self.history.record_heal_request,
+            self.current_run_id, category, test_name, dest_path,
+        )
         return dest_path
     
     def save_category_result(
         self,
         category: str,
         result: CategoryResult,
-        video_path: Optional[Path] = None
+        video_path: Optional[Path] = None,
+        video_links: Optional[List[str]] = None,
     ) -> Path:
         """
         Save category run result and optionally move video.
@@ -181,12 +267,12 @@ class RunStorage:
             category: Category name
             result: CategoryResult to save
             video_path: Optional path to video file to move
+            video_links: Subcategory paths whose run dirs get the video too (hard link or copy)
             
         Returns:
-            Path to the saved run.json
+            Path to the run.json being written
         """
         run_dir = self.get_current_run_dir(category)
-        run_dir.mkdir(parents=True, exist_ok=True)
         
         # Track this category for the index
         if category not in self._current_categories:
@@ -199,20 +285,94 @@ class RunStorage:
         run_data["saved_at"] = datetime.now().isoformat()
         if self._run_config is not None:
             run_data["config"] = self._run_config
-        run_json_path.write_text(json.dumps(run_data, indent=2), encoding="utf-8")
         
-        # Move video if provided
-        if video_path and video_path.exists():
+        if video_path:
             dest_video = run_dir / "video.webm"
-            shutil.move(str(video_path), str(dest_video))
             run_data["video"] = str(dest_video)
-            run_json_path.write_text(json.dumps(run_data, indent=2), encoding="utf-8")
+            links = [self.get_current_run_dir(path) / "video.webm" for path in video_links or []]
+            self.artifacts.submit(
+                f"save video of {category}", self._store_video,
+                Path(video_path), dest_video, links, run_json_path, run_data, category,
+            )
+        else:
+            self.artifacts.submit(
+                f"write {run_json_path.name}", self._write_category_run, run_json_path, run_data, category,
+            )
         
         # Cleanup old runs
-        self.cleanup_old_runs(category)
+        self.artifacts.submit(f"clean up old runs of {category}", self.cleanup_old_runs, category)
         
         return run_json_path
     
+    def _store_video(
+        self,
+        video_path: Path,
+        dest_video: Path,
+        links: List[Path],
+        run_json_path: Path,
+        run_data: Dict,
+        category: str,
+    ) -> None:
+        """Writer task: move the category video into its run dir, link it into subcategories, write run.json."""
+        # Playwright may finalize the file shortly after the context closes on some systems
+        deadline = time.monotonic() + self.VIDEO_WAIT_SECONDS
+        while not video_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        if video_path.exists():
+            move_file(video_path, dest_video)
+            for link in links:
+                if link != dest_video:
+                    link.parent.mkdir(parents=True, exist_ok=True)
+                    link_or_copy(dest_video, link)
+        else:
+            run_data = {k: v for k, v in run_data.items() if k != "video"}
+        self._write_category_run(run_json_path, run_data, category)
+    
+    def _write_test_result(
+        self,
+        result_path: Path,
+        result_data: Dict,
+        run_id: str,
+        category: str,
+        test_name: str,
+        screenshot: Optional[Tuple[bytes, Path]] = None,
+    ) -> None:
+        """
+        Writer task: store the screenshot (PNG bytes, path), write result.json and index it
+        (and the test's latest status).
+        
+        The screenshot goes first: if it could not be encoded it is stored as screenshot.png,
+        and result.json records the path actually written.
+        """
+        if screenshot is not None:
+            try:
+                result_data["screenshot"] = str(self.screenshots.save(*screenshot))
+            except Exception as e:
+                print(f"  [Artifacts] Could not write {screenshot[1].name}: {type(e).__name__}: {e}")
+                result_data["screenshot"] = None
+        write_file(result_path, json.dumps(result_data, indent=2).encode("utf-8"))
+        self.history.record_test(
+            run_id, category, test_name, result_data,
+            path_key=tree_key(result_data.get("test_path"), self.tests_root),
+        )
+    
+    def _write_category_run(self, run_json_path: Path, run_data: Dict, category: str) -> None:
+        """Writer task: write run.json and index it (and its tests' latest status)."""
+        write_file(run_json_path, json.dumps(run_data, indent=2).encode("utf-8"))
+        self.history.record_category_run(run_data["run_id"], category, run_data, tests_root=self.tests_root)
+    
+    def flush_artifacts(self) -> int:
+        """
+        Wait for the background artifact writes of this storage.
+        
+        Returns:
+            Number of writes that failed
+        """
+        errors = self.artifacts.flush()
+        if errors:
+            print(f"  [Artifacts] {errors} artifact write(s) failed; see messages above")
+        return errors
+    
     def finalize_run(self, run_result: RunResult) -> Path:
         """
         Create/update the runs_index file for multi-category correlation.
@@ -226,6 +386,7 @@ class RunStorage:
         if not self.current_run_id:
             raise ValueError("No active run to finalize.")
         
+        self.flush_artifacts()
         self.index_dir.mkdir(parents=True, exist_ok=True)
         index_path = self.index_dir / f"{self.current_run_id}.json"
         
@@ -321,16 +482,41 @@ class RunStorage:
             "duration_ms": run_result.duration_ms,
             "failed_tests": failed_tests,
         }
+        index_data.update(self.run_metadata)
         if self._run_config is not None:
             index_data["config"] = self._run_config
         
         index_path.write_text(json.dumps(index_data, indent=2), encoding="utf-8")
+        try:
+            self.history.record_run(index_data)
+        except sqlite3.Error as e:
+            print(f"  [History] Could not index run {self.current_run_id}: {e}")
+        self.profile_report_path = self.save_profile_report(run_result)
         
         # Cleanup old index files
         self._cleanup_old_index_files()
         
         return index_path
     
+    def save_profile_report(self, run_result: RunResult) -> Optional[Path]:
+        """
+        Write the run's slowest Playwright calls to runs_index/profiles/{run_id}.json.
+        
+        Args:
+            run_result: The complete RunResult
+            
+        Returns:
+            Path to the report, or None if no test was profiled
+        """
+        report = build_profile_report(run_result, run_id=self.current_run_id)
+        if report is None:
+            return None
+        profiles_dir = self.index_dir / self.PROFILES_DIR_NAME
+        profiles_dir.mkdir(parents=True, exist_ok=True)
+        report_path = profiles_dir / f"{self.current_run_id}.json"
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return report_path
+    
     def cleanup_old_runs(self, category: str) -> int:
         """
         Delete oldest runs if count exceeds max_runs.
@@ -351,13 +537,15 @@ class RunStorage:
             key=lambda d: d.name
         )
         
-        deleted = 0
+        deleted = []
         while len(run_dirs) > self.max_runs:
             oldest = run_dirs.pop(0)
             shutil.rmtree(oldest)
-            deleted += 1
+            deleted.append(oldest.name)
+        if deleted:
+            self.history.remove_category_runs(category, deleted)
         
-        return deleted
+        return len(deleted)
     
     def _cleanup_old_index_files(self) -> int:
         """
@@ -374,13 +562,21 @@ class RunStorage:
             key=lambda f: f.name
         )
         
-        deleted = 0
+        deleted = []
         while len(index_files) > self.max_runs:
             oldest = index_files.pop(0)
             oldest.unlink()
-            deleted += 1
+            profile = self.index_dir / self.PROFILES_DIR_NAME / oldest.name
+            if profile.exists():
+                profile.unlink()
+            deleted.append(oldest.stem)
+        if deleted:
+            try:
+                self.history.remove_runs(deleted)
+            except sqlite3.Error as e:
+                print(f"  [History] Could not remove old runs from the index: {e}")
         
-        return deleted
+        return len(deleted)
     
     def list_category_runs(self, category: str) -> List[Dict]:
         """
@@ -392,6 +588,103 @@ class RunStorage:
         Returns:
             List of run metadata dicts, newest first
         """
+        return self._query_history(
+            lambda history: history.list_category_runs(category),
+            lambda: self._scan_list_category_runs(category),
+        )
+    
+    def list_all_runs(self) -> List[Dict]:
+        """
+        List all runs from all categories and the index directory.
+        
+        Returns:
+            List of run data, newest first. For "All Categories" view:
+            - Multi-category runs from index (shown once)
+            - Individual category runs that aren't in index
+            This avoids showing the same run multiple times in the all-runs view.
+        """
+        return self._query_history(
+            lambda history: history.list_all_runs(),
+            self._scan_list_all_runs,
+        )
+    
+    def get_all_last_results(self) -> List[Dict]:
+        """
+        Get the latest result (passed/failed/skipped) for every test that has been run:
+        the tests of the most recent run of every category path.
+        
+        Returns:
+            List of dicts with keys: category_path (str), test_name (str, as stored in run dir), status (str)
+        """
+        return self._query_history(
+            lambda history: history.get_all_last_results(),
+            self._scan_get_all_last_results,
+        )
+    
+    def get_latest_results(self) -> Dict[str, str]:
+        """
+        Get the newest result of every test that has been run, whichever run it was in.
+        
+        Returns:
+            Dict of tree key (test folder below tests/, e.g. "clients/notes/add_note" or
+            "clients/_setup") -> status ("passed", "failed" or "skipped")
+        """
+        return self._query_history(
+            lambda history: history.latest_results(),
+            self._scan_latest_results,
+        )
+    
+    def list_test_runs(self, category: str, test_name: str) -> List[Dict]:
+        """
+        List all runs that contain a specific test.
+        
+        Args:
+            category: Category name (parent category, e.g., 'scheduling')
+            test_name: Test name (e.g., 'Create Service' or 'create_service')
+            
+        Returns:
+            List of run metadata dicts that contain this test, newest first
+        """
+        return self._query_history(
+            lambda history: history.list_test_runs(category, test_name),
+            lambda: self._scan_list_test_runs(category, test_name),
+        )
+    
+    def get_run_details(self, category: str, run_id: str) -> Optional[Dict]:
+        """
+        Get detailed run data for a specific category and run.
+        
+        Args:
+            category: Category name
+            run_id: Run ID (timestamp)
+            
+        Returns:
+            Run data dict with test results, or None if not found
+        """
+        def query(history: HistoryIndex) -> Optional[Dict]:
+            data = history.get_run_details(category, run_id)
+            video_path = self.get_category_runs_dir(category) / run_id / "video.webm"
+            if data is not None and video_path.exists():
+                data["video_path"] = str(video_path)
+            return data
+        
+        return self._query_history(query, lambda: self._scan_get_run_details(category, run_id))
+    
+    def _query_history(self, query: Callable[[HistoryIndex], Any], scan: Callable[[], Any]) -> Any:
+        """Answer a history query from the index (backfilled on first use), or by walking the run dirs."""
+        try:
+            if not self._history_ready:
+                if not self.history.is_built():
+                    print("  [History] Building the run history index (one time)...")
+                    self.history.rebuild(self.tests_root, self.index_dir)
+                self._history_ready = True
+            return query(self.history)
+        except sqlite3.Error as e:
+            print(f"  [History] Index unavailable, scanning run dirs: {e}")
+            return scan()
+    
+    def _scan_list_category_runs(self, category: str) -> List[Dict]:
+        """Directory walk behind list_category_runs() (fallback when the history index cannot be used)."""
         runs_dir = self.get_category_runs_dir(category)
         if not runs_dir.exists():
             return []
@@ -415,16 +708,8 @@ class RunStorage:
         
         return runs
     
-    def list_all_runs(self) -> List[Dict]:
-        """
-        List all runs from all categories and the index directory.
-        
-        Returns:
-            List of run data, newest first. For "All Categories" view:
-            - Multi-category runs from index (shown once)
-            - Individual category runs that aren't in index
-            This avoids showing the same run multiple times in the all-runs view.
-        """
+    def _scan_list_all_runs(self) -> List[Dict]:
+        """Directory walk behind list_all_runs() (fallback when the history index cannot be used)."""
         runs = []
         index_runs_by_id = {}  # Track index runs by run_id
         category_runs_by_id = {}  # Track category runs by (run_id, category) to avoid duplicates
@@ -493,14 +778,8 @@ class RunStorage:
         
         return runs
     
-    def get_all_last_results(self) -> List[Dict]:
-        """
-        Get the latest result (passed/failed/skipped) for every test that has been run.
-        Scans all category _runs directories and returns the most recent result per test.
-        
-        Returns:
-            List of dicts with keys: category_path (str), test_name (str, as stored in run dir), status (str)
-        """
+    def _scan_get_all_last_results(self) -> List[Dict]:
+        """Directory walk behind get_all_last_results() (fallback when the history index cannot be used)."""
         results: List[Dict] = []
         
         def scan_category_runs(category_path: Path, category_name: str):
@@ -552,17 +831,40 @@ class RunStorage:
         
         return results
     
-    def list_test_runs(self, category: str, test_name: str) -> List[Dict]:
-        """
-        List all runs that contain a specific test.
-        
-        Args:
-            category: Category name (parent category, e.g., 'scheduling')
-            test_name: Test name (e.g., 'Create Service' or 'create_service')
-            
-        Returns:
-            List of run metadata dicts that contain this test, newest first
-        """
+    def _scan_latest_results(self) -> Dict[str, str]:
+        """Directory walk behind get_latest_results() (fallback when the history index cannot be used)."""
+        latest: Dict[str, tuple] = {}
+        run_entries: List[tuple] = []
+        for runs_dir in self.tests_root.rglob(self.RUNS_DIR_NAME):
+            for result_json in runs_dir.glob("*/tests/*/result.json"):
+                try:
+                    data = json.loads(result_json.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, IOError):
+                    continue
+                run_id = result_json.parents[2].name
+                key = tree_key(data.get("test_path"), self.tests_root)
+                if key and data.get("status") in ("passed", "failed", "skipped"):
+                    if key not in latest or run_id >= latest[key][0]:
+                        latest[key] = (run_id, data["status"])
+            for run_json in runs_dir.glob("*/run.json"):
+                try:
+                    data = json.loads(run_json.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, IOError):
+                    continue
+                run_entries.extend((run_json.parent.name, test) for test in data.get("test_results") or [])
+        # Same precedence as the index: run.json entries (tests skipped before they ran) only
+        # replace a result from an older run
+        for run_id, test in run_entries:
+            if not isinstance(test, dict):
+                continue
+            key = tree_key(test.get("test_path"), self.tests_root)
+            if key and test.get("status") in ("passed", "failed", "skipped"):
+                if key not in latest or run_id > latest[key][0]:
+                    latest[key] = (run_id, test["status"])
+        return {key: status for key, (_, status) in latest.items()}
+    
+    def _scan_list_test_runs(self, category: str, test_name: str) -> List[Dict]:
+        """Directory walk behind list_test_runs() (fallback when the history index cannot be used)."""
         # First, try the parent category's runs directory
         runs_dir = self.get_category_runs_dir(category)
         runs = []
@@ -854,17 +1156,8 @@ class RunStorage:
         
         return runs
     
-    def get_run_details(self, category: str, run_id: str) -> Optional[Dict]:
-        """
-        Get detailed run data for a specific category and run.
-        
-        Args:
-            category: Category name
-            run_id: Run ID (timestamp)
-            
-        Returns:
-            Run data dict with test results, or None if not found
-        """
+    def _scan_get_run_details(self, category: str, run_id: str) -> Optional[Dict]:
+        """Directory walk behind get_run_details() (fallback when the history index cannot be used)."""
         run_dir = self.get_category_runs_dir(category) / run_id
         if not run_dir.exists():
             return None
@@ -890,14 +1183,18 @@ class RunStorage:
                         continue
                     artifacts = {}
                     
-                    screenshot = test_dir / "screenshot.png"
-                    if screenshot.exists():
+                    screenshot = find_screenshot(test_dir)
+                    if screenshot is not None:
                         artifacts["screenshot"] = str(screenshot)
                     
                     heal_request = test_dir / "heal_request.md"
                     if heal_request.exists():
                         artifacts["heal_request"] = str(heal_request)
                     
+                    trace = test_dir / "trace.zip"
+                    if trace.exists():
+                        artifacts["trace"] = str(trace)
+                    
                     result_json = test_dir / "result.json"
                     if result_json.exists():
                         artifacts["result"] = json.loads(result_json.read_text(encoding="utf-8"))
@@ -908,3 +1205,4 @@ class RunStorage:
             return data
         except (json.JSONDecodeError, IOError):
             return None
+
@@ -0,0 +1,146 @@
+"""
+Per-test Playwright traces, kept only for failing tests.
+
+With execution.trace_on_failure, tracing is started once on each category's BrowserContext
+and every setup/test/teardown runs in its own trace chunk (tracing.start_chunk /
+stop_chunk). When the test fails (after its retries), the chunk is written to a temp zip
+that storage moves to the test's run dir as trace.zip; when it passes, stop_chunk() is
+called without a path and Playwright drops the chunk without serializing it.
+
+A trace holds DOM snapshots, screenshots, network and console output per action, which is
+what healing needs; open it with `playwright show-trace trace.zip`.
+"""
+
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+TRACE_FILE_NAME = "trace.zip"
+
+
+class TraceRecorder:
+    """
+    Chunked tracing of one BrowserContext at a time.
+
+    Usage:
+        traces = TraceRecorder.from_config(config)
+        traces.start(browser_context)                      # once per context
+        traces.begin("create_client")
+        ...test...
+        trace_path = traces.end(failed=result.status == "failed")   # temp zip or None
+    """
+
+    DEFAULT_DIR = ".temp_traces"
+
+    def __init__(self, temp_dir: Optional[Path] = None, enabled: bool = False):
+        """
+        Initialize the recorder.
+
+        Args:
+            temp_dir: Where failing chunks are written before storage moves them (default: .temp_traces/)
+            enabled: When False, every method does nothing
+        """
+        self.temp_dir = Path(temp_dir or self.DEFAULT_DIR)
+        self.enabled = enabled
+        self._tracing = None
+        self._in_chunk = False
+
+    @property
+    def in_chunk(self) -> bool:
+        """True while a test's chunk is open."""
+        return self._in_chunk
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "TraceRecorder":
+        """Build a recorder from execution.trace_on_failure in config.yaml."""
+        execution = (config or {}).get("execution") or {}
+        return cls(enabled=bool(execution.get("trace_on_failure", False)))
+
+    def _chunk_path(self) -> Path:
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        return self.temp_dir / f"{uuid.uuid4().hex}.zip"
+
+    def start(self, browser_context: Any) -> None:
+        """Start tracing a new category context (snapshots and screenshots, no chunk yet)."""
+        self._tracing = None
+        self._in_chunk = False
+        if not self.enabled:
+            return
+        try:
+            browser_context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self._tracing = browser_context.tracing
+        except Exception as e:
+            print(f"  [Trace] Could not start tracing: {type(e).__name__}: {e}")
+
+    def begin(self, title: str) -> None:
+        """Open the chunk of one test."""
+        if self._tracing is None:
+            return
+        try:
+            self._tracing.start_chunk(title=title)
+            self._in_chunk = True
+        except Exception as e:
+            print(f"  [Trace] Could not start trace chunk: {type(e).__name__}: {e}")
+
+    def end(self, failed: bool) -> Optional[Path]:
+        """
+        Close the current chunk.
+
+        Args:
+            failed: True to write the chunk to a zip, False to drop it
+
+        Returns:
+            Temp path of the written trace, or None
+        """
+        if self._tracing is None or not self._in_chunk:
+            return None
+        self._in_chunk = False
+        try:
+            if not failed:
+                self._tracing.stop_chunk()
+                return None
+            path = self._chunk_path()
+            self._tracing.stop_chunk(path=str(path))
+            return path if path.exists() else None
+        except Exception as e:
+            print(f"  [Trace] Could not stop trace chunk: {type(e).__name__}: {e}")
+            return None
+
+    async def start_async(self, browser_context: Any) -> None:
+        """start() for an async BrowserContext."""
+        self._tracing = None
+        self._in_chunk = False
+        if not self.enabled:
+            return
+        try:
+            await browser_context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self._tracing = browser_context.tracing
+        except Exception as e:
+            print(f"  [Trace] Could not start tracing: {type(e).__name__}: {e}")
+
+    async def begin_async(self, title: str) -> None:
+        """begin() for an async BrowserContext."""
+        if self._tracing is None:
+            return
+        try:
+            await self._tracing.start_chunk(title=title)
+            self._in_chunk = True
+        except Exception as e:
+            print(f"  [Trace] Could not start trace chunk: {type(e).__name__}: {e}")
+
+    async def end_async(self, failed: bool) -> Optional[Path]:
+        """end() for an async BrowserContext."""
+        if self._tracing is None or not self._in_chunk:
+            return None
+        self._in_chunk = False
+        try:
+            if not failed:
+                await self._tracing.stop_chunk()
+                return None
+            path = self._chunk_path()
+            await self._tracing.stop_chunk(path=str(path))
+            return path if path.exists() else None
+        except Exception as e:
+            print(f"  [Trace] Could not stop trace chunk: {type(e).__name__}: {e}")
+            return None
@@ -0,0 +1,124 @@
+"""
+Video recording policy for category runs.
+
+Every category used to be recorded at 1920x1080 and the video moved into _runs/ (and copied
+into each subcategory run dir), even for green runs nobody watches. browser.video in
+config.yaml picks what is recorded and kept:
+
+- off: no recording
+- on: record and keep every category (previous behavior)
+- retain-on-failure: record, keep only categories with a failed setup, test or teardown
+- first-retry-only: record, keep only categories where a test was retried (flaky or failed
+  after its retries). Playwright records a whole BrowserContext, and retries reuse the
+  category's page, so the recording cannot start at the retry itself; the kept video's
+  timeline shows where the retries are.
+
+width/height set the recording size (smaller = less encoding CPU and disk). Playwright's
+recorder has no bitrate setting, so size is the knob for file size.
+
+Kept videos are hard-linked into subcategory run dirs instead of copied when the filesystem
+allows it.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .models import CategoryResult
+
+
+VIDEO_OFF = "off"
+VIDEO_ON = "on"
+VIDEO_RETAIN_ON_FAILURE = "retain-on-failure"
+VIDEO_FIRST_RETRY_ONLY = "first-retry-only"
+VIDEO_MODES = [VIDEO_OFF, VIDEO_ON, VIDEO_RETAIN_ON_FAILURE, VIDEO_FIRST_RETRY_ONLY]
+
+DEFAULT_VIDEO_SIZE = {"width": 1920, "height": 1080}
+
+
+class VideoPolicy:
+    """
+    What to record and which category videos to keep.
+
+    Usage:
+        video = VideoPolicy.from_config(config, record_video=True)
+        if video.records:
+            ...new_context(video_dir=..., video_size=video.size)...
+        if not video.keep(category_result):
+            ...delete the recording...
+    """
+
+    def __init__(self, mode: str = VIDEO_ON, size: Optional[Dict[str, int]] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            mode: One of VIDEO_MODES
+            size: {"width", "height"} of the recording (default: 1920x1080)
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in VIDEO_MODES:
+            raise ValueError(f"Unknown video mode {mode!r}; expected one of: {', '.join(VIDEO_MODES)}")
+        self.mode = mode
+        self.size = dict(size or DEFAULT_VIDEO_SIZE)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], record_video: bool = True) -> "VideoPolicy":
+        """
+        Build the policy from the browser.video section of config.yaml.
+
+        Args:
+            config: Full config dict
+            record_video: False forces mode off (TestRunner(record_video=False))
+        """
+        section = ((config or {}).get("browser") or {}).get("video") or {}
+        if isinstance(section, str):
+            section = {"mode": section}
+        mode = str(section.get("mode") or VIDEO_ON).lower()
+        if not record_video:
+            mode = VIDEO_OFF
+        size = {
+            "width": int(section.get("width") or DEFAULT_VIDEO_SIZE["width"]),
+            "height": int(section.get("height") or DEFAULT_VIDEO_SIZE["height"]),
+        }
+        return cls(mode=mode, size=size)
+
+    @property
+    def records(self) -> bool:
+        """True if category contexts are recorded."""
+        return self.mode != VIDEO_OFF
+
+    def keep(self, result: CategoryResult) -> bool:
+        """True if the recording of a finished category should be saved."""
+        if self.mode == VIDEO_ON:
+            return True
+        results = list(result.test_results)
+        for extra in (result.setup_result, result.teardown_result):
+            if extra is not None:
+                results.append(extra)
+        if self.mode == VIDEO_RETAIN_ON_FAILURE:
+            return any(r.status == "failed" for r in results)
+        if self.mode == VIDEO_FIRST_RETRY_ONLY:
+            return any(len(r.attempts) > 1 for r in results)
+        return False
+
+    def discard_reason(self) -> str:
+        """Why keep() returned False, for the run log."""
+        if self.mode == VIDEO_RETAIN_ON_FAILURE:
+            return "no failure"
+        if self.mode == VIDEO_FIRST_RETRY_ONLY:
+            return "no retried test"
+        return f"mode {self.mode}"
+
+
+def link_or_copy(source: Path, dest: Path) -> None:
+    """Hard-link source to dest (replacing dest), copying when linking is not possible."""
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(str(source), str(dest))
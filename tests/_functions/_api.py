@@ -0,0 +1,215 @@
+"""
+API backend for the fixture functions (fn_create_client, fn_create_service, fn_delete_client,
+fn_delete_service).
+
+Setups create their clients and services through the UI, which costs minutes per category
+for data that is not under test. With the API backend, the same functions create and delete
+the entities with HTTP calls made through page.request, which shares the logged-in
+BrowserContext's cookies, and save the same context keys (created_client_id,
+created_service_name, ...), so the calling tests do not change.
+
+The backend is chosen per call, first match wins:
+- params backend="api" / "ui"
+- context["fixture_backend"]
+- config.yaml fixtures.backend (default "ui")
+
+Endpoints, the API base URL and where the id is in the responses are configured in
+config.yaml (fixtures section). For offline runs, point fixtures.api_base_url at the stub
+server in tests/_functions/_api_stub.py.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from tests._functions._config import get_base_url, load_project_config
+
+BACKEND_UI = "ui"
+BACKEND_API = "api"
+
+# "METHOD path" per operation; {id} is replaced by the entity id
+DEFAULT_ENDPOINTS = {
+    "create_client": "POST /platform/v1/clients",
+    "delete_client": "DELETE /platform/v1/clients/{id}",
+    "list_clients": "GET /platform/v1/clients",
+    "create_service": "POST /platform/v1/services",
+    "delete_service": "DELETE /platform/v1/services/{id}",
+    "list_services": "GET /platform/v1/services",
+}
+# Response paths tried (in order) for the created entity's id
+ID_PATHS = [
+    ["data", "client", "id"],
+    ["data", "service", "id"],
+    ["data", "id"],
+    ["id"],
+    ["uid"],
+]
+
+
+def _fixtures_config() -> Dict[str, Any]:
+    return load_project_config().get("fixtures") or {}
+
+
+def fixture_backend(context: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> str:
+    """Backend for a fixture function call: "ui" or "api"."""
+    if params and params.get("backend"):
+        return str(params["backend"]).lower()
+    if context and context.get("fixture_backend"):
+        return str(context["fixture_backend"]).lower()
+    return str(_fixtures_config().get("backend") or BACKEND_UI).lower()
+
+
+def use_api_backend(context: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> bool:
+    """True if the fixture function should use the API backend."""
+    return fixture_backend(context, params) == BACKEND_API
+
+
+def _dig(data: Any, path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+class FixtureApi:
+    """
+    HTTP client for the fixture endpoints, on the page's APIRequestContext (logged-in cookies).
+
+    Args:
+        page: Playwright page (its context holds the session cookies), or an APIRequestContext
+              created with the cached session's storage_state (data pool provisioner)
+        context: Test context (for base_url)
+        params: Function params (for base_url)
+    """
+
+    def __init__(self, page: Any, context: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None):
+        config = _fixtures_config()
+        self.request = getattr(page, "request", page)
+        self.page = page
+        self.base_url = str(config.get("api_base_url") or get_base_url(context, params)).rstrip("/")
+        self.endpoints = {**DEFAULT_ENDPOINTS, **(config.get("endpoints") or {})}
+        self.timeout = int(config.get("timeout_ms", 30000))
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json"}
+        # Rails endpoints called with session cookies expect the page's CSRF token
+        try:
+            token = self.page.evaluate(
+                "() => document.querySelector('meta[name=\"csrf-token\"]')?.content || null"
+            )
+        except Exception:
+            token = None
+        if token:
+            headers["X-CSRF-Token"] = token
+        return headers
+
+    def call(self, operation: str, entity_id: Optional[str] = None, data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call an endpoint and return its JSON body (None when empty).
+
+        Raises:
+            Exception: If the response status is not 2xx
+        """
+        method, path = self.endpoints[operation].split(" ", 1)
+        url = self.base_url + path.replace("{id}", str(entity_id or ""))
+        response = self.request.fetch(
+            url,
+            method=method,
+            headers=self._headers(),
+            data=data,
+            timeout=self.timeout,
+        )
+        if not response.ok:
+            raise Exception(f"{operation} failed: {method} {url} -> {response.status} {response.text()[:200]}")
+        body = response.text()
+        return response.json() if body.strip() else None
+
+    def create(self, operation: str, data: Dict[str, Any]) -> str:
+        """Create an entity and return its id."""
+        body = self.call(operation, data=data)
+        for path in ID_PATHS:
+            value = _dig(body, path)
+            if value:
+                return str(value)
+        raise Exception(f"{operation}: no id in response {str(body)[:200]}")
+
+    def find_id(self, operation: str, field: str, value: str) -> Optional[str]:
+        """Id of the first listed entity whose field equals value."""
+        body = self.call(operation)
+        items = _dig(body, ["data"]) if isinstance(body, dict) else body
+        if isinstance(items, dict):
+            items = next((v for v in items.values() if isinstance(v, list)), [])
+        for item in items or []:
+            if isinstance(item, dict) and item.get(field) == value:
+                return str(item.get("id") or item.get("uid"))
+        return None
+
+
+def api_create_client(page: Any, context: dict, **params) -> None:
+    """API backend of fn_create_client (same params and context keys)."""
+    timestamp = int(time.time())
+    first_name = params.get("first_name", "Test")
+    last_name = params.get("last_name", f"Client{timestamp}")
+    email = params.get("email", f"test_{timestamp}@vcita-test.com")
+    full_name = f"{first_name} {last_name}"
+
+    client_id = FixtureApi(page, context, params).create(
+        "create_client",
+        {"first_name": first_name, "last_name": last_name, "email": email},
+    )
+
+    context["created_client_id"] = client_id
+    context["created_client_name"] = full_name
+    context["created_client_email"] = email
+    print(f"  [OK] Created client via API: {full_name} (ID: {client_id})")
+
+
+def api_delete_client(page: Any, context: dict, **params) -> None:
+    """API backend of fn_delete_client (same params and context keys)."""
+    name = params.get("name") or context.get("created_client_name")
+    client_id = params.get("id") or context.get("created_client_id")
+    if not name and not client_id:
+        raise ValueError("Client name is required for deletion")
+    api = FixtureApi(page, context, params)
+    if not client_id:
+        last_name = name.partition(" ")[2]
+        client_id = api.find_id("list_clients", "last_name", last_name) if last_name else None
+        if not client_id:
+            raise Exception(f"Client not found: {name}")
+    api.call("delete_client", entity_id=client_id)
+
+    for key in ("created_client_id", "created_client_name", "created_client_email"):
+        context.pop(key, None)
+    print(f"  [OK] Deleted client via API: {name or client_id}")
+
+
+def api_create_service(page: Any, context: dict, **params) -> None:
+    """API backend of fn_create_service (same params and context keys)."""
+    name = params.get("name") or f"Test Service {int(time.time())}"
+
+    # Same defaults as the UI flow: free 1-on-1 service, face to face, 1 hour
+    service_id = FixtureApi(page, context, params).create(
+        "create_service",
+        {"name": name, "duration": 60, "price": 0, "service_type": "appointment", "location_type": "face_to_face"},
+    )
+
+    context["created_service_id"] = service_id
+    context["created_service_name"] = name
+    print(f"  [OK] Created service via API: {name} (ID: {service_id})")
+
+
+def api_delete_service(page: Any, context: dict, **params) -> None:
+    """API backend of fn_delete_service (same params and context keys)."""
+    name = params.get("name") or context.get("created_service_name")
+    if not name:
+        raise ValueError("Service name is required for deletion")
+    api = FixtureApi(page, context, params)
+    service_id = context.get("created_service_id") if name == context.get("created_service_name") else None
+    service_id = service_id or api.find_id("list_services", "name", name)
+    if not service_id:
+        raise Exception(f"Service not found: {name}")
+    api.call("delete_service", entity_id=service_id)
+
+    context.pop("created_service_id", None)
+    context.pop("created_service_name", None)
+    print(f"  [OK] Deleted service via API: {name}")
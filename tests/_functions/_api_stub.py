@@ -0,0 +1,159 @@
+"""
+Local stub of the fixture endpoints used by tests/_functions/_api.py, for offline runs.
+
+Keeps clients and services in memory and answers the default endpoints
+(POST/GET /platform/v1/clients, DELETE /platform/v1/clients/{id}, and the same for services)
+with the response shapes FixtureApi reads.
+
+Usage:
+    python -m tests._functions._api_stub --port 8765
+    # config.yaml: fixtures: {backend: api, api_base_url: http://127.0.0.1:8765}
+
+or in code:
+    with ApiStubServer() as stub:
+        ...FixtureApi calls against stub.base_url...
+"""
+
+import argparse
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+_PATH_RE = re.compile(r"^/platform/v1/(clients|services)(?:/([^/?]+))?/?(?:\?.*)?$")
+_SINGULAR = {"clients": "client", "services": "service"}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: "ApiStubServer._Server"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: Optional[Dict[str, Any]] = None) -> None:
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _route(self):
+        match = _PATH_RE.match(self.path)
+        if not match:
+            self._send(404, {"status": "Error", "message": f"Unknown endpoint {self.path}"})
+            return None, None
+        return match.group(1), match.group(2)
+
+    def do_GET(self) -> None:
+        kind, entity_id = self._route()
+        if kind is None:
+            return
+        store = self.server.store[kind]
+        if entity_id:
+            if entity_id not in store:
+                self._send(404, {"status": "Error", "message": "Not found"})
+                return
+            self._send(200, {"status": "OK", "data": {_SINGULAR[kind]: store[entity_id]}})
+            return
+        self._send(200, {"status": "OK", "data": {kind: list(store.values())}})
+
+    def do_POST(self) -> None:
+        kind, entity_id = self._route()
+        if kind is None:
+            return
+        if entity_id:
+            self._send(405, {"status": "Error", "message": "Method not allowed"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send(400, {"status": "Error", "message": "Invalid JSON"})
+            return
+        entity = {**data, "id": uuid.uuid4().hex[:16]}
+        with self.server.lock:
+            self.server.store[kind][entity["id"]] = entity
+        self._send(201, {"status": "OK", "data": {_SINGULAR[kind]: entity}})
+
+    def do_DELETE(self) -> None:
+        kind, entity_id = self._route()
+        if kind is None:
+            return
+        with self.server.lock:
+            removed = self.server.store[kind].pop(entity_id, None) if entity_id else None
+        if removed is None:
+            self._send(404, {"status": "Error", "message": "Not found"})
+            return
+        self._send(200, {"status": "OK", "data": {}})
+
+
+class ApiStubServer:
+    """
+    In-memory fixture API on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to listen on (0 = any free port)
+        verbose: Log every request to stderr
+    """
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        self._server = self._Server((host, port), _StubHandler)
+        self._server.store = {"clients": {}, "services": {}}
+        self._server.lock = threading.Lock()
+        self._server.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as fixtures.api_base_url."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def store(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Entities per kind ("clients", "services") by id."""
+        return self._server.store
+
+    def start(self) -> "ApiStubServer":
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ApiStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub of the fixture API endpoints for offline runs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    stub = ApiStubServer(args.host, args.port, verbose=True)
+    print(f"Fixture API stub listening on {stub.base_url} (Ctrl+C to stop)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
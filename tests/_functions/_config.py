@@ -31,17 +31,21 @@ def get_base_url(context: Optional[Dict[str, Any]] = None, params: Optional[Dict
 
 def _load_base_url_from_config() -> Optional[str]:
     """Load target.base_url from project root config.yaml. Returns None if missing."""
+    target = load_project_config().get("target") or {}
+    base = target.get("base_url")
+    return str(base).rstrip("/") if base else None
+
+
+def load_project_config() -> Dict[str, Any]:
+    """Load project root config.yaml. Returns {} if missing or unreadable."""
     # From tests/_functions/_config.py -> project root = parent.parent.parent
     project_root = Path(__file__).resolve().parent.parent.parent
     config_path = project_root / "config.yaml"
     if not config_path.exists():
-        return None
+        return {}
     try:
         import yaml
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        target = (config or {}).get("target") or {}
-        base = target.get("base_url")
-        return str(base).rstrip("/") if base else None
+            return yaml.safe_load(f) or {}
     except Exception:
-        return None
+        return {}
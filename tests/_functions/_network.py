@@ -0,0 +1,168 @@
+"""
+Network-quiet detection that ignores vcita's background polling.
+
+page.wait_for_load_state("networkidle") never settles on vcita: notification polling,
+analytics and chat widgets keep requests going. NetworkTracker counts only the requests that
+matter - those still in flight that do not match the ignore list - and reports "quiet" once
+none remained for quiet_ms. Page-level request events include the requests of every frame,
+so XHRs of the angularjs iframe and #vue_iframe_layout are tracked too.
+
+Usage (start tracking before the action, so its requests are seen):
+
+    with NetworkTracker(page) as network:
+        save_btn.click()
+        network.wait_for_quiet()
+
+Extra ignore patterns come from config.yaml (network_quiet.ignore) or the ignore argument.
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from tests._functions._config import load_project_config
+
+# URL patterns (regex, searched) of background traffic that never settles
+DEFAULT_IGNORE_PATTERNS = [
+    r"/notifications?/",
+    r"/poll(ing)?\b",
+    r"heartbeat",
+    r"/unread",
+    r"/realtime",
+    r"pusher(app)?\.com",
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net",
+    r"segment\.(io|com)|mixpanel\.com|amplitude\.com",
+    r"hotjar\.(com|io)|fullstory\.com|clarity\.ms",
+    r"intercom(cdn)?\.(io|com)|zdassets\.com|zopim\.com",
+    r"sentry\.io|nr-data\.net|newrelic\.com|datadoghq\.com",
+    r"facebook\.(com|net)/tr|connect\.facebook\.net",
+]
+# Resource types that stay open by design
+IGNORED_RESOURCE_TYPES = {"websocket", "eventsource", "media"}
+# A request in flight this long is treated as a long poll and stops counting
+DEFAULT_LONG_REQUEST_MS = 15000
+
+
+def _config_ignore_patterns() -> List[str]:
+    """network_quiet.ignore from config.yaml."""
+    section = load_project_config().get("network_quiet") or {}
+    return [str(p) for p in section.get("ignore") or []]
+
+
+class NetworkTracker:
+    """
+    Tracks in-flight requests of a page and its frames, minus ignored background traffic.
+
+    Args:
+        page: Playwright page to listen on
+        ignore: Extra URL regexes to ignore (added to the defaults and config.yaml)
+        long_request_ms: In-flight time after which a request no longer counts (long polls)
+    """
+
+    def __init__(
+        self,
+        page: Any,
+        ignore: Optional[Iterable[str]] = None,
+        long_request_ms: int = DEFAULT_LONG_REQUEST_MS,
+    ):
+        self.page = page
+        patterns = DEFAULT_IGNORE_PATTERNS + _config_ignore_patterns() + list(ignore or [])
+        self._ignore = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+        self.long_request_ms = long_request_ms
+        # request -> monotonic start time
+        self._in_flight: Dict[Any, float] = {}
+        self._last_activity = time.monotonic()
+        self._attached = False
+
+    def __enter__(self) -> "NetworkTracker":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> "NetworkTracker":
+        """Start listening (idempotent)."""
+        if not self._attached:
+            self.page.on("request", self._on_request)
+            self.page.on("requestfinished", self._on_done)
+            self.page.on("requestfailed", self._on_done)
+            self._attached = True
+        return self
+
+    def stop(self) -> None:
+        """Stop listening and forget in-flight requests."""
+        if self._attached:
+            self.page.remove_listener("request", self._on_request)
+            self.page.remove_listener("requestfinished", self._on_done)
+            self.page.remove_listener("requestfailed", self._on_done)
+            self._attached = False
+        self._in_flight.clear()
+
+    def ignored(self, request: Any) -> bool:
+        """True if the request is background traffic that should not delay quiet."""
+        return request.resource_type in IGNORED_RESOURCE_TYPES or bool(self._ignore.search(request.url))
+
+    def _on_request(self, request: Any) -> None:
+        if self.ignored(request):
+            return
+        self._in_flight[request] = time.monotonic()
+        self._last_activity = time.monotonic()
+
+    def _on_done(self, request: Any) -> None:
+        if self._in_flight.pop(request, None) is not None:
+            self._last_activity = time.monotonic()
+
+    def pending(self) -> List[str]:
+        """URLs of the requests that currently keep the page from being quiet."""
+        now = time.monotonic()
+        return [
+            request.url for request, started in self._in_flight.items()
+            if (now - started) * 1000 < self.long_request_ms
+        ]
+
+    def wait_for_quiet(self, quiet_ms: int = 500, timeout: int = 30000, poll_ms: int = 50) -> None:
+        """
+        Wait until no tracked request has been in flight for quiet_ms.
+
+        Args:
+            quiet_ms: How long the network must stay quiet
+            timeout: Maximum wait in ms
+            poll_ms: Longest wait for the next request event between two checks
+
+        Raises:
+            TimeoutError: If requests are still pending after timeout, listing them
+        """
+        self.start()
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            now = time.monotonic()
+            pending = self.pending()
+            if not pending and (now - self._last_activity) * 1000 >= quiet_ms:
+                return
+            if now >= deadline:
+                shown = ", ".join(pending[:5]) + (f" (+{len(pending) - 5} more)" if len(pending) > 5 else "")
+                raise TimeoutError(f"Network not quiet after {timeout}ms; pending: {shown or 'recent activity'}")
+            # Waiting on an event (not a fixed sleep) lets Playwright deliver the request events
+            try:
+                self.page.wait_for_event("requestfinished", timeout=poll_ms)
+            except PlaywrightTimeoutError:
+                pass
+
+
+def wait_for_network_quiet(page: Any, action=None, quiet_ms: int = 500, timeout: int = 30000, **tracker_args) -> None:
+    """
+    Run action (if given) and wait until the page's relevant requests have settled.
+
+    Args:
+        page: Playwright page
+        action: Callable that triggers the requests (e.g. lambda: save_btn.click())
+        quiet_ms: How long the network must stay quiet
+        timeout: Maximum wait in ms
+        **tracker_args: Passed to NetworkTracker (ignore, long_request_ms)
+    """
+    with NetworkTracker(page, **tracker_args) as network:
+        if action is not None:
+            action()
+        network.wait_for_quiet(quiet_ms=quiet_ms, timeout=timeout)
@@ -0,0 +1,179 @@
+"""
+Lease test data from the pre-provisioned pool (src/runner/data_pool.py) instead of creating it.
+
+Setups call lease_client / lease_service / lease_group_event. When data_pool is enabled in
+config.yaml and the pool has a ready entity, it is leased to the category run and saved to
+the same context keys the fn_create_* functions save; otherwise the entity is created inline
+as before (lease_group_event returns None so the setup can keep its own UI flow).
+
+fn_delete_client / fn_delete_service call return_leased first: a pooled entity is handed
+back to the pool instead of being deleted. Whatever a category still holds when it ends is
+returned by the runner's janitor.
+
+fill_pool is the provisioner used by `python main.py data_pool fill`: it deletes dirty
+entities from the account and creates new ones (through the API backend in _api.py) until
+each kind reaches its target.
+"""
+
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from src.runner.data_pool import (
+    KIND_CLIENT,
+    KIND_GROUP_EVENT,
+    KIND_SERVICE,
+    OWNER_KEY,
+    DataPool,
+)
+from tests._functions._api import FixtureApi
+from tests._functions._config import load_project_config
+
+
+def _pool(context: dict) -> Optional[DataPool]:
+    """The data pool, if enabled and the runner gave this category run a lease owner."""
+    if not context.get(OWNER_KEY):
+        return None
+    pool = DataPool.from_config(load_project_config())
+    return pool if pool.enabled else None
+
+
+def lease_client(page: Any, context: dict, **params) -> None:
+    """
+    Lease a pooled client, or create one with fn_create_client (same params).
+
+    Saves to context: created_client_id, created_client_name, created_client_email
+    """
+    pool = _pool(context)
+    entity = pool.lease(KIND_CLIENT, context[OWNER_KEY]) if pool else None
+    if entity is None:
+        from tests._functions.create_client.test import fn_create_client
+
+        fn_create_client(page, context, **params)
+        return
+    context["created_client_id"] = entity["entity_id"]
+    context["created_client_name"] = entity["name"]
+    context["created_client_email"] = entity["data"].get("email")
+    print(f"  [Pool] Leased client: {entity['name']} (ID: {entity['entity_id']})")
+
+
+def lease_service(page: Any, context: dict, **params) -> None:
+    """
+    Lease a pooled 1-on-1 service, or create one with fn_create_service (same params).
+
+    Saves to context: created_service_id, created_service_name
+    """
+    pool = _pool(context)
+    entity = pool.lease(KIND_SERVICE, context[OWNER_KEY]) if pool else None
+    if entity is None:
+        from tests._functions.create_service.test import fn_create_service
+
+        fn_create_service(page, context, **params)
+        return
+    context["created_service_id"] = entity["entity_id"]
+    context["created_service_name"] = entity["name"]
+    print(f"  [Pool] Leased service: {entity['name']} (ID: {entity['entity_id']})")
+
+
+def lease_group_event(context: dict) -> Optional[str]:
+    """
+    Lease a pooled group-event service (10 attendees, face to face, $25).
+
+    Returns:
+        The service name, or None if the pool is disabled or empty (create it inline)
+    """
+    pool = _pool(context)
+    entity = pool.lease(KIND_GROUP_EVENT, context[OWNER_KEY]) if pool else None
+    if entity is None:
+        return None
+    print(f"  [Pool] Leased group event service: {entity['name']} (ID: {entity['entity_id']})")
+    return entity["name"]
+
+
+def return_leased(context: dict, kind: str, entity_id: Optional[str] = None, name: Optional[str] = None) -> bool:
+    """
+    Hand a leased entity back to the pool instead of deleting it.
+
+    Returns:
+        True if the entity was pooled (the caller must not delete it)
+    """
+    pool = _pool(context)
+    if pool is None or not (entity_id or name):
+        return False
+    kinds = [KIND_SERVICE, KIND_GROUP_EVENT] if kind == KIND_SERVICE else [kind]
+    for pool_kind in kinds:
+        entity = pool.find_leased(context[OWNER_KEY], pool_kind, entity_id=entity_id, name=name)
+        if entity is not None:
+            pool.release(entity["entity_id"])
+            print(f"  [Pool] Returned {pool_kind.replace('_', ' ')} to pool: {entity['name']}")
+            return True
+    return False
+
+
+def _client_payload(tag: str) -> Dict[str, Any]:
+    return {"first_name": "Pool", "last_name": f"Client{tag}", "email": f"pool_{tag}@vcita-test.com"}
+
+
+def _service_payload(tag: str) -> Dict[str, Any]:
+    return {"name": f"Pool Service {tag}", "duration": 60, "price": 0,
+            "service_type": "appointment", "location_type": "face_to_face"}
+
+
+def _group_event_payload(tag: str) -> Dict[str, Any]:
+    # Same settings as scheduling/events/_setup creates through the UI
+    return {"name": f"Pool Workshop {tag}", "duration": 60, "price": 25, "max_attendees": 10,
+            "service_type": "event", "location_type": "face_to_face"}
+
+
+# kind -> (create operation, delete operation, payload factory)
+_PROVISIONERS = {
+    KIND_CLIENT: ("create_client", "delete_client", _client_payload),
+    KIND_SERVICE: ("create_service", "delete_service", _service_payload),
+    KIND_GROUP_EVENT: ("create_service", "delete_service", _group_event_payload),
+}
+
+
+def fill_pool(request: Any, pool: DataPool, base_url: str, log: Callable[[str], None] = print) -> Dict[str, int]:
+    """
+    Recycle dirty entities and top the pool up to its targets.
+
+    Args:
+        request: APIRequestContext logged in to the test account (or a page)
+        pool: The data pool
+        base_url: Target base URL
+        log: Progress output
+
+    Returns:
+        {"reclaimed", "deleted", "created", "failed"} counts
+    """
+    api = FixtureApi(request, {"base_url": base_url})
+    stats = {"reclaimed": pool.reclaim_expired(), "deleted": 0, "created": 0, "failed": 0}
+
+    for entity in pool.dirty():
+        _, delete_operation, _ = _PROVISIONERS.get(entity["kind"], (None, None, None))
+        if delete_operation is None:
+            continue
+        try:
+            api.call(delete_operation, entity_id=entity["entity_id"])
+        except Exception as e:
+            # Already gone (e.g. deleted by a test) is fine; anything else is retried next fill
+            if " 404 " not in str(e):
+                log(f"  [Pool] Could not delete {entity['kind']} {entity['name']}: {e}")
+                stats["failed"] += 1
+                continue
+        pool.remove(entity["entity_id"])
+        stats["deleted"] += 1
+
+    for kind, missing in pool.shortfall().items():
+        create_operation, _, payload = _PROVISIONERS[kind]
+        for _ in range(missing):
+            data = payload(uuid.uuid4().hex[:10])
+            try:
+                entity_id = api.create(create_operation, data)
+            except Exception as e:
+                log(f"  [Pool] Could not create {kind}: {e}")
+                stats["failed"] += 1
+                break
+            name = data.get("name") or f"{data['first_name']} {data['last_name']}"
+            pool.add(kind, entity_id, name, data)
+            stats["created"] += 1
+    return stats
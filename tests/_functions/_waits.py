@@ -0,0 +1,190 @@
+"""
+Condition-based waits for tests. Use these instead of page.wait_for_timeout() "settle" delays:
+each returns as soon as the UI is ready, and fails with a clear message when it never gets there.
+
+- wait_for_dom_quiet: no DOM mutations for quiet_ms (list finished rendering, dialog animated in)
+- wait_for_element_stable: element's box unchanged for stable_ms (scroll/slide animation done)
+- wait_for_spinner_gone: no visible loading indicator
+- wait_for_iframe_ready: iframe attached, loaded and rendered; returns its FrameLocator
+- settle: spinner gone + DOM quiet (drop-in for "Brief settle" waits)
+
+Targets can be a Page, Frame, FrameLocator (e.g. page.frame_locator('iframe[title="angularjs"]'))
+or Locator (scopes the check to that element's subtree).
+"""
+
+from typing import Any, Optional
+
+from playwright.sync_api import Page
+
+# Loading indicators used across vcita pages and the angularjs iframe
+DEFAULT_SPINNER_SELECTOR = (
+    '[role="progressbar"], md-progress-circular, md-progress-linear, mat-spinner, '
+    '.spinner, .loader, .loading, [class*="spinner"]'
+)
+
+_DOM_QUIET_JS = """
+(root, [quietMs, timeoutMs]) => new Promise((resolve, reject) => {
+    let quietTimer = null;
+    const done = (ok) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(limit);
+        ok ? resolve(true) : reject(new Error(`DOM still changing after ${timeoutMs}ms`));
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => done(true), quietMs);
+    });
+    observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(() => done(true), quietMs);
+    const limit = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+_ELEMENT_STABLE_JS = """
+(element, [stableMs, timeoutMs]) => new Promise((resolve, reject) => {
+    const start = performance.now();
+    let last = null;
+    let stableSince = start;
+    const tick = () => {
+        const r = element.getBoundingClientRect();
+        const box = `${r.x},${r.y},${r.width},${r.height}`;
+        const now = performance.now();
+        if (box !== last) {
+            last = box;
+            stableSince = now;
+        } else if (now - stableSince >= stableMs) {
+            return resolve(true);
+        }
+        if (now - start > timeoutMs) {
+            return reject(new Error(`Element still moving after ${timeoutMs}ms`));
+        }
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+})
+"""
+
+_SPINNER_GONE_JS = """
+(root, [selector, timeoutMs]) => new Promise((resolve, reject) => {
+    const start = performance.now();
+    const visible = (el) => {
+        const style = getComputedStyle(el);
+        const r = el.getBoundingClientRect();
+        return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0'
+            && r.width > 0 && r.height > 0;
+    };
+    const check = () => {
+        if (![...root.querySelectorAll(selector)].some(visible)) {
+            return resolve(true);
+        }
+        if (performance.now() - start > timeoutMs) {
+            return reject(new Error(`Loading indicator still visible after ${timeoutMs}ms`));
+        }
+        setTimeout(check, 100);
+    };
+    check();
+})
+"""
+
+
+def _evaluate(target: Any, script: str, arg: Any) -> Any:
+    """Run script(root, arg) with root = the Locator's element, or the document element of a Page/Frame/FrameLocator."""
+    if not hasattr(target, "evaluate"):
+        # FrameLocator: run against the frame's root element
+        target = target.locator(":root")
+    if hasattr(target, "element_handle"):
+        return target.evaluate(script, arg)
+    return target.evaluate(f"(arg) => ({script})(document.documentElement, arg)", arg)
+
+
+def wait_for_dom_quiet(target: Any, quiet_ms: int = 300, timeout: int = 10000) -> None:
+    """
+    Wait until the DOM has not changed for quiet_ms.
+
+    Args:
+        target: Page, Frame, FrameLocator or Locator (subtree to watch)
+        quiet_ms: How long the DOM must stay unchanged
+        timeout: Maximum wait in ms
+
+    Raises:
+        playwright Error: If the DOM keeps changing for timeout ms
+    """
+    _evaluate(target, _DOM_QUIET_JS, [quiet_ms, timeout])
+
+
+def wait_for_element_stable(locator: Any, stable_ms: int = 150, timeout: int = 10000) -> None:
+    """
+    Wait until an element is visible and its position and size stopped changing.
+
+    Use after scrolling or opening an animated panel, before clicking inside it.
+
+    Args:
+        locator: Element to watch
+        stable_ms: How long the bounding box must stay the same
+        timeout: Maximum wait in ms
+    """
+    locator.wait_for(state="visible", timeout=timeout)
+    locator.evaluate(_ELEMENT_STABLE_JS, [stable_ms, timeout])
+
+
+def wait_for_spinner_gone(
+    target: Any,
+    selector: str = DEFAULT_SPINNER_SELECTOR,
+    timeout: int = 30000,
+) -> None:
+    """
+    Wait until no loading indicator matching selector is visible.
+
+    Args:
+        target: Page, Frame, FrameLocator or Locator to check
+        selector: CSS selector of the loading indicators
+        timeout: Maximum wait in ms
+    """
+    _evaluate(target, _SPINNER_GONE_JS, [selector, timeout])
+
+
+def wait_for_iframe_ready(
+    page: Page,
+    selector: str = 'iframe[title="angularjs"]',
+    ready_locator: Optional[str] = None,
+    timeout: int = 30000,
+) -> Any:
+    """
+    Wait until an iframe is attached, has loaded its document and finished rendering.
+
+    Args:
+        page: Page containing the iframe
+        selector: CSS selector of the iframe
+        ready_locator: Optional selector inside the iframe that must be visible (e.g. 'text=My Services')
+        timeout: Maximum wait in ms
+
+    Returns:
+        FrameLocator of the iframe
+    """
+    handle = page.wait_for_selector(selector, state="attached", timeout=timeout)
+    frame = handle.content_frame() if handle else None
+    if frame is not None:
+        frame.wait_for_load_state("domcontentloaded", timeout=timeout)
+    frame_locator = page.frame_locator(selector)
+    if ready_locator:
+        frame_locator.locator(ready_locator).first.wait_for(state="visible", timeout=timeout)
+    wait_for_spinner_gone(frame_locator, timeout=timeout)
+    wait_for_dom_quiet(frame_locator, timeout=timeout)
+    return frame_locator
+
+
+def settle(target: Any, quiet_ms: int = 300, timeout: int = 10000) -> None:
+    """
+    Wait until no loading indicator is visible and the DOM is quiet.
+
+    Replaces page.wait_for_timeout(300/500/1000) after an action: it returns as soon as the
+    UI stops changing instead of always waiting the full delay.
+
+    Args:
+        target: Page, Frame, FrameLocator or Locator
+        quiet_ms: How long the DOM must stay unchanged
+        timeout: Maximum wait in ms
+    """
+    wait_for_spinner_gone(target, timeout=timeout)
+    wait_for_dom_quiet(target, quiet_ms=quiet_ms, timeout=timeout)
@@ -8,6 +8,7 @@ import re
 import time
 from playwright.sync_api import Page, expect
 
+from tests._functions._api import api_create_client, use_api_backend
 from tests._functions._config import get_base_url
 from tests._params import ADD_MATTER_TEXT_REGEX
 
@@ -20,6 +21,7 @@ def fn_create_client(page: Page, context: dict, **params) -> None:
     Note: "Matter" is vcita's general entity - called "Property" for Home Services vertical.
     
     Parameters:
+    - backend (optional): "ui" or "api" (defaults to context fixture_backend, then config.yaml fixtures.backend)
     - first_name (optional): First name of the client (defaults to "Test")
     - last_name (optional): Last name (defaults to "Client{timestamp}")
     - email (optional): Email address (defaults to generated test email)
@@ -29,6 +31,11 @@ def fn_create_client(page: Page, context: dict, **params) -> None:
     - created_client_name: Full name of the client
     - created_client_email: Email of the client
     """
+    # API backend (config.yaml fixtures.backend / params backend="api"): same context keys, no UI
+    if use_api_backend(context, params):
+        api_create_client(page, context, **params)
+        return
+
     timestamp = int(time.time())
     first_name = params.get("first_name", "Test")
     last_name = params.get("last_name", f"Client{timestamp}")
@@ -7,6 +7,8 @@ import re
 import time
 from playwright.sync_api import Page, expect
 
+from tests._functions._api import api_create_service, use_api_backend
+
 def fn_create_service(page: Page, context: dict, **params) -> None:
     """
     Create a minimal 1-on-1 service for test setup purposes.
@@ -14,12 +16,18 @@ def fn_create_service(page: Page, context: dict, **params) -> None:
     Creates a free service with Face to Face location and default 1 hour duration.
     
     Parameters:
+    - backend (optional): "ui" or "api" (defaults to context fixture_backend, then config.yaml fixtures.backend)
     - name (required): Name of the service to create (should include timestamp for uniqueness)
     
     Saves to context:
     - created_service_id: ID of the created service
     - created_service_name: Name of the service
     """
+    # API backend (config.yaml fixtures.backend / params backend="api"): same context keys, no UI
+    if use_api_backend(context, params):
+        api_create_service(page, context, **params)
+        return
+
     name = params.get("name")
     if not name:
         timestamp = int(time.time())
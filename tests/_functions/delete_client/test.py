@@ -8,6 +8,9 @@ from typing import Callable, Optional
 
 from playwright.sync_api import Page, expect
 
+from tests._functions._api import api_delete_client, use_api_backend
+from tests._functions._pool import KIND_CLIENT, return_leased
+
 def _check_for_error_page(page: Page) -> tuple[bool, str]:
     """
     Check if the page has navigated to an error page.
@@ -44,6 +47,7 @@ def fn_delete_client(
     Used for test teardown to clean up test data.
     
     Parameters:
+    - backend (optional): "ui" or "api" (defaults to context fixture_backend, then config.yaml fixtures.backend)
     - name (optional): Name of the client to delete (defaults to context value)
     - id (optional): ID of the client to delete (defaults to context value)
     - step_callback (optional): If set, called with a short message before each minor action (for debugging).
@@ -53,6 +57,22 @@ def fn_delete_client(
     - created_client_name
     - created_client_email
     """
+    # Data pool: a leased entity goes back to the pool instead of being deleted
+    if return_leased(
+        context,
+        KIND_CLIENT,
+        entity_id=params.get("id") or context.get("created_client_id"),
+        name=params.get("name") or context.get("created_client_name"),
+    ):
+        for key in ("created_client_id", "created_client_name", "created_client_email"):
+            context.pop(key, None)
+        return
+
+    # API backend (config.yaml fixtures.backend / params backend="api"): same context keys, no UI
+    if use_api_backend(context, params):
+        api_delete_client(page, context, **params)
+        return
+
     name = params.get("name")
     client_id = params.get("id")
     
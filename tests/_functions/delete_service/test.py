@@ -8,6 +8,9 @@ from typing import Callable, Optional
 
 from playwright.sync_api import Page, expect
 
+from tests._functions._api import api_delete_service, use_api_backend
+from tests._functions._pool import KIND_SERVICE, return_leased
+
 
 def fn_delete_service(
     page: Page, context: dict, step_callback: Optional[Callable[[str], None]] = None, **params
@@ -18,6 +21,7 @@ def fn_delete_service(
     Used for test teardown to clean up test data.
     
     Parameters:
+    - backend (optional): "ui" or "api" (defaults to context fixture_backend, then config.yaml fixtures.backend)
     - name (required): Name of the service to delete
     - step_callback (optional): If set, called with a short message before each minor action (for debugging).
     
@@ -25,6 +29,17 @@ def fn_delete_service(
     - created_service_id
     - created_service_name
     """
+    # Data pool: a leased entity goes back to the pool instead of being deleted
+    if return_leased(context, KIND_SERVICE, name=params.get("name") or context.get("created_service_name")):
+        for key in ("created_service_id", "created_service_name"):
+            context.pop(key, None)
+        return
+
+    # API backend (config.yaml fixtures.backend / params backend="api"): same context keys, no UI
+    if use_api_backend(context, params):
+        api_delete_service(page, context, **params)
+        return
+
     name = params.get("name")
     if not name:
         # Try to get from context
@@ -9,7 +9,7 @@ import time
 from playwright.sync_api import Page, expect
 
 from tests._functions.login.test import fn_login
-from tests._functions.create_client.test import fn_create_client
+from tests._functions._pool import lease_client, lease_group_event
 
 
 def _scroll_services_list_to_end(page: Page) -> None:
@@ -81,46 +81,12 @@ def _scroll_services_list_to_end(page: Page) -> None:
         page.wait_for_timeout(300)  # Brief settle after scroll (allowed)
 
 
-def setup_events(page: Page, context: dict) -> None:
+def _create_group_event_ui(page: Page, iframe, group_event_name: str) -> None:
     """
-    Setup for events tests.
-
-    Assumes parent (Scheduling) setup has already run and left the browser on
-    Settings > Services. This setup only creates the group event service and
-    test client, then navigates to Calendar.
-
-    Performs login if needed, then creates:
-    - A group event service for scheduling event instances
-    - A test client to add as an attendee
+    Create the group event service on Settings > Services (Steps 1-8) and confirm it is listed.
 
-    Then navigates to the Calendar page.
-
-    Saves to context:
-    - event_group_service_name: Name of the group event service
-    - event_client_id: ID of the test client
-    - event_client_name: Full name of the test client
-    - event_client_email: Email of the test client
+    Expects the browser on Settings > Services; iframe is the angularjs frame locator.
     """
-    timestamp = int(time.time())
-
-    # Step 0: Login if not already logged in
-    if "logged_in_user" not in context:
-        print("  Setup Step 0: Logging in...")
-        username = context.get("username")
-        password = context.get("password")
-        if not username or not password:
-            raise ValueError(
-                "username and password not in context. Set target.auth.username and target.auth.password in config.yaml."
-            )
-        fn_login(page, context, username=username, password=password)
-
-    # Parent (Scheduling) setup leaves us on Settings > Services; ensure iframe is ready
-    page.wait_for_selector('iframe[title="angularjs"]', timeout=10000)
-    iframe = page.frame_locator('iframe[title="angularjs"]')
-
-    # Generate unique group event name
-    group_event_name = f"Event Test Workshop {timestamp}"
-
     # Step 1: Open New Service Dropdown
     print("  Setup Step 1: Opening New service menu...")
     new_service_btn = iframe.get_by_role("button", name="New service icon-caret-down")
@@ -214,6 +180,51 @@ def setup_events(page: Page, context: dict) -> None:
             "Create dialog closed but service may not have been saved. Check run video/screenshot."
         ) from e
 
+
+def setup_events(page: Page, context: dict) -> None:
+    """
+    Setup for events tests.
+
+    Assumes parent (Scheduling) setup has already run and left the browser on
+    Settings > Services. This setup only creates the group event service and
+    test client, then navigates to Calendar.
+
+    Performs login if needed, then creates (or leases from the data pool, see
+    tests/_functions/_pool.py):
+    - A group event service for scheduling event instances
+    - A test client to add as an attendee
+
+    Then navigates to the Calendar page.
+
+    Saves to context:
+    - event_group_service_name: Name of the group event service
+    - event_client_id: ID of the test client
+    - event_client_name: Full name of the test client
+    - event_client_email: Email of the test client
+    """
+    timestamp = int(time.time())
+
+    # Step 0: Login if not already logged in
+    if "logged_in_user" not in context:
+        print("  Setup Step 0: Logging in...")
+        username = context.get("username")
+        password = context.get("password")
+        if not username or not password:
+            raise ValueError(
+                "username and password not in context. Set target.auth.username and target.auth.password in config.yaml."
+            )
+        fn_login(page, context, username=username, password=password)
+
+    # Parent (Scheduling) setup leaves us on Settings > Services; ensure iframe is ready
+    page.wait_for_selector('iframe[title="angularjs"]', timeout=10000)
+    iframe = page.frame_locator('iframe[title="angularjs"]')
+
+    # Group event service: lease a pooled one (data_pool enabled) or create it through the UI
+    group_event_name = lease_group_event(context)
+    if not group_event_name:
+        group_event_name = f"Event Test Workshop {timestamp}"
+        _create_group_event_ui(page, iframe, group_event_name)
+
     # Step 9: Save Group Event Service Name
     print("  Setup Step 9: Saving group event service name...")
     context["event_group_service_name"] = group_event_name
@@ -221,9 +232,9 @@ def setup_events(page: Page, context: dict) -> None:
     
     # Step 10: Create Test Client
     print("  Setup Step 10: Creating test client...")
-    fn_create_client(
-        page, 
-        context, 
+    lease_client(
+        page,
+        context,
         first_name="Event",
         last_name=f"TestClient{timestamp}"
     )